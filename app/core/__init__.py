@@ -1,5 +1,3 @@
-from .event.event import Event
-
-Events = list[Event | None]
+from .event.event import Event, Events
 
 __all__ = ["Event", "Events"]
@@ -7,7 +7,10 @@ Actions are non-blocking, they are updated per tick/frame until they are finishe
 In a word, an action is a stateful handler that processes player inputs over time and generates game events accordingly.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from copy import copy
 from dataclasses import dataclass
 from app.core.base import Faction
 
@@ -66,6 +69,14 @@ class Action(ABC):
     def receive(self, operation: Operation):
         self.input_data_buffer.append(operation)
 
+    def fork(self) -> Action:
+        """
+        Clone the action for a forked game, with its own input buffer.
+        """
+        clone = copy(self)
+        clone.input_data_buffer = self.input_data_buffer.copy()
+        return clone
+
     def update(self, dt: float, game: Game) -> Events | None:
         """
         Called once per frame/tick by the ActionManager.
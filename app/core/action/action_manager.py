@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from app.core.action.action import Action, Operation
 
 from typing import TYPE_CHECKING
@@ -11,6 +13,12 @@ class ActionManager:
         self.pending_actions: list[Action] = []
         self.paused: bool = False
 
+    def fork(self) -> ActionManager:
+        clone = ActionManager()
+        clone.pending_actions = [action.fork() for action in self.pending_actions]
+        clone.paused = self.paused
+        return clone
+
     @property
     def current_action(self) -> Action | None:
         return self.pending_actions[-1] if self.pending_actions else None
@@ -52,7 +60,7 @@ class ActionManager:
     def _handle_end_phase(self, operation: Operation, game: Game):
         # Check endable
         faction = operation.faction
-        if not game.item_manager.end_phase_button.activated[faction]:
+        if not game.item_manager.end_phase_button.is_activated(faction):
             return  # Not endable
 
         self.pending_actions.clear()
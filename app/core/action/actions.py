@@ -1,15 +1,17 @@
+from __future__ import annotations
+
 from app.core.action.action import Action, Operation
 
 from typing import TYPE_CHECKING
 
 from app.core.base import Faction
+from app.core.event.events import PlayCardEvent
 from app.core.engine.game import Game
+from app.core.identity import parse_id
 
 if TYPE_CHECKING:
     from app.core.engine.game import Game
-    from app.core.item.card import Card
-    from app.core.item.position import Pos
-    from app.core.item.target import Fighter
+    from app.core.event.event import Events
 
 
 class PlayCardAction(Action):
@@ -21,37 +23,18 @@ class PlayCardAction(Action):
         try:
             if operation.operation_name != "play_card":
                 return False
-            card_id = operation.data["card_id"]
-            card = game.item_manager.get_by_id(card_id)  # type: ignore
-            if card is None or card.type != "Card":
-                return False
-
-            card: Card
-            if card.faction != self.faction or not card.activated[self.faction]:
-                return False
-
-            pos_id = operation.data["pos_id"]
-            pos = game.item_manager.get_by_id(pos_id)  # type: ignore
-            if pos is None or pos.type != "Pos":
-                return False
+            card_id = parse_id(operation.data["card_id"])
+            pos_id = parse_id(operation.data["pos_id"])
+            return game.legal_moves.is_legal(self.faction, card_id, pos_id)
 
-            pos: Pos
-            if pos.faction != self.faction:
-                return False
+        except (KeyError, TypeError, ValueError):
+            return False
 
-            if pos.occupied:
-                if self.faction == Faction.ZOMBIE:
-                    return False
-                slpos = game.item_manager.same_lane_pos(pos)
-                if slpos is None or slpos.occupied:
-                    return False
-                stacker: Fighter = game.item_manager.get_by_id(pos.occupier_id)  # type: ignore
-                if "team_up" in card.abilities or "team_up" in stacker.abilities:
-                    return True
+    def parse(self, operation: Operation, game: Game) -> Events:
+        card_id = parse_id(operation.data["card_id"])
+        pos_id = parse_id(operation.data["pos_id"])
+        return [PlayCardEvent(card_id, pos_id)]
 
-                return False
-            else:
-                return True
-
-        except (KeyError, TypeError):
-            return False
+    def default_events(self, game: Game) -> Events:
+        # Running out of time plays nothing
+        return []
@@ -0,0 +1,116 @@
+"""
+Legal move generation: every (card, pos) pair a faction can play right now.
+
+The rules are those of PlayCardAction: an activated card of the faction's hand
+goes on a vacant pos of its side, or, for plants, stacks on an occupied pos
+whose partner pos in the lane is free, provided the card or the occupier can
+team up. Activation already reflects the phase and the energy left, the phase
+and play events keep it up to date, so the hand index is read as it is.
+
+Drop targets depend on occupancy only. They are cached per faction and
+rebuilt, in board order, the first time they are asked for after one of the
+faction's poses was occupied or vacated.
+"""
+
+from __future__ import annotations
+
+from app.core.base import Faction
+from app.core.item.item_manager import HAND_RANGES, POS_RANGES
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterator, List, Tuple
+    from app.core.item.card import Card
+    from app.core.item.item_manager import ItemManager
+    from app.core.item.position import Pos
+
+
+class LegalMoves:
+    def __init__(self, item_manager: ItemManager):
+        self.item_manager = item_manager
+        # Vacant poses of each faction, in board order
+        self._vacant: Dict[Faction, List[Pos]] = {}
+        # Vacant poses and the occupied ones a fighter could stack on, in board
+        # order, with the occupier's id (None when vacant)
+        self._drops: Dict[Faction, List[Tuple[Pos, int | None]]] = {}
+        self._dirty = {Faction.ZOMBIE: True, Faction.PLANT: True}
+
+    def on_pos_changed(self, pos: Pos):
+        self._dirty[pos.faction] = True
+
+    def _refresh(self, faction: Faction):
+        item_manager = self.item_manager
+        poses = item_manager[POS_RANGES[faction]]
+        vacant = []
+        drops = []
+        for pos in poses:
+            if pos.occupier_id is None:
+                vacant.append(pos)
+                drops.append((pos, None))
+            elif self._stackable(pos):
+                drops.append((pos, pos.occupier_id))
+        self._vacant[faction] = vacant
+        self._drops[faction] = drops
+        # Poses are tracked when the board is set up, not before
+        if len(poses):
+            self._dirty[faction] = False
+
+    def _stackable(self, pos: Pos) -> bool:
+        if pos.faction != Faction.PLANT:
+            return False
+        partner = self.item_manager.same_lane_pos(pos)
+        return partner is not None and not partner.occupied
+
+    def _can_team_up(self, card: Card, occupier_id: int) -> bool:
+        if "team_up" in card.abilities:
+            return True
+        occupier = self.item_manager.get_by_id(occupier_id)
+        return occupier is not None and "team_up" in occupier.abilities  # type: ignore
+
+    def targets(self, card: Card) -> List[Pos]:
+        """
+        Poses a card of the hand can be played on, whether it is playable or not.
+        """
+        faction = card.faction
+        if self._dirty[faction]:
+            self._refresh(faction)
+        drops = self._drops[faction]
+        if len(drops) == len(self._vacant[faction]):
+            return self._vacant[faction]
+        return [
+            pos
+            for pos, occupier_id in drops
+            if occupier_id is None or self._can_team_up(card, occupier_id)
+        ]
+
+    def playable(self, faction: Faction) -> Iterator[Card]:
+        for card in self.item_manager[HAND_RANGES[faction]]:
+            if card.faction == faction and card.is_activated(faction):
+                yield card
+
+    def moves(self, faction: Faction) -> List[Tuple[Card, Pos]]:
+        """
+        Every legal play of a faction, card by card in hand order.
+        """
+        return [
+            (card, pos) for card in self.playable(faction) for pos in self.targets(card)
+        ]
+
+    def is_legal(self, faction: Faction, card_id: int, pos_id: int) -> bool:
+        """
+        Check a single play without enumerating the others.
+        """
+        item_manager = self.item_manager
+        if item_manager.zone_of(card_id) != HAND_RANGES[faction]:
+            return False
+        card: Card = item_manager.get_by_id(card_id)  # type: ignore
+        if card.faction != faction or not card.is_activated(faction):
+            return False
+        pos = item_manager.get_by_id(pos_id)
+        if pos is None or pos.type != "Pos" or pos.faction != faction:  # type: ignore
+            return False
+        pos: Pos
+        if pos.occupier_id is None:
+            return True
+        return self._stackable(pos) and self._can_team_up(card, pos.occupier_id)
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any, Callable
 
 
 class CardClass(Enum):
@@ -43,26 +44,95 @@ class Faction(Enum):
                 return 0
 
 
-@dataclass
+class AbilityFlag:
+    """
+    A boolean ability, stored as one bit of `Ability.flags`.
+    """
+
+    __slots__ = ("bit",)
+
+    def __init__(self, index: int):
+        self.bit = 1 << index
+
+    def __get__(self, ability: "Ability | None", owner=None):
+        if ability is None:
+            return self
+        return bool(ability.flags & self.bit)
+
+    def __set__(self, ability: "Ability", value: bool):
+        if value:
+            ability.flags |= self.bit
+        else:
+            ability.flags &= ~self.bit
+
+
 class Ability:
-    BULLSEYE: bool = False
-    TEAM_UP: bool = False
-    AMPHIBIOUS: bool = False
-    HUNT: bool = False
-    HEALTH_ATTACK: bool = False
-    UNTRICKABLE: bool = False
-    DOUBLE_STRIKE: bool = False
-    STRIKETHROUGH: bool = False
-    UNHURTABLE: bool = False
-    FRENZY: bool = False
-    DEADLY: bool = False
-    TOMB: bool = False
-    FUSIONABLE: bool = False
-
-    ARMOURED: int = 0
-    ANTI_HERO: int = 0
-    SPLASH_DAMAGE: int = 0
-    OVERSHOOT: int = 0
+    # Boolean abilities share one int, levelled ones are small ints
+    __slots__ = ("flags", "ARMOURED", "ANTI_HERO", "SPLASH_DAMAGE", "OVERSHOOT")
+
+    BULLSEYE = AbilityFlag(0)
+    TEAM_UP = AbilityFlag(1)
+    AMPHIBIOUS = AbilityFlag(2)
+    HUNT = AbilityFlag(3)
+    HEALTH_ATTACK = AbilityFlag(4)
+    UNTRICKABLE = AbilityFlag(5)
+    DOUBLE_STRIKE = AbilityFlag(6)
+    STRIKETHROUGH = AbilityFlag(7)
+    UNHURTABLE = AbilityFlag(8)
+    FRENZY = AbilityFlag(9)
+    DEADLY = AbilityFlag(10)
+    TOMB = AbilityFlag(11)
+    FUSIONABLE = AbilityFlag(12)
+
+    def __init__(self, flags: int = 0, **abilities: bool | int):
+        """
+        :param flags: Packed boolean abilities, see ABILITY_BITS.
+        :param abilities: Abilities by name, e.g. `Ability(DEADLY=True, ARMOURED=1)`.
+        """
+        self.flags = flags
+        self.ARMOURED = 0
+        self.ANTI_HERO = 0
+        self.SPLASH_DAMAGE = 0
+        self.OVERSHOOT = 0
+        for name, value in abilities.items():
+            if name not in ABILITY_NAMES:
+                raise TypeError(f"Unknown ability {name!r}.")
+            setattr(self, name, value)
+
+    def packed(self) -> tuple[int, int, int, int, int]:
+        return (
+            self.flags,
+            self.ARMOURED,
+            self.ANTI_HERO,
+            self.SPLASH_DAMAGE,
+            self.OVERSHOOT,
+        )
+
+    def copy(self) -> "Ability":
+        clone = Ability.__new__(Ability)
+        (
+            clone.flags,
+            clone.ARMOURED,
+            clone.ANTI_HERO,
+            clone.SPLASH_DAMAGE,
+            clone.OVERSHOOT,
+        ) = self.packed()
+        return clone
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Ability):
+            return NotImplemented
+        return self.packed() == other.packed()
+
+    __hash__ = None  # type: ignore  # mutable, like the other state dataclasses
+
+    def __repr__(self) -> str:
+        present = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in ABILITY_NAMES
+            if getattr(self, name)
+        )
+        return f"Ability({present})"
 
     def special_strength(self) -> str | None:
         attack_keys = [
@@ -107,6 +177,15 @@ class Ability:
                 return "Complex"
 
 
+ABILITY_BITS: dict[str, int] = {
+    name: attr.bit
+    for name, attr in vars(Ability).items()
+    if isinstance(attr, AbilityFlag)
+}
+ABILITY_LEVELS: tuple[str, ...] = Ability.__slots__[1:]
+ABILITY_NAMES: tuple[str, ...] = (*ABILITY_BITS, *ABILITY_LEVELS)
+
+
 class Label(Enum):
     ZOMBIE = "ZOMBIE"
     PLANT = "PLANT"
@@ -213,7 +292,7 @@ class CardConfig:
     health: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FighterState:
     INITIAL_COST: int
     INITIAL_STRENGTH: int
@@ -242,7 +321,29 @@ class FighterState:
     FROZEN: bool = False
     DOOMED: bool = False
 
-    ABILITIES: Ability = Ability()
+    ABILITIES: Ability = field(default_factory=Ability)
+
+    # The owning fighter watches writes to keep the game's state hash current
+    _watcher: Callable[[str, Any, Any], None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value):
+        watcher = getattr(self, "_watcher", None)
+        if watcher is not None:
+            watcher(name, getattr(self, name), value)
+        object.__setattr__(self, name, value)
+
+    def copy(self) -> "FighterState":
+        """
+        An independent copy, abilities included, that nobody watches yet.
+        """
+        clone = object.__new__(type(self))
+        for name in self.__slots__:
+            object.__setattr__(clone, name, getattr(self, name))
+        object.__setattr__(clone, "ABILITIES", self.ABILITIES.copy())
+        object.__setattr__(clone, "_watcher", None)
+        return clone
 
 
 @dataclass
@@ -0,0 +1,179 @@
+"""
+Batched combat resolution over many independent boards at once.
+
+Combat resolves one game through events, which is what listeners and the UI
+need but far too slow for balance roll-outs. CombatBatch holds N boards as
+arrays shaped (games, lanes, slots, faction), laid out like BoardArrays, and
+resolves a whole combat phase for all of them with a handful of array
+operations. It follows the same rules as Combat and AttackEvent:
+
+- every fighter picks its targets before anyone is hurt, lanes don't interact;
+- a fighter hits the frontier of the opposing lane, or the hero when it is empty;
+- STRIKETHROUGH hits every opposing fighter in the lane and the hero;
+- DOUBLE_STRIKE repeats each hit, ARMOURED is subtracted from every hit;
+- DEADLY destroys any fighter it damages.
+
+Listeners and abilities other than these keywords are not simulated, so use
+`cross_check` to confirm that a set of boards behaves the same on both paths.
+Nor is the end of the game: through events, combat stops as soon as a hero
+falls, while the batch always resolves the whole phase.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.core.base import ABILITY_BITS, Faction
+from app.core.engine.combat import Combat
+from app.core.item.board_arrays import FACTION_INDEX, BoardArrays
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List, Sequence
+    from app.core.engine.game import Game
+
+_HERO_RANGES = {Faction.ZOMBIE: "z_hero", Faction.PLANT: "p_hero"}
+
+
+class CombatBatch:
+    def __init__(self, games: int, num_lanes: int = 5, slots: int = 2):
+        """
+        Set up a batch of empty boards.
+
+        :param games: Number of independent boards.
+        :param num_lanes: Lanes per board.
+        :param slots: Positions per lane and faction, as in BoardArrays.
+        """
+        shape = (games, num_lanes, slots, 2)
+        self.games = games
+        self.num_lanes = num_lanes
+        self.slots = slots
+
+        self.alive = np.zeros(shape, dtype=bool)
+        self.strength = np.zeros(shape, dtype=np.int32)
+        self.health = np.zeros(shape, dtype=np.int32)
+        self.armour = np.zeros(shape, dtype=np.int32)
+        self.abilities = np.zeros(shape, dtype=np.uint32)
+
+        # Hero health per faction, heroes that are absent are never hit
+        self.hero_health = np.zeros((games, 2), dtype=np.int32)
+        self.has_hero = np.zeros((games, 2), dtype=bool)
+
+    @classmethod
+    def from_games(cls, games: Sequence[Game]) -> CombatBatch:
+        """
+        Snapshot the current boards of several games.
+        """
+        batch = cls(len(games))
+        for i, game in enumerate(games):
+            batch.load(i, game)
+        return batch
+
+    def load(self, index: int, game: Game):
+        """
+        Copy one game's board into slot `index` of the batch.
+        """
+        item_manager = game.item_manager
+        arrays = BoardArrays(num_lanes=self.num_lanes, slots=self.slots)
+        arrays.resync(item_manager)
+
+        self.alive[index] = arrays.occupied
+        self.strength[index] = arrays.strength
+        self.health[index] = arrays.health
+        self.armour[index] = arrays.armour
+        self.abilities[index] = arrays.abilities
+
+        for faction, hero_range in _HERO_RANGES.items():
+            hero = item_manager[hero_range].first()
+            f = FACTION_INDEX[faction]
+            self.has_hero[index, f] = hero is not None
+            self.hero_health[index, f] = getattr(hero, "health", 0)
+
+    def copy(self) -> CombatBatch:
+        batch = CombatBatch.__new__(CombatBatch)
+        batch.__dict__.update(
+            {
+                key: value.copy() if isinstance(value, np.ndarray) else value
+                for key, value in self.__dict__.items()
+            }
+        )
+        return batch
+
+    def _flag(self, name: str) -> np.ndarray:
+        return (self.abilities & ABILITY_BITS[name]) != 0
+
+    def resolve(self):
+        """
+        Resolve one combat phase on every board, in place.
+        """
+        alive = self.alive
+        strength = np.where(alive, np.maximum(self.strength, 0), 0)
+        strikes = np.where(self._flag("DOUBLE_STRIKE"), 2, 1)
+        through = self._flag("STRIKETHROUGH")
+        deadly = self._flag("DEADLY")
+
+        damage = np.zeros_like(self.health)
+        killed = np.zeros_like(alive)
+        hero_damage = np.zeros_like(self.hero_health)
+        slot_index = np.arange(self.slots)
+
+        for f in (0, 1):
+            o = 1 - f
+            defenders = alive[..., o]
+            has_front = defenders.any(axis=2)
+            front = defenders.argmax(axis=2)
+            front_mask = (slot_index == front[..., None]) & has_front[..., None]
+            armour = self.armour[..., o]
+
+            for s in range(self.slots):
+                attacking = alive[:, :, s, f]
+                power = strength[:, :, s, f]
+                repeat = strikes[:, :, s, f]
+                hits_through = through[:, :, s, f]
+
+                targets = np.where(hits_through[..., None], defenders, front_mask)
+                targets &= attacking[..., None]
+                per_hit = np.maximum(power[..., None] - armour, 0)
+                damage[..., o] += np.where(targets, per_hit * repeat[..., None], 0)
+                lethal = deadly[:, :, s, f][..., None]
+                killed[..., o] |= targets & (per_hit > 0) & lethal
+
+                hero_hit = attacking & (hits_through | ~has_front)
+                hero_damage[:, o] += (power * repeat * hero_hit).sum(axis=1)
+
+        self.health -= damage
+        destroyed = alive & (killed | ((damage > 0) & (self.health <= 0)))
+        self.alive &= ~destroyed
+        self.hero_health -= np.where(self.has_hero, hero_damage, 0)
+
+
+def cross_check(games: Sequence[Game]) -> List[str]:
+    """
+    Resolve combat for the games through Combat and through a CombatBatch,
+    and describe every difference. The games are left after their combat.
+    Games that end during combat stop halfway through events, they are left
+    out of the comparison.
+    """
+    batch = CombatBatch.from_games(games)
+    batch.resolve()
+
+    mismatches: List[str] = []
+    for i, game in enumerate(games):
+        Combat(game).resolve()
+        game.event_manager.notify(game)
+        if not game.is_running:
+            continue
+
+        expected = CombatBatch(1, batch.num_lanes, batch.slots)
+        expected.load(0, game)
+        if not np.array_equal(expected.alive[0], batch.alive[i]):
+            mismatches.append(f"game {i}: survivors differ")
+        elif not np.array_equal(
+            np.where(expected.alive[0], expected.health[0], 0),
+            np.where(batch.alive[i], batch.health[i], 0),
+        ):
+            mismatches.append(f"game {i}: fighter health differs")
+        if not np.array_equal(expected.hero_health[0], batch.hero_health[i]):
+            mismatches.append(f"game {i}: hero health differs")
+    return mismatches
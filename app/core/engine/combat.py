@@ -2,6 +2,8 @@
 Provides combat mechanics and turn management for the game.
 """
 
+from __future__ import annotations
+
 from app.core.event.events import (
     LaneCombatStartingEvent,
     LaneCombatEndingEvent,
@@ -34,26 +36,18 @@ class Combat:
         zombies: list[Fighter] = targets["zombies"]
         plants: list[Fighter] = targets["plants"]
         attack_events: Events = []
-        for z in zombies:
-            aim = self.IM.first_attackable_item(z)
-            if aim:
-                attack_events.append(
-                    AttackEvent(
-                        attacker_id=z.id,
-                        defender_id=aim.id,
-                        damage=z.strength,
-                    )
-                )
-        for p in plants:
-            aim = self.IM.first_attackable_item(p)
-            if aim:
-                attack_events.append(
-                    AttackEvent(
-                        attacker_id=p.id,
-                        defender_id=aim.id,
-                        damage=p.strength,
+        # Attackers on both sides pick their targets before anyone is hurt
+        for fighter in zombies + plants:
+            strikes = 2 if fighter.state.ABILITIES.DOUBLE_STRIKE else 1
+            for aim in self.IM.attack_targets(fighter):
+                for _ in range(strikes):
+                    attack_events.append(
+                        AttackEvent(
+                            attacker_id=fighter.id,
+                            defender_id=aim.id,
+                            damage=fighter.strength,
+                        )
                     )
-                )
         self.game.run_events(attack_events)
 
         self.game.run_events([LaneCombatEndingEvent(lane_idx)])
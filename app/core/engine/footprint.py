@@ -0,0 +1,141 @@
+"""
+Memory footprint of one game, to size how many rooms fit in a process.
+
+The game's object graph is walked from the Game and every object reachable from
+it is counted once, by `sys.getsizeof`, under the first component that reaches
+it. Data shared by all games is left out: classes, functions, enums, card and
+hero configs, the event type registry and the Zobrist key table, as well as
+small immutable values (numbers, strings, None), which are mostly cached or
+interned by the interpreter.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from sys import getsizeof
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+from app.core.base import CardConfig, HeroConfig
+from app.core.event.event import EventRegistry
+from app.core.event.event_manager import EventManager
+from app.core.event.listener import Listener
+from app.core.item.item import Item, slot_names
+from app.core.item.item_manager import ItemManager
+from app.core.zobrist import ZobristKeys
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterator, Set
+    from app.core.engine.game import Game
+
+
+_SHARED = (
+    type,
+    ModuleType,
+    FunctionType,
+    BuiltinFunctionType,
+    MethodType,
+    Enum,
+    CardConfig,
+    HeroConfig,
+    EventRegistry,
+    ZobristKeys,
+    int,
+    float,
+    str,
+    bytes,
+    type(None),
+)
+
+
+@dataclass
+class Footprint:
+    # Bytes per component, in the order they were measured
+    components: Dict[str, int] = field(default_factory=dict)
+    objects: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.components.values())
+
+    def __str__(self) -> str:
+        parts = ", ".join(
+            f"{name} {size / 1024:.1f}KiB" for name, size in self.components.items()
+        )
+        return f"{self.total / 1024:.1f}KiB in {self.objects} objects ({parts})"
+
+
+def _children(obj: object) -> Iterator[object]:
+    if isinstance(obj, dict):
+        yield from obj.keys()
+        yield from obj.values()
+        return
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        yield from obj
+        return
+    for name in slot_names(type(obj)):
+        value = getattr(obj, name, None)
+        if value is not None:
+            yield value
+    state = getattr(obj, "__dict__", None)
+    if state is not None:
+        yield state
+
+
+class _Walker:
+    def __init__(self):
+        self.seen: Set[int] = set()
+        self.objects = 0
+
+    def size(self, root: object, stop: tuple[type, ...] = ()) -> int:
+        """
+        Size of everything reachable from `root` not counted yet.
+        Objects of the `stop` types are left for a later component.
+        """
+        total = 0
+        pending = [root]
+        seen = self.seen
+        while pending:
+            obj = pending.pop()
+            if isinstance(obj, _SHARED) or id(obj) in seen:
+                continue
+            if obj is not root and isinstance(obj, stop):
+                continue
+            seen.add(id(obj))
+            self.objects += 1
+            total += getsizeof(obj)
+            pending.extend(_children(obj))
+        return total
+
+
+def measure(game: Game) -> Footprint:
+    """
+    Measure a game, broken down into items (with their states and abilities'
+    configs), item indexes, listeners, queued events and everything else.
+    """
+    walker = _Walker()
+    item_manager = game.item_manager
+    event_manager = game.event_manager
+    footprint = Footprint()
+    components = footprint.components
+
+    # Items link back to their manager, which is measured on its own
+    managers = (ItemManager, EventManager)
+    components["items"] = sum(
+        walker.size(item, stop=(Item, Listener) + managers)
+        for item in item_manager._all_items.values()
+    )
+    components["indexes"] = walker.size(item_manager, stop=(Listener, EventManager))
+    components["listeners"] = walker.size(event_manager.listener_pool, stop=managers)
+    for item in item_manager._all_items.values():
+        # Abilities not registered with the event manager (e.g. cards in hand)
+        abilities = getattr(item, "abilities", None)
+        components["listeners"] += walker.size(abilities, stop=managers)
+    components["events"] = walker.size(event_manager.event_queue, stop=managers)
+    components["other"] = walker.size(game)
+
+    footprint.objects = walker.objects
+    return footprint
@@ -1,8 +1,12 @@
+from __future__ import annotations
+
 from app.core.engine.player import Player
 from app.core.base import Faction, GamePhase
+from app.core.identity import IdAllocator
 from app.core.item.item_manager import ItemManager
 from app.core.event.event_manager import EventManager
 from app.core.action.action_manager import ActionManager
+from app.core.action.legal_moves import LegalMoves
 from app.core.event.events import (
     ZombiePhaseStartingEvent,
     ZombiePhaseEndingEvent,
@@ -10,23 +14,48 @@ from app.core.event.events import (
     PlantPhaseEndingEvent,
     ZombieTrickPhaseStartingEvent,
     ZombieTrickPhaseEndingEvent,
+    TurnStartingEvent,
+    TurnEndingEvent,
+    PlayCardEvent,
 )
 
 from app.core.engine.combat import Combat
+from app.core.engine.footprint import Footprint, measure
+from app.core.engine.scheduler import PhaseScheduler
+from app.core.rng import GameRandom
+from app.core.undo import UndoLog
+from app.core.zobrist import ZOBRIST_KEYS
+
+from copy import copy
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Dict, Any, Optional
+    from typing import Dict, Any, Optional, Tuple
+    from app.core.event.listener import Listener
+    from app.core.item.item import Item
     from app.core.event.event import Events
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed: int | None = None, headless: bool = False):
+        """
+        :param seed: Seed of the game's randomness, so a game can be played
+            again identically. Drawn at random if None, see `seed`.
+        :param headless: Run silently, for simulations driven without a
+            frontend (see engine/headless.py).
+        """
+        self.headless = headless
         # 1. Core manager initialization
-        self.item_manager = ItemManager()
-        self.event_manager = EventManager()
+        self.rng = GameRandom(seed)
+        self.undo = UndoLog()
+        self.ids = IdAllocator()
+        self.item_manager = ItemManager(self.ids, self.rng)
+        # Events count separately, so item ids do not depend on event volume
+        self.event_manager = EventManager(IdAllocator(), self.item_manager.liveness)
         self.action_manager = ActionManager()
+        self.legal_moves = LegalMoves(self.item_manager)
+        self._wire_managers()
 
         # 2. Player initialization
         self.zombie_player = Player(Faction.ZOMBIE, "Dr. Zomboss")
@@ -40,6 +69,8 @@ class Game:
         self.phase: GamePhase = GamePhase.IDLE
         self.turn_count: int = 0
         self.is_running: bool = False
+        self.winner: Faction | None = None
+        self.scheduler = PhaseScheduler()
 
         # 4. Phase transition mapping (State Machine Definition)
         self._phase_cycle = {
@@ -51,6 +82,85 @@ class Game:
             GamePhase.TURN_END: GamePhase.TURN_START,
         }
 
+    def _wire_managers(self):
+        self.item_manager.undo = self.undo
+        self.event_manager.set_undo_log(self.undo)
+        self.item_manager.move_hooks.append(self.event_manager.on_source_moved)
+        self.item_manager.teardown_hooks.append(self.event_manager.unregister_source)
+        self.item_manager.zone_hooks.append(self.event_manager.on_zone_changed)
+        self.item_manager.occupancy_hooks.append(self.legal_moves.on_pos_changed)
+
+    def fork(self) -> Game:
+        """
+        Clone the game for look-ahead: AI search, move previews, combat predictions.
+        The fork shares immutable data (card configs, the phase cycle) and copies
+        everything the game mutates: items and their states, energy, the event
+        queue, listener registrations and pending actions.
+        Profiler, journal, phase timings and moves to undo are not carried over.
+        """
+        clone = Game.__new__(Game)
+
+        listeners: Dict[Listener, Listener] = {}
+        sources: Dict[Item, Item] = {}
+        clone.rng = self.rng.fork()
+        clone.undo = UndoLog()
+        clone.item_manager = self.item_manager.fork(listeners, clone.rng, sources)
+        clone.ids = clone.item_manager.ids
+        clone.event_manager = self.event_manager.fork(
+            clone.item_manager, listeners, sources
+        )
+        clone.action_manager = self.action_manager.fork()
+        clone.legal_moves = LegalMoves(clone.item_manager)
+        clone._wire_managers()
+
+        clone.zombie_player = copy(self.zombie_player)
+        clone.plant_player = copy(self.plant_player)
+        clone._player_map = {
+            clone.zombie_player.id: clone.zombie_player,
+            clone.plant_player.id: clone.plant_player,
+        }
+
+        clone.phase = self.phase
+        clone.turn_count = self.turn_count
+        clone.is_running = self.is_running
+        clone.winner = self.winner
+        clone.scheduler = PhaseScheduler()
+        clone.headless = self.headless
+        clone._phase_cycle = self._phase_cycle
+        return clone
+
+    @property
+    def seed(self) -> int:
+        """
+        Seed the game was started from, pass it to Game to play it again.
+        """
+        return self.rng.seed
+
+    @property
+    def state_hash(self) -> int:
+        """
+        64-bit Zobrist hash of the whole game state.
+        The board, stats, zones and hands are hashed incrementally by the
+        ItemManager; the few scalars held outside it are folded in here.
+        """
+        key = ZOBRIST_KEYS.key
+        item_manager = self.item_manager
+        value = item_manager.zobrist.value
+        value ^= key(("phase", self.phase)) ^ key(("turn", self.turn_count))
+        for player in (self.zombie_player, self.plant_player):
+            value ^= key(("energy", player.faction, player.energy))
+        for hero_range in ("z_hero", "p_hero"):
+            hero = item_manager[hero_range].first()
+            if hero is not None:
+                value ^= key(("hero", hero.id, getattr(hero, "health", None)))
+        return value
+
+    def memory_footprint(self) -> Footprint:
+        """
+        Bytes held by this game and not shared with other games, by component.
+        """
+        return measure(self)
+
     def set_up(self, **kwargs):
         """
         Pre-game setup: Configure players, decks, heroes, etc.
@@ -64,7 +174,7 @@ class Game:
         if self.is_running:
             return
 
-        print("🟢 Game Engine Starting...")
+        self._say("🟢 Game Engine Starting...")
 
         # 1. Set up the board (Lanes, Positions)
         self.item_manager.set_up_board()
@@ -74,7 +184,9 @@ class Game:
         self.turn_count = 1
 
         # 3. Trigger the initial phase
+        self.scheduler.on_transition(self.phase, GamePhase.TURN_START)
         self.phase = GamePhase.TURN_START
+        self._journal_phase()
         self._on_phase_start(self.phase)
 
     def tick(self, dt: float):
@@ -107,31 +219,94 @@ class Game:
         success = self.action_manager.receive(payload, self)
 
         if not success:
-            print(f"⚠️ Action rejected: {payload.get('operation_name', 'Unknown')}")
+            self._say(f"⚠️ Action rejected: {payload.get('operation_name', 'Unknown')}")
 
     def next_phase(self):
         """
-        Advance the game to the next phase.
+        Advance the game to the next phase, then through any phase that
+        resolves on its own. Transitions queue on the scheduler and run one
+        after the other, never nested.
+        """
+        self.scheduler.request()
+        self.scheduler.drain(self._advance_phase)
+
+    def phase_timings(self) -> Dict[GamePhase, tuple[int, float]]:
+        """
+        Times each phase was entered and seconds spent in it so far.
+        """
+        return self.scheduler.timings()
+
+    def _advance_phase(self, target: GamePhase | None = None):
+        """
+        Perform one transition, to `target` or else to the next phase of the cycle.
         """
         current = self.phase
-        next_p = self._phase_cycle.get(current)
+        next_p = target or self._phase_cycle.get(current)
 
         if not next_p:
-            print(f"❌ No next phase defined for {current}")
+            self._say(f"❌ No next phase defined for {current}")
             return
 
-        print(f"🔄 Phase Transition: {current.name} -> {next_p.name}")
+        self._say(f"🔄 Phase Transition: {current.name} -> {next_p.name}")
 
         self._on_phase_end(current)
-        self.phase = next_p
+        self.scheduler.on_transition(current, next_p)
+        self.undo.set(self, "phase", next_p)
 
         # Special handling: Increment turn counter
         if next_p == GamePhase.TURN_START:
-            self.turn_count += 1
-            print(f"📅 Turn {self.turn_count} Begins")
+            self.undo.set(self, "turn_count", self.turn_count + 1)
+            self._say(f"📅 Turn {self.turn_count} Begins")
 
+        self._journal_phase()
         self._on_phase_start(next_p)
 
+    def apply_move(self, move: Tuple[int, int] | None) -> bool:
+        """
+        Make a move that `undo_move` can take back, for search in place.
+        The events it causes are resolved before this returns.
+
+        :param move: (card id, pos id) to play a card, see `legal_moves`, or
+            None to end the current phase.
+        :return: False, changing nothing, if the play is not legal.
+        """
+        if move is not None:
+            card_id, pos_id = move
+            faction = getattr(self.item_manager.get_by_id(card_id), "faction", None)
+            if faction is None or not self.legal_moves.is_legal(
+                faction, card_id, pos_id
+            ):
+                return False
+        self.undo.mark()
+        if move is None:
+            self.next_phase()
+        else:
+            self.run_events([PlayCardEvent(card_id, pos_id)])
+        self.event_manager.notify(self)
+        return True
+
+    def undo_move(self):
+        """
+        Take back the last move made by `apply_move`.
+        """
+        self.undo.undo()
+
+    def player_of(self, faction: Faction) -> Player:
+        if faction == Faction.ZOMBIE:
+            return self.zombie_player
+        return self.plant_player
+
+    def finish(self, winner: Faction):
+        """
+        End the game, e.g. when a hero falls. Pending events are left unprocessed:
+        they stay queued, but EventManager.notify resolves nothing more.
+        """
+        if not self.is_running:
+            return
+        self.undo.set(self, "winner", winner)
+        self.undo.set(self, "is_running", False)
+        self._say(f"🏁 {winner.name} wins on turn {self.turn_count}")
+
     def run_events(self, events: Events):
         """
         Interface to inject generated events into the system.
@@ -142,6 +317,15 @@ class Game:
 
     # --- Private helper methods (Logic Implementation) ---
 
+    def _say(self, message: str):
+        if not self.headless:
+            print(message)
+
+    def _journal_phase(self):
+        journal = self.event_manager.journal
+        if journal is not None:
+            journal.append_phase(self.phase, self.turn_count)
+
     def _on_phase_start(self, phase: GamePhase):
         """Hook logic executed when a phase starts."""
 
@@ -157,7 +341,10 @@ class Game:
             self.item_manager.end_phase_button.deactivate()
 
         # 2. Trigger phase events (for Listener response, e.g., "draw cards at turn start")
-        # self.event_manager.event_queue.put(PhaseStartEvent(phase=phase))
+        if phase == GamePhase.TURN_START:
+            self.run_events([TurnStartingEvent()])
+        elif phase == GamePhase.TURN_END:
+            self.run_events([TurnEndingEvent()])
 
         # 3. Special handling for combat phase
         if phase == GamePhase.COMBAT_PHASE:
@@ -173,9 +360,10 @@ class Game:
         Recommendation: Create a CombatAction and push it onto the ActionManager stack,
         rather than resolving directly here, so the frontend can play combat animations.
         """
-        print("⚔️ Combat Logic Triggered (Placeholder)")
+        self._say("⚔️ Combat Logic Triggered (Placeholder)")
         # Example:
         combat = Combat(self)
         combat.resolve()
 
-        self.next_phase()  # Automatically proceed to next phase after combat
+        # Proceed to the next phase once this start hook has returned
+        self.scheduler.request()
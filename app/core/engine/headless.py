@@ -0,0 +1,261 @@
+"""
+Headless simulation: whole games played by bots, without a frontend.
+
+A headless game prints nothing and never looks at a clock. Instead of ticking
+it, HeadlessRunner drives it directly: it resolves every pending event, moves
+on through the phases nobody acts in, and asks the bot of the active faction
+for operations until the bot ends its phase. This is the base for self-play,
+balance testing and regression benchmarks.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from itertools import count, islice
+from time import perf_counter
+
+from app.core.action.action import Operation
+from app.core.action.actions import PlayCardAction
+from app.core.base import CardClass, Faction, GamePhase, HeroConfig
+from app.core.engine.game import Game
+from app.core.identity import parse_id, render_id
+from app.core.item.hero import Hero
+from app.service.card_loader import make_card
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterable, Iterator, List, Sequence
+    from app.core.event.journal import EventJournal
+    from app.core.item.card import Card
+    from app.core.item.position import Pos
+    from app.service.card_loader import CardData
+
+
+# Faction acting in each player phase, the other phases resolve on their own
+ACTIVE_FACTION = {
+    GamePhase.ZOMBIE_PHASE: Faction.ZOMBIE,
+    GamePhase.PLANT_PHASE: Faction.PLANT,
+    GamePhase.ZOMBIE_TRICK_PHASE: Faction.ZOMBIE,
+}
+
+HERO_RANGES = {Faction.ZOMBIE: "z_hero", Faction.PLANT: "p_hero"}
+
+DEFAULT_HEROES = {
+    Faction.ZOMBIE: HeroConfig(
+        "Super Brainz", "", Faction.ZOMBIE, "", [CardClass.HEARTY, CardClass.SNEAKY]
+    ),
+    Faction.PLANT: HeroConfig(
+        "Green Shadow", "", Faction.PLANT, "", [CardClass.MEGA_GROW, CardClass.SMARTY]
+    ),
+}
+
+OPENING_HAND = 4
+
+
+def play_card(card: Card, pos: Pos) -> Dict[str, Any]:
+    """
+    The operation payload playing a card on a pos, as sent by a client.
+    """
+    return {
+        "operation_name": "play_card",
+        "faction": card.faction,
+        "data": {"card_id": render_id(card.id), "pos_id": render_id(pos.id)},
+    }
+
+
+def legal_plays(game: Game, faction: Faction) -> List[Dict[str, Any]]:
+    """
+    Every card the faction can play right now, on every pos it can go to.
+    """
+    return [play_card(card, pos) for card, pos in game.legal_moves.moves(faction)]
+
+
+class Bot(ABC):
+    name: str = "bot"
+
+    @abstractmethod
+    def choose(self, game: Game, faction: Faction) -> Dict[str, Any] | None:
+        """
+        Pick the next operation of the faction in the current phase.
+
+        :return: An operation payload, as for Game.act_on, or None to end
+            the phase.
+        """
+        pass
+
+
+class PassBot(Bot):
+    """
+    Never plays anything.
+    """
+
+    name = "pass"
+
+    def choose(self, game: Game, faction: Faction) -> Dict[str, Any] | None:
+        return None
+
+
+class ScriptedBot(Bot):
+    """
+    Replays a fixed list of operations, None entries end the phase.
+    """
+
+    name = "scripted"
+
+    def __init__(self, operations: Iterable[Dict[str, Any] | None]):
+        self.operations = iter(operations)
+
+    def choose(self, game: Game, faction: Faction) -> Dict[str, Any] | None:
+        return next(self.operations, None)
+
+
+class RandomBot(Bot):
+    """
+    Plays random legal cards until it can afford none. Its choices come from
+    the game's own random streams, so a seeded game plays out identically.
+    """
+
+    name = "random"
+
+    def choose(self, game: Game, faction: Faction) -> Dict[str, Any] | None:
+        plays = legal_plays(game, faction)
+        if not plays:
+            return None
+        return game.rng.stream(f"bot/{faction.name}").choice(plays)
+
+
+# Bots that can be named on the command line, see app/service/tournament.py
+BOTS: Dict[str, type[Bot]] = {bot.name: bot for bot in (PassBot, RandomBot)}
+
+
+@dataclass
+class GameResult:
+    seed: int
+    winner: Faction | None
+    turns: int
+    # Names of the cards each faction played, in order
+    plays: Dict[Faction, List[str]] = field(
+        default_factory=lambda: {Faction.ZOMBIE: [], Faction.PLANT: []}
+    )
+
+
+def build_deck(cards: Iterable[CardData], faction: Faction, size: int = 40):
+    """
+    A deck of `size` cards cycling through a faction's cards.
+    """
+    own = [data for data in cards if data.config.faction == faction]
+    if not own:
+        raise ValueError(f"No {faction.name} cards to build a deck from.")
+    return [own[i % len(own)] for i in range(size)]
+
+
+def new_game(
+    seed: int,
+    decks: Dict[Faction, Sequence[CardData]],
+    heroes: Dict[Faction, HeroConfig] = DEFAULT_HEROES,
+    journal: EventJournal | None = None,
+) -> Game:
+    """
+    Start a headless game: board set up, heroes in place, decks shuffled and
+    opening hands drawn.
+
+    :param journal: Journal to record the game into. The setup is recorded as
+        seed and deck lists rather than event by event, ReplayEngine rebuilds
+        it by calling this again.
+    """
+    game = Game(seed, headless=True)
+    game.start_game()
+    item_manager = game.item_manager
+    for faction, deck in decks.items():
+        item_manager.keep_track(HERO_RANGES[faction], Hero(heroes[faction]))
+        item_manager.keep_track(
+            item_manager.deck(faction).range, *(make_card(data) for data in deck)
+        )
+        item_manager.deck(faction).shuffle()
+        for _ in range(OPENING_HAND):
+            item_manager.draw(faction)
+    if journal is not None:
+        card_ids = {
+            faction: [data.card_id for data in deck] for faction, deck in decks.items()
+        }
+        journal.append_setup(seed, card_ids)
+        game.event_manager.journal = journal
+    return game
+
+
+class HeadlessRunner:
+    def __init__(
+        self, zombie: Bot, plant: Bot, max_turns: int = 30, max_operations: int = 20
+    ):
+        """
+        Play games between two bots.
+
+        :param max_turns: Games still running after this many turns are draws.
+        :param max_operations: Operations a bot may send in one phase, the
+            phase ends after that even if the bot would not end it.
+        """
+        self.bots = {Faction.ZOMBIE: zombie, Faction.PLANT: plant}
+        self.max_turns = max_turns
+        self.max_operations = max_operations
+
+    def play(self, game: Game) -> GameResult:
+        """
+        Play a started game to its end.
+        """
+        result = GameResult(game.seed, None, 0)
+        event_manager = game.event_manager
+        while True:
+            event_manager.notify(game)
+            if not game.is_running or game.turn_count > self.max_turns:
+                break
+            faction = ACTIVE_FACTION.get(game.phase)
+            if faction is not None:
+                self._play_phase(game, faction, result)
+            game.next_phase()
+
+        result.winner = game.winner
+        result.turns = min(game.turn_count, self.max_turns)
+        return result
+
+    def _play_phase(self, game: Game, faction: Faction, result: GameResult):
+        bot = self.bots[faction]
+        action = PlayCardAction(faction)
+        for _ in range(self.max_operations):
+            payload = bot.choose(game, faction)
+            if payload is None:
+                return
+            try:
+                operation = Operation(**payload)
+            except TypeError:
+                continue
+            if operation.faction != faction or not action.validate(operation, game):
+                continue
+            card = game.item_manager.get_by_id(parse_id(operation.data["card_id"]))
+            result.plays[faction].append(card.name)  # type: ignore
+            game.run_events(action.parse(operation, game))
+            game.event_manager.notify(game)
+            if not game.is_running:
+                return
+
+    def run(
+        self, decks: Dict[Faction, Sequence[CardData]], seeds: Iterable[int]
+    ) -> Iterator[GameResult]:
+        for seed in seeds:
+            yield self.play(new_game(seed, decks))
+
+
+def throughput(
+    runner: HeadlessRunner,
+    decks: Dict[Faction, Sequence[CardData]],
+    games: int,
+    first_seed: int = 0,
+) -> float:
+    """
+    Full games played per second on this core, from seeds `first_seed` on.
+    """
+    start = perf_counter()
+    for _ in islice(runner.run(decks, count(first_seed)), games):
+        pass
+    return games / (perf_counter() - start)
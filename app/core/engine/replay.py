@@ -0,0 +1,130 @@
+"""
+Rebuilds a game from its event journal.
+
+Replay does not go through ActionManager, ticks or listener dispatch: every event
+that changed the game was journaled when it executed, including those produced
+by listeners, so re-executing the records in order reproduces the game state.
+This relies on listeners answering with events rather than mutating the game
+themselves, which is how abilities are meant to be written anyway.
+
+The setup (heroes, decks, shuffle, opening hands) is not journaled event by
+event: the journal starts with the seed and deck lists, and the game is rebuilt
+from them with headless.new_game before the records are re-executed.
+"""
+
+from __future__ import annotations
+
+from app.core.base import GamePhase
+from app.core.engine.game import Game
+from app.core.engine.headless import DEFAULT_HEROES, new_game
+from app.core.event.event import EVENT_REGISTRY, Event
+from app.core.event.journal import (
+    JournalReader,
+    EventRecord,
+    JournalError,
+    PhaseRecord,
+    SetupRecord,
+)
+from app.service.card_loader import load_cards
+
+# Make sure every built-in event class is registered before replaying
+import app.core.event.events  # noqa: F401
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict
+    from app.core.base import Faction, HeroConfig
+    from app.service.card_loader import CardData
+
+
+PLAYER_PHASES = (
+    GamePhase.ZOMBIE_PHASE,
+    GamePhase.PLANT_PHASE,
+    GamePhase.ZOMBIE_TRICK_PHASE,
+)
+
+
+class ReplayEngine:
+    def __init__(
+        self,
+        data: bytes,
+        cards: Dict[str, CardData] | None = None,
+        heroes: Dict[Faction, HeroConfig] = DEFAULT_HEROES,
+    ):
+        """
+        Prepare a replay of a journal produced by EventJournal.
+
+        :param cards: Card definitions by card id, to rebuild the decks of the
+            journaled setup. Loaded from the card assets when omitted.
+        :param heroes: Heroes the journaled game was started with.
+        """
+        self.reader = JournalReader(data)
+        self.event_types: Dict[str, type[Event]] = EVENT_REGISTRY.by_path
+        self.cards = cards
+        self.heroes = heroes
+
+    def _set_up(self, setup: SetupRecord | None) -> Game:
+        if setup is None:
+            # Journal without a setup: only the board can be rebuilt
+            game = Game(headless=True)
+            game.item_manager.set_up_board()
+            game.is_running = True
+            return game
+
+        if self.cards is None:
+            self.cards = load_cards()
+        cards = self.cards
+        try:
+            decks = {
+                faction: [cards[card_id] for card_id in card_ids]
+                for faction, card_ids in setup.decks.items()
+                if card_ids
+            }
+        except KeyError as e:
+            raise JournalError(f"Unknown card {e.args[0]!r} in the journaled decks.")
+        return new_game(setup.seed, decks, self.heroes)
+
+    def run(self, game: Game | None = None, stop_at: int | None = None) -> Game:
+        """
+        Re-feed the journal into a fresh game and return it.
+
+        :param game: Game to replay into, already set up the way the journaled
+            game was. A new one is rebuilt from the journaled setup when omitted.
+        :param stop_at: Stop after this many records, to inspect an
+            intermediate state when reproducing a bug.
+        """
+        if game is None:
+            game = self._set_up(self.reader.setup())
+
+        event_types = self.event_types
+        for count, record in enumerate(self.reader):
+            if stop_at is not None and count >= stop_at:
+                break
+
+            if isinstance(record, EventRecord):
+                event_type = event_types.get(record.name)
+                if event_type is None:
+                    raise JournalError(f"Unknown event type {record.name!r}.")
+                event = event_type.from_record(
+                    record.source_id, record.target_id, record.amount, record.priority
+                )
+                # Follow-up events were journaled on their own, drop them here.
+                event.execute(game)
+            elif isinstance(record, PhaseRecord):
+                game.phase = record.phase
+                game.turn_count = record.turn
+                if record.phase not in PLAYER_PHASES:
+                    game.item_manager.end_phase_button.deactivate()
+
+        return game
+
+    def reproduces(self, game: Game, replay_into: Game | None = None) -> bool:
+        """
+        Check that replaying the journal ends in the same state as `game`,
+        comparing state hashes rather than walking both boards.
+
+        :param game: The game the journal was recorded from.
+        :param replay_into: Game to replay into, see `run`.
+        """
+        return self.run(replay_into).state_hash == game.state_hash
@@ -0,0 +1,66 @@
+"""
+Phase scheduling for Game.
+
+Phase changes are requested rather than performed on the spot: a request is
+queued, and the queue is drained by a single loop at the outermost call. A phase
+that resolves on its own (combat) requests the next phase from its start hook
+and returns, so a long run of automatic phases is a loop, not a recursion, and
+every transition goes through one place where it can be timed.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from time import perf_counter
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Deque, Dict
+    from app.core.base import GamePhase
+
+
+class PhaseScheduler:
+    def __init__(self):
+        # Requested transitions, None for "the next phase of the cycle"
+        self.pending: Deque[GamePhase | None] = deque()
+        self.draining: bool = False
+
+        # Per phase: times entered and wall-clock seconds spent in it
+        self.entries: Dict[GamePhase, int] = {}
+        self.seconds: Dict[GamePhase, float] = {}
+        self._entered_at: float = perf_counter()
+
+    def request(self, phase: GamePhase | None = None):
+        self.pending.append(phase)
+
+    def drain(self, advance: Callable[[GamePhase | None], None]):
+        """
+        Perform queued transitions until none is left. Requests made while
+        draining are picked up by the same loop.
+        """
+        if self.draining:
+            return
+        self.draining = True
+        try:
+            pending = self.pending
+            while pending:
+                advance(pending.popleft())
+        finally:
+            self.draining = False
+
+    def on_transition(self, left: GamePhase, entered: GamePhase):
+        now = perf_counter()
+        self.seconds[left] = self.seconds.get(left, 0.0) + now - self._entered_at
+        self.entries[entered] = self.entries.get(entered, 0) + 1
+        self._entered_at = now
+
+    def timings(self) -> Dict[GamePhase, tuple[int, float]]:
+        """
+        Times entered and total seconds spent, by phase.
+        """
+        phases = self.entries.keys() | self.seconds.keys()
+        return {
+            phase: (self.entries.get(phase, 0), self.seconds.get(phase, 0.0))
+            for phase in phases
+        }
@@ -1,5 +1,6 @@
 from .event import Event, Events
 from .listener import Listener
 from .event_manager import EventManager
+from .profiler import EventProfiler
 
-__all__ = ["Event", "Events", "Listener", "EventManager"]
+__all__ = ["Event", "Events", "Listener", "EventManager", "EventProfiler"]
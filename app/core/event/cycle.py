@@ -0,0 +1,234 @@
+"""
+Cycle detection for event chains.
+
+A runaway trigger loop (A answers B, B answers A, ...) used to run until
+EventManager.MAX_STEPS. Instead, every event processed by notify is fingerprinted
+and the detector looks for a periodic tail in a sliding window of fingerprints.
+Fingerprints are kept per chain, the events descending from one root event
+through the events its execution and listeners produced (see Event.root_id), so
+identical events queued independently never make a loop together:
+- exact cycle: (event type, source, target, state hash) repeats, i.e. the game
+  keeps going through the very same states. Nothing can ever change, abort early.
+- runaway: (event type, source, target) repeats with a changing state, e.g. two
+  cards buffing each other forever. Allowed for a while, but not indefinitely.
+Long chains that do not repeat (e.g. a board wipe) are never flagged.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from app.core.event.event import EVENT_REGISTRY
+
+if TYPE_CHECKING:
+    from typing import Callable, Deque, Dict, Hashable, List, Tuple
+    from app.core.event.event import Event
+    from app.core.engine.game import Game
+
+    StateHash = Callable[[Event, Game], int]
+
+
+@dataclass
+class CycleReport:
+    kind: str  # "cycle", "runaway" or "limit" (EventManager.MAX_STEPS)
+    period: int
+    steps: int
+    events: List[tuple[str, int | None, int | None]]
+    root: int = 0  # Id of the event the looping chain descends from
+
+    def __str__(self) -> str:
+        loop = " -> ".join(
+            f"{name}({source}->{target})" for name, source, target in self.events
+        )
+        return (
+            f"{self.kind} of period {self.period} after {self.steps} steps "
+            f"in the chain of event {self.root}: {loop}"
+        )
+
+
+def default_state_hash(event: Event, game: Game) -> int:
+    """
+    The event's payload combined with the game's Zobrist hash, so a repeat only
+    counts as exact when the whole game is back in the same state.
+    """
+    # The record amount also carries payloads such as a lane index
+    return hash((event.to_record()[2], game.state_hash))
+
+
+class PeriodTracker:
+    def __init__(self, window: int, repeats: int, min_run: int = 0):
+        """
+        Track whether the tail of a fingerprint stream is periodic.
+
+        :param window: Longest period looked for.
+        :param repeats: How many times a period must repeat back to back.
+        :param min_run: Minimum number of periodic steps, whatever the period.
+        """
+        self.window = window
+        self.repeats = repeats
+        self.min_run = min_run
+        self.history: Deque[Hashable] = deque(maxlen=window * repeats + min_run)
+        self.last_seen: Dict[Hashable, int] = {}
+        self.step = 0
+        self.period = 0
+        self.run = 0  # consecutive steps matching the one `period` back
+
+    def reset(self):
+        self.history.clear()
+        self.last_seen.clear()
+        self.step = 0
+        self.period = 0
+        self.run = 0
+
+    def observe(self, fingerprint: Hashable) -> int:
+        """
+        Feed one fingerprint, return the period once a cycle is established.
+        """
+        history = self.history
+        step = self.step
+        period = self.period
+
+        if period and len(history) >= period and history[-period] == fingerprint:
+            self.run += 1
+        else:
+            self._new_candidate(fingerprint, step)
+
+        history.append(fingerprint)
+        self.last_seen[fingerprint] = step
+        self.step = step + 1
+        if len(self.last_seen) > 4 * history.maxlen:
+            self._prune()
+
+        period = self.period
+        if period and self.run >= max(period * (self.repeats - 1), self.min_run):
+            return period
+        return 0
+
+    def _new_candidate(self, fingerprint: Hashable, step: int):
+        # Candidate period: distance to the previous occurrence of this fingerprint
+        seen = self.last_seen.get(fingerprint)
+        distance = step - seen if seen is not None else 0
+        if not distance or distance > self.window or distance > len(self.history):
+            self.period = 0
+            self.run = 0
+            return
+
+        period = distance
+        history = self.history
+        # Count how far back the tail already repeats with this period
+        run = 1
+        m = 1
+        while m + period <= len(history) and history[-m] == history[-m - period]:
+            run += 1
+            m += 1
+        self.period = period
+        self.run = run
+
+    def _prune(self):
+        oldest = self.step - len(self.history)
+        self.last_seen = {
+            fp: step for fp, step in self.last_seen.items() if step >= oldest
+        }
+
+    def tail(self, length: int) -> List[Hashable]:
+        return list(self.history)[-length:]
+
+
+class CycleDetector:
+    def __init__(
+        self,
+        window: int = 64,
+        repeats: int = 3,
+        runaway_repeats: int = 8,
+        runaway_steps: int = 512,
+        state_hash: StateHash | None = None,
+    ):
+        """
+        Set up a cycle detector for one notify call at a time.
+
+        :param window: Longest cycle, in events, that is looked for.
+        :param repeats: Repetitions of an exact cycle (same states) before aborting.
+        :param runaway_repeats: Repetitions of the same event pattern with
+            changing states before aborting.
+        :param runaway_steps: Minimum length of such a pattern run, so short
+            legitimate repetitions (e.g. "deal 1 damage 10 times") pass.
+        :param state_hash: Hash of the game state an event acts on.
+        """
+        self.state_hash: StateHash = state_hash or default_state_hash
+        self.window = window
+        self.repeats = repeats
+        self.runaway_repeats = runaway_repeats
+        self.runaway_steps = runaway_steps
+        # Exact and runaway trackers of each chain, by root event id
+        self.chains: Dict[int, Tuple[PeriodTracker, PeriodTracker]] = {}
+        # Fingerprints of roots without descendants so far
+        self.roots: Dict[int, Tuple[Hashable, int]] = {}
+        self.steps = 0
+
+    def reset(self):
+        self.chains.clear()
+        self.roots.clear()
+        self.steps = 0
+
+    def forget(self, root_id: int):
+        """
+        Stop tracking a chain, e.g. once it was aborted.
+        """
+        self.chains.pop(root_id, None)
+        self.roots.pop(root_id, None)
+
+    def fork(self) -> CycleDetector:
+        """
+        A detector with the same settings and a clean state.
+        """
+        return CycleDetector(
+            window=self.window,
+            repeats=self.repeats,
+            runaway_repeats=self.runaway_repeats,
+            runaway_steps=self.runaway_steps,
+            state_hash=self.state_hash,
+        )
+
+    def observe(self, event: Event, game: Game) -> CycleReport | None:
+        self.steps += 1
+        key = (event.type_code, event.source_id, event.target_id)
+        fingerprint = (key, self.state_hash(event, game))
+
+        root_id = event.root_id
+        chain = self.chains.get(root_id)
+        if chain is None:
+            if event.id == root_id:
+                # Most chains are their root alone, trackers are only set up
+                # once a descendant shows up
+                self.roots[root_id] = fingerprint
+                return None
+            chain = self.chains[root_id] = (
+                PeriodTracker(self.window, self.repeats),
+                PeriodTracker(self.window, self.runaway_repeats, self.runaway_steps),
+            )
+            root = self.roots.pop(root_id, None)
+            if root is not None:
+                chain[0].observe(root)
+                chain[1].observe(root[0])
+        exact, runaway = chain
+
+        period = exact.observe(fingerprint)
+        if period:
+            keys = [entry[0] for entry in exact.tail(period)]
+            return self._report("cycle", period, keys, root_id)
+
+        period = runaway.observe(key)
+        if period:
+            return self._report("runaway", period, runaway.tail(period), root_id)
+        return None
+
+    def _report(self, kind: str, period: int, keys: List, root_id: int) -> CycleReport:
+        events = [
+            (EVENT_REGISTRY.classes[code].__name__, source, target)
+            for code, source, target in keys
+        ]
+        return CycleReport(
+            kind=kind, period=period, steps=self.steps, events=events, root=root_id
+        )
@@ -1,14 +1,98 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
-from uuid import uuid4
+from typing import ClassVar, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Tuple
     from app.core.engine.game import Game
-    from app.core import Events
+
+
+class EventRegistry:
+    def __init__(self):
+        """
+        Give every event class a small integer type code, once, at definition.
+
+        Dispatch routes on these codes instead of class-name strings, so it is
+        a list index rather than a string-keyed lookup, and two classes sharing
+        a name in different modules no longer collide.
+        """
+        self.classes: List[type[Event]] = []
+        self.by_path: Dict[str, type[Event]] = {}
+        self.by_name: Dict[str, List[type[Event]]] = {}
+        # code -> codes of the class and all its registered subclasses
+        self.descendants: List[List[int]] = []
+
+    def register(self, cls: type[Event]):
+        code = len(self.classes)
+        cls.type_code = code
+        cls.type_path = f"{cls.__module__}.{cls.__qualname__}"
+        self.classes.append(cls)
+        self.by_path[cls.type_path] = cls
+        self.by_name.setdefault(cls.__name__, []).append(cls)
+
+        self.descendants.append([code])
+        for base in cls.__mro__[1:]:
+            if isinstance(base, type) and issubclass(base, Event):
+                self.descendants[base.type_code].append(code)
+
+    def resolve(self, event_type: type[Event] | str) -> type[Event]:
+        """
+        Resolve a subscription, given as an event class or a bare class name.
+        """
+        if isinstance(event_type, type):
+            return event_type
+        candidates = self.by_name.get(event_type, [])
+        if len(candidates) != 1:
+            found = ", ".join(c.type_path for c in candidates) or "none"
+            raise ValueError(
+                f"Event name {event_type!r} must match exactly one class ({found}), "
+                "subscribe with the class instead."
+            )
+        return candidates[0]
+
+    def codes_for(self, event_types: Iterable[type[Event]]) -> Tuple[int, ...]:
+        """
+        All type codes delivered to a subscription, subclasses included.
+        """
+        codes: Dict[int, None] = {}
+        for event_type in event_types:
+            for code in self.descendants[event_type.type_code]:
+                codes[code] = None
+        return tuple(codes)
+
+
+EVENT_REGISTRY = EventRegistry()
 
 
 class Event(ABC):
-    def __init__(self, **kwargs):
+    type_code: ClassVar[int]
+    type_path: ClassVar[str]
+
+    __slots__ = (
+        "id",
+        "source_id",
+        "target_id",
+        "amount",
+        "data",
+        "cancelled",
+        "priority",
+        "seq",
+        "source_gen",
+        "target_gen",
+        "parent_id",
+        "root_id",
+    )
+
+    def __init__(
+        self,
+        *,
+        source: int | None = None,
+        target: int | None = None,
+        amount: int = 0,
+        data: dict | None = None,
+        priority: int = 3,
+    ):
         """
 
         Event priority mapping:
@@ -23,14 +107,28 @@ class Event(ABC):
 
         """
 
-        self.id = str(uuid4())
+        self.id: int = 0  # Allocated by EventQueue on put
 
-        self.source_id: str | None = kwargs.get("source", None)
-        self.target_id: str | None = kwargs.get("target", None)
-        self.amount: int = kwargs.get("amount", 0)
-        self.data: dict = kwargs.get("data", {})
+        self.source_id: int | None = source
+        self.target_id: int | None = target
+        self.amount: int = amount
+        self.data: dict | None = data
         self.cancelled: bool = False
-        self.priority: int = kwargs.get("priority", 3)
+        self.priority: int = priority
+        self.seq: int = 0  # Stamped by EventQueue on put, FIFO within a level
+
+        # Liveness generations of source/target, stamped by EventQueue on put
+        self.source_gen: int = 0
+        self.target_gen: int = 0
+
+        # Event whose execution or listeners produced this one (0 for none),
+        # and the first event of that chain, stamped by EventQueue on put
+        self.parent_id: int = 0
+        self.root_id: int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        EVENT_REGISTRY.register(cls)
 
     @abstractmethod
     def execute(self, game: Game) -> Events:
@@ -39,6 +137,31 @@ class Event(ABC):
     def cancel(self):
         self.cancelled = True
 
+    def to_record(self) -> tuple[int, int, int, int]:
+        """
+        Flatten the event for the journal: (source, target, amount, priority).
+        Subclasses carrying extra state must fold it into these fields.
+        """
+        return (self.source_id or 0, self.target_id or 0, self.amount, self.priority)
+
+    @classmethod
+    def from_record(
+        cls, source_id: int | None, target_id: int | None, amount: int, priority: int
+    ) -> Event:
+        """
+        Rebuild an event from its journal record, bypassing __init__.
+        """
+        event = cls.__new__(cls)
+        Event.__init__(
+            event, source=source_id, target=target_id, amount=amount, priority=priority
+        )
+        return event
+
     @property
     def name(self) -> str:
         return self.__class__.__name__
+
+
+EVENT_REGISTRY.register(Event)
+
+Events = list[Event | None]
@@ -1,21 +1,51 @@
-from app.core.event.event import Event, Events
+from __future__ import annotations
+
+from app.core.event.cycle import CycleDetector, CycleReport
+from app.core.event.event import EVENT_REGISTRY, Event, Events
+from app.core.event.events import ZoneChangedEvent
+from app.core.event.journal import EventJournal
 from app.core.event.listener import Listener
-from queue import Queue
+from app.core.event.profiler import EventProfiler
+from app.core.base import Lifetime
+from app.core.identity import IdAllocator
+from app.core.item.item_manager import ZONE_LIFETIMES
+from app.core.item.liveness import LivenessTable
+from app.core.undo import UndoLog
+from collections import deque
+from copy import copy
+from time import perf_counter
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.core.engine.game import Game
-    from typing import List, Dict
+    from app.core.item.item import Item
+    from app.core.item.item_manager import ItemManager
+    from typing import List, Dict, Deque, Tuple
 
 
 class EventQueue:
-    def __init__(self, levels: int = 8):
+    def __init__(
+        self,
+        levels: int = 8,
+        ids: IdAllocator | None = None,
+        liveness: LivenessTable | None = None,
+    ):
         """
         Set up a multi-level priority queue for events.
         Higher priority events (lower numerical value) are processed first.
 
+        The queue is single-threaded by design: it is only ever driven by
+        `EventManager.notify` inside the game loop, so no locking is done.
+        Each level is a deque bucket, and a bitmask tracks which buckets are
+        non-empty, so the highest-priority bucket is found in constant time.
+        Events within a level are served FIFO, stamped with a per-level
+        sequence number to keep the ordering deterministic.
+
         :param levels: Number of priority levels.
+        :param ids: The game's id allocator, events get their id when queued.
+        :param liveness: The game's item liveness table, events remember the
+            generation of their source and target when queued.
 
         Event priority mapping:
         - level 0: Game Over Events + Surprise Phase Starting.
@@ -29,115 +59,529 @@ class EventQueue:
 
         """
         self.levels = levels
-        self.queues: List[Queue[Event]] = [Queue() for _ in range(levels)]
+        self.ids: IdAllocator = ids if ids is not None else IdAllocator()
+        self.liveness: LivenessTable | None = liveness
+        self.buckets: List[Deque[Event]] = [deque() for _ in range(levels)]
+        self.sequences: List[int] = [0] * levels
+
+        self._mask: int = 0  # bit i is set while bucket i is non-empty
+        self._count: int = 0
+        # Shared with the game, see EventManager.set_undo_log
+        self.undo: UndoLog = UndoLog()
 
-    def put(self, event: Event):
+    def put(self, event: Event, parent: Event | None = None):
+        """
+        Queue an event.
+
+        :param parent: The event that produced this one, if any. Events
+            descending from the same root form a chain, see CycleDetector.
+        """
         priority = event.priority
         if priority < 0:
             priority = 0
         elif priority >= self.levels:
             priority = self.levels - 1
-        self.queues[priority].put(event)
+
+        if self.undo.recording:
+            self.undo.record(
+                self._unput,
+                priority,
+                event,
+                self.ids.next_id,
+                event.parent_id,
+                event.root_id,
+            )
+        if not event.id:
+            event.id = self.ids.allocate()
+        if parent is not None:
+            event.parent_id = parent.id
+            event.root_id = parent.root_id or parent.id
+        elif not event.root_id:
+            event.root_id = event.id
+        liveness = self.liveness
+        if liveness is not None:
+            if event.source_id is not None:
+                event.source_gen = liveness.generation(event.source_id)
+            if event.target_id is not None:
+                event.target_gen = liveness.generation(event.target_id)
+        event.seq = self.sequences[priority]
+        self.sequences[priority] += 1
+
+        self.buckets[priority].append(event)
+        self._mask |= 1 << priority
+        self._count += 1
 
     def get(self) -> Event | None:
-        for queue in self.queues:
-            if not queue.empty():
-                return queue.get()
-        return None
+        mask = self._mask
+        if not mask:
+            return None
+
+        # Lowest set bit is the highest-priority non-empty bucket.
+        level = (mask & -mask).bit_length() - 1
+        bucket = self.buckets[level]
+        event = bucket.popleft()
+        if self.undo.recording:
+            self.undo.record(self._unget, level, event)
+        if not bucket:
+            self._mask = mask & ~(1 << level)
+        self._count -= 1
+        return event
+
+    def _unput(
+        self, level: int, event: Event, next_id: int, parent_id: int, root_id: int
+    ):
+        bucket = self.buckets[level]
+        bucket.pop()
+        if not bucket:
+            self._mask &= ~(1 << level)
+        self._count -= 1
+        self.sequences[level] -= 1
+        event.parent_id = parent_id
+        event.root_id = root_id
+        if self.ids.next_id != next_id:
+            event.id = 0
+            self.ids.rewind(next_id)
+
+    def _unget(self, level: int, event: Event):
+        self.buckets[level].appendleft(event)
+        self._mask |= 1 << level
+        self._count += 1
+
+    def _refill(self, buckets: List[List[Event]], mask: int, count: int):
+        for bucket, events in zip(self.buckets, buckets):
+            bucket.clear()
+            bucket.extend(events)
+        self._mask = mask
+        self._count = count
+
+    def peek_level(self) -> int | None:
+        """
+        Get the priority level of the next event without dequeuing it.
+        """
+        mask = self._mask
+        if not mask:
+            return None
+        return (mask & -mask).bit_length() - 1
+
+    def fork(self, ids: IdAllocator, liveness: LivenessTable | None) -> EventQueue:
+        """
+        Copy the pending events for a forked game.
+        """
+        clone = EventQueue(self.levels, ids, liveness)
+        clone.buckets = [deque(map(copy, bucket)) for bucket in self.buckets]
+        clone.sequences = self.sequences.copy()
+        clone._mask = self._mask
+        clone._count = self._count
+        return clone
+
+    def clear(self):
+        if self.undo.recording:
+            self.undo.record(
+                self._refill, [list(b) for b in self.buckets], self._mask, self._count
+            )
+        for bucket in self.buckets:
+            bucket.clear()
+        self._mask = 0
+        self._count = 0
+
+    def drop_chain(self, root_id: int) -> int:
+        """
+        Remove the pending events descending from one root, the others keep
+        their order.
+
+        :return: Number of events removed.
+        """
+        if self.undo.recording:
+            self.undo.record(
+                self._refill, [list(b) for b in self.buckets], self._mask, self._count
+            )
+        mask = 0
+        count = 0
+        for level, bucket in enumerate(self.buckets):
+            kept = [event for event in bucket if event.root_id != root_id]
+            if len(kept) != len(bucket):
+                bucket.clear()
+                bucket.extend(kept)
+            if bucket:
+                mask |= 1 << level
+                count += len(bucket)
+        dropped = self._count - count
+        self._mask = mask
+        self._count = count
+        return dropped
 
     def __len__(self):
-        return sum(queue.qsize() for queue in self.queues)
+        return self._count
+
+    def __bool__(self):
+        return self._count > 0
 
 
 class ListenerPool:
     def __init__(self):
-        self.listeners: List[Listener] = []
-        self.source_map: Dict[str | None, List[Listener]] = {None: []}
-        self.on_event_group: Dict[str, List[Listener]] = {}
+        """
+        Keep track of registered listeners, indexed by source and by event.
+
+        Every index is an insertion-ordered dict used as an ordered set
+        (listener -> None), so registration order is preserved for dispatch
+        and a single listener is removed in constant time.
+        """
+        self.listeners: Dict[Listener, None] = {}
+        self.source_map: Dict[int | None, Dict[Listener, None]] = {None: {}}
+        # Keyed by event type code, subscriptions to a base class are
+        # expanded to the codes of all its subclasses at registration.
+        self.on_event_group: Dict[int, Dict[Listener, None]] = {}
+
+        # Position-ordered dispatch tables indexed by type code, rebuilt lazily.
+        self._dispatch: List[Tuple[Listener, ...] | None] = []
+        # Shared with the game, see EventManager.set_undo_log
+        self.undo: UndoLog = UndoLog()
 
     def register(self, listener: Listener):
-        self.listeners.append(listener)
-        if listener.source is None:
-            self.source_map[None].append(listener)
-        else:
-            sid = listener.source.id
-            if sid not in self.source_map:
-                self.source_map[sid] = []
-            self.source_map[sid].append(listener)
+        if self.undo.recording and listener not in self.listeners:
+            self.undo.record(self.unregister, listener)
+        self.listeners[listener] = None
+
+        sid = None if listener.source is None else listener.source.id
+        if sid not in self.source_map:
+            self.source_map[sid] = {}
+        self.source_map[sid][listener] = None
 
-        on_events = listener.on_events
-        for event_name in on_events:
-            if event_name not in self.on_event_group:
-                self.on_event_group[event_name] = []
-            self.on_event_group[event_name].append(listener)
+        listener.event_codes = EVENT_REGISTRY.codes_for(listener.on_events)
+        for code in listener.event_codes:
+            if code not in self.on_event_group:
+                self.on_event_group[code] = {}
+            self.on_event_group[code][listener] = None
+            self._invalidate(code)
+
+    def fork(
+        self, listeners: Dict[Listener, Listener], sources: Dict[Item, Item]
+    ) -> ListenerPool:
+        """
+        Copy the registrations for a forked game, with cloned listeners.
+
+        :param listeners: Clones made so far, by original, extended here.
+        :param sources: Clones of items by original, new clones bind to them.
+        """
+        for listener in self.listeners:
+            if listener not in listeners:
+                listeners[listener] = listener.fork(sources)
+
+        def remap(group: Dict[Listener, None]) -> Dict[Listener, None]:
+            return {listeners[listener]: None for listener in group}
+
+        clone = ListenerPool()
+        clone.listeners = remap(self.listeners)
+        clone.source_map = {sid: remap(g) for sid, g in self.source_map.items()}
+        clone.on_event_group = {
+            code: remap(group) for code, group in self.on_event_group.items()
+        }
+        # Dispatch tables are rebuilt on first use
+        return clone
 
     def unregister(self, listener: Listener):
-        if listener in self.listeners:
-            self.listeners.remove(listener)
+        if listener not in self.listeners:
+            return
+        sid = None if listener.source is None else listener.source.id
+        if self.undo.recording:
+            self._record_groups([listener], sid)
+        del self.listeners[listener]
+
+        group = self.source_map.get(sid)
+        if group is not None:
+            group.pop(listener, None)
+            if not group and sid is not None:
+                del self.source_map[sid]
+
+        self._drop_from_events(listener)
+
+    def unregister_source(self, source_id: int | None) -> List[Listener]:
+        """
+        Remove every listener owned by a source (Fighter or Env) at once.
+
+        :return: The listeners that were removed.
+        """
+        if self.undo.recording and self.source_map.get(source_id):
+            self._record_groups(list(self.source_map[source_id]), source_id)
+        group = self.source_map.pop(source_id, None)
+        if source_id is None:
+            self.source_map[None] = {}
+        if not group:
+            return []
 
-        if listener.source is None:
-            if listener in self.source_map[None]:
-                self.source_map[None].remove(listener)
+        for listener in group:
+            del self.listeners[listener]
+            self._drop_from_events(listener)
+        return list(group)
+
+    def _record_groups(self, listeners: List[Listener], sid: int | None):
+        """
+        Record how to register listeners of a source again, in their former
+        dispatch order. Groups are small, they are copied whole.
+        """
+        group = self.source_map.get(sid)
+        codes = {
+            code: dict(self.on_event_group[code])
+            for listener in listeners
+            for code in listener.event_codes
+            if code in self.on_event_group
+        }
+        self.undo.record(
+            self._reinstate,
+            listeners,
+            sid,
+            None if group is None else dict(group),
+            codes,
+        )
+
+    def _reinstate(
+        self,
+        listeners: List[Listener],
+        sid: int | None,
+        group: Dict[Listener, None] | None,
+        codes: Dict[int, Dict[Listener, None]],
+    ):
+        for listener in listeners:
+            self.listeners[listener] = None
+        if group is not None:
+            self.source_map[sid] = group
+        for code, members in codes.items():
+            self.on_event_group[code] = members
+            self._invalidate(code)
+
+    def _drop_from_events(self, listener: Listener):
+        for code in listener.event_codes:
+            group = self.on_event_group.get(code)
+            if group is not None:
+                group.pop(listener, None)
+            self._invalidate(code)
+
+    def _invalidate(self, type_code: int):
+        if type_code < len(self._dispatch):
+            self._dispatch[type_code] = None
+
+    def invalidate_source(self, source_id: int):
+        """
+        Drop the dispatch tables of every event the source listens to.
+        Called whenever the source changes position on the board.
+        """
+        for listener in self.source_map.get(source_id, ()):
+            for code in listener.event_codes:
+                self._invalidate(code)
+
+    def query_by_source(self, source_id: int | None) -> List[Listener]:
+        return list(self.source_map.get(source_id, ()))
+
+    def query_by_code(self, type_code: int) -> Tuple[Listener, ...]:
+        """
+        Get the listeners of an event type, ordered by their source's position.
+        """
+        dispatch = self._dispatch
+        if type_code < len(dispatch):
+            listeners = dispatch[type_code]
+            if listeners is not None:
+                return listeners
         else:
-            sid = listener.source.id
-            if sid in self.source_map and listener in self.source_map[sid]:
-                self.source_map[sid].remove(listener)
-
-        on_events = listener.on_events
-        for event_name in on_events:
-            if (
-                event_name in self.on_event_group
-                and listener in self.on_event_group[event_name]
-            ):
-                self.on_event_group[event_name].remove(listener)
-
-    def query_by_source(self, source_id: str | None) -> List[Listener]:
-        return self.source_map.get(source_id, [])
-
-    def query_by_event(self, event_name: str) -> List[Listener]:
-        listeners = self.on_event_group.get(event_name, [])
-        listeners.sort(key=lambda listener: listener.pos)
+            dispatch.extend([None] * (type_code + 1 - len(dispatch)))
+
+        group = self.on_event_group.get(type_code, ())
+        listeners = tuple(sorted(group, key=lambda listener: listener.pos))
+        dispatch[type_code] = listeners
         return listeners
 
+    def query_by_event(self, event_type: type[Event]) -> Tuple[Listener, ...]:
+        return self.query_by_code(event_type.type_code)
+
 
 class EventManager:
-    def __init__(self):
+    def __init__(
+        self, ids: IdAllocator | None = None, liveness: LivenessTable | None = None
+    ):
         self.listener_pool: ListenerPool = ListenerPool()
-        self.event_queue: EventQueue = EventQueue(levels=8)
+        self.event_queue: EventQueue = EventQueue(levels=8, ids=ids, liveness=liveness)
+        self.liveness: LivenessTable | None = liveness
 
-        self.MAX_STEPS = 1000  # Prevent infinite loops
+        # Trigger loops are caught by the cycle detector, this is only a backstop
+        self.MAX_STEPS = 100_000
+        self.cycle_detector: CycleDetector = CycleDetector()
+        self.cycle_reports: List[CycleReport] = []
+        # Event notify is resolving, the parent of the events it causes
+        self.running: Event | None = None
+
+        # Optional instrumentation, only consulted when set.
+        self.profiler: EventProfiler | None = None
+        # Optional append-only log of every executed event.
+        self.journal: EventJournal | None = None
+
+    def fork(
+        self,
+        item_manager: ItemManager,
+        listeners: Dict[Listener, Listener],
+        sources: Dict[Item, Item],
+    ) -> EventManager:
+        """
+        Copy the queue and registrations for a forked game.
+        Instrumentation (profiler, journal, cycle reports) stays with the original.
+
+        :param item_manager: The forked game's item manager.
+        :param listeners: Clones made by ItemManager.fork, by original.
+        :param sources: Clones of items made by ItemManager.fork, by original.
+        """
+        clone = EventManager.__new__(EventManager)
+        clone.liveness = item_manager.liveness
+        clone.listener_pool = self.listener_pool.fork(listeners, sources)
+        clone.event_queue = self.event_queue.fork(
+            self.event_queue.ids.fork(), item_manager.liveness
+        )
+        clone.MAX_STEPS = self.MAX_STEPS
+        clone.cycle_detector = self.cycle_detector.fork()
+        clone.cycle_reports = []
+        clone.running = None
+        clone.profiler = None
+        clone.journal = None
+        return clone
+
+    def set_undo_log(self, undo: UndoLog):
+        """
+        Record queue and registration changes into a game's undo log.
+        """
+        self.event_queue.undo = undo
+        self.listener_pool.undo = undo
 
     def register(self, listener: Listener):
+        if self.liveness is not None and listener.source is not None:
+            listener.source_gen = self.liveness.generation(listener.source.id)
         self.listener_pool.register(listener)
 
     def unregister(self, listener: Listener):
         self.listener_pool.unregister(listener)
 
+    def unregister_source(self, source_id: int):
+        self.listener_pool.unregister_source(source_id)
+
+    def on_source_moved(self, source_id: int):
+        self.listener_pool.invalidate_source(source_id)
+
+    def on_zone_changed(self, item_id: int, from_range: str, to_range: str):
+        """
+        Drop the item's listeners bound to the zone it left, keep its other
+        zone-bound listeners valid in the zone it entered, and queue a
+        ZoneChangedEvent for listeners reacting to the move.
+
+        The event is stamped with the item's generation after the move, so if
+        the item moves again or is removed before the event runs, notify drops
+        it as stale and only the latest move is reported.
+        """
+        pool = self.listener_pool
+        dying = ZONE_LIFETIMES.get(from_range)
+        generation = self.liveness.generation(item_id) if self.liveness else 0
+        for listener in pool.query_by_source(item_id):
+            if listener.lifetime == dying:
+                pool.unregister(listener)
+            elif listener.lifetime != Lifetime.PERMANENT:
+                pool.undo.set(listener, "source_gen", generation)
+        self.event_queue.put(
+            ZoneChangedEvent(item_id, from_range, to_range), self.running
+        )
+
     def notify(self, game: Game):
         temp_steps = 0
-        while len(self.event_queue) > 0 and temp_steps < self.MAX_STEPS:
-            current_event = self.event_queue.get()
-            if current_event is None or (
-                not game.item_manager.check_event_possible(current_event)
-            ):
+        current_event: Event | None = None
+        event_queue = self.event_queue
+        profiler = self.profiler
+        journal = self.journal
+        detector = self.cycle_detector
+        detector.reset()
+        if profiler is not None:
+            profiler.begin_notify(len(event_queue))
+
+        # A finished game resolves nothing more, see Game.finish
+        while event_queue and temp_steps < self.MAX_STEPS and game.is_running:
+            current_event = event_queue.get()
+            if current_event is None:
                 continue
+            if profiler is not None:
+                profiler.on_dequeue(current_event)
+            if not game.item_manager.check_event_possible(current_event):
+                continue
+
+            cycle = detector.observe(current_event, game)
+            if cycle is not None:
+                self._abort_chain(cycle, game)
+                continue
+            self.running = current_event
 
             temp_sequence: Events = []
-            listeners = self.listener_pool.query_by_event(current_event.name)
-            for listener in tuple(listeners):
-                if not listener.validate(game):
-                    continue
-                response = listener.handle(current_event, game)
-                temp_sequence.extend(response)
-                if listener.end:
-                    self.unregister(listener)
+            handler_time = 0.0
+            listeners = self.listener_pool.query_by_code(current_event.type_code)
+            if profiler is None:
+                for listener in listeners:
+                    if not listener.validate(game):
+                        continue
+                    response = listener.handle(current_event, game)
+                    temp_sequence.extend(response)
+                    if listener.end:
+                        self.unregister(listener)
+            else:
+                handler_start = perf_counter()
+                for listener in listeners:
+                    if not listener.validate(game):
+                        continue
+                    start = perf_counter()
+                    response = listener.handle(current_event, game)
+                    profiler.on_listener(listener, perf_counter() - start)
+                    temp_sequence.extend(response)
+                    if listener.end:
+                        self.unregister(listener)
+                handler_time = perf_counter() - handler_start
 
             if current_event.cancelled:
+                if profiler is not None:
+                    profiler.on_event(current_event, handler_time, 0.0)
                 continue
 
-            current_event_sequence = current_event.execute(game)
+            if profiler is None:
+                current_event_sequence = current_event.execute(game)
+            else:
+                execute_start = perf_counter()
+                current_event_sequence = current_event.execute(game)
+                profiler.on_event(
+                    current_event, handler_time, perf_counter() - execute_start
+                )
+
+            if journal is not None:
+                journal.append(current_event)
+
             temp_sequence.extend(current_event_sequence)
             for event in temp_sequence:
                 if event is not None:
-                    self.event_queue.put(event)
+                    event_queue.put(event, current_event)
+            if profiler is not None:
+                profiler.on_spawn(temp_sequence, len(event_queue))
             temp_steps += 1
+
+        self.running = None
+        if temp_steps >= self.MAX_STEPS:
+            report = CycleReport(
+                kind="limit",
+                period=0,
+                steps=temp_steps,
+                events=[],
+                root=current_event.root_id if current_event is not None else 0,
+            )
+            self._abort_chain(report, game)
+
+        if profiler is not None:
+            profiler.end_notify(len(event_queue))
+
+    def _abort_chain(self, report: CycleReport, game: Game):
+        """
+        Drop the pending events of the looping chain and keep a diagnostic
+        report, which headless games keep quiet about. Events of other chains
+        stay queued.
+        """
+        self.event_queue.drop_chain(report.root)
+        self.cycle_detector.forget(report.root)
+        self.event_queue.undo.record(self.cycle_reports.pop)
+        self.cycle_reports.append(report)
+        game._say(f"⚠️ Event chain aborted, {report}")
@@ -1,14 +1,21 @@
+from __future__ import annotations
+
 from app.core.event.event import Event
 from app.core.base import Faction
+from app.core.item.hero import Hero
+from app.core.item.target import Fighter
+from app.core.item.card import Card, EnvCard, FighterCard
+from app.core.item.position import Pos
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.core import Events
     from app.core.engine.game import Game
-    from app.core.item.card import Card
 
 
 class EndPhaseEvent(Event):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.priority = 6
@@ -18,16 +25,35 @@ class EndPhaseEvent(Event):
 
 
 class LaneCombatEndingEvent(Event):
+    __slots__ = ("lane_idx",)
+
     def __init__(self, lane_idx: int, **kwargs):
         super().__init__(**kwargs)
-        self.lane_id = lane_idx
+        self.lane_idx = lane_idx
         self.priority = 5
 
     def execute(self, game: Game) -> Events:
+        # Attacks in a lane are simultaneous, so the fallen only leave afterwards
+        item_manager = game.item_manager
+        targets = item_manager.get_lane_targets(self.lane_idx)
+        for fighter in targets["zombies"] + targets["plants"]:
+            if isinstance(fighter, Fighter) and fighter.state.IS_DESTROYED:
+                item_manager.destroy_fighter(fighter)
         return []
 
+    def to_record(self) -> tuple[int, int, int, int]:
+        return (self.source_id or 0, self.target_id or 0, self.lane_idx, self.priority)
+
+    @classmethod
+    def from_record(cls, source_id, target_id, amount, priority):
+        event = super().from_record(source_id, target_id, 0, priority)
+        event.lane_idx = amount
+        return event
+
 
 class LaneCombatStartingEvent(Event):
+    __slots__ = ("lane_idx",)
+
     def __init__(self, lane_idx: int, **kwargs):
         super().__init__(**kwargs)
         self.lane_idx = lane_idx
@@ -36,18 +62,155 @@ class LaneCombatStartingEvent(Event):
     def execute(self, game: Game) -> Events:
         return []
 
+    def to_record(self) -> tuple[int, int, int, int]:
+        return (self.source_id or 0, self.target_id or 0, self.lane_idx, self.priority)
+
+    @classmethod
+    def from_record(cls, source_id, target_id, amount, priority):
+        event = super().from_record(source_id, target_id, 0, priority)
+        event.lane_idx = amount
+        return event
+
 
 class AttackEvent(Event):
-    def __init__(self, attacker_id: str, defender_id: str, damage: int, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, attacker_id: int, defender_id: int, damage: int, **kwargs):
         super().__init__(**kwargs)
         self.source_id = attacker_id
         self.target_id = defender_id
         self.amount = damage
 
-    def execute(self, game: Game) -> Events: ...
+    def execute(self, game: Game) -> Events:
+        item_manager = game.item_manager
+        defender = item_manager.get_by_id(self.target_id)
+
+        if isinstance(defender, Hero):
+            if self.amount > 0:
+                game.undo.set(defender, "health", defender.health - self.amount)
+                if defender.health <= 0:
+                    game.finish(defender.faction.opponent)
+            return []
+        if not isinstance(defender, Fighter):
+            return []
+
+        state = defender.state
+        damage = self.amount - state.ABILITIES.ARMOURED
+        if damage <= 0:
+            return []
+        state.CURRENT_HEALTH -= damage
+        state.IS_DAMAGED = True
+
+        attacker = item_manager.get_by_id(self.source_id)
+        deadly = isinstance(attacker, Fighter) and attacker.state.ABILITIES.DEADLY
+        if state.CURRENT_HEALTH <= 0 or deadly:
+            # Taken off the board when its lane finishes fighting
+            state.IS_DESTROYED = True
+        return []
+
+
+class ZoneChangedEvent(Event):
+    __slots__ = ("from_range", "to_range")
+
+    def __init__(self, item_id: int, from_range: str, to_range: str, **kwargs):
+        super().__init__(**kwargs)
+        self.source_id = item_id
+        self.from_range = from_range
+        self.to_range = to_range
+        self.priority = 2
+
+    def execute(self, game: Game) -> Events:
+        return []
+
+    def to_record(self) -> tuple[int, int, int, int]:
+        from app.core.item.item_manager import ZONES
+
+        zone = ZONES.index(self.from_range) * len(ZONES) + ZONES.index(self.to_range)
+        return (self.source_id or 0, self.target_id or 0, zone, self.priority)
+
+    @classmethod
+    def from_record(cls, source_id, target_id, amount, priority):
+        from app.core.item.item_manager import ZONES
+
+        event = super().from_record(source_id, target_id, 0, priority)
+        from_zone, to_zone = divmod(amount, len(ZONES))
+        event.from_range = ZONES[from_zone]
+        event.to_range = ZONES[to_zone]
+        return event
+
+
+class TurnStartingEvent(Event):
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.priority = 7
+
+    def execute(self, game: Game) -> Events:
+        # One more energy every turn
+        for player in (game.zombie_player, game.plant_player):
+            game.undo.set(player, "energy", game.turn_count)
+        # Opening hands are dealt before the first turn
+        if game.turn_count > 1:
+            for faction in (Faction.ZOMBIE, Faction.PLANT):
+                game.item_manager.draw(faction)
+        return []
+
+
+class TurnEndingEvent(Event):
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.priority = 7
+
+    def execute(self, game: Game) -> Events:
+        # Unspent energy is lost
+        for player in (game.zombie_player, game.plant_player):
+            game.undo.set(player, "energy", 0)
+        return []
+
+
+class PlayCardEvent(Event):
+    __slots__ = ()
+
+    def __init__(self, card_id: int, pos_id: int, **kwargs):
+        super().__init__(**kwargs)
+        self.source_id = card_id
+        self.target_id = pos_id
+
+    def execute(self, game: Game) -> Events:
+        from app.core.item.item_manager import GRAVEYARD_RANGES, HAND_RANGES
+
+        item_manager = game.item_manager
+        card = item_manager.get_by_id(self.source_id)
+        pos = item_manager.get_by_id(self.target_id)
+        if not isinstance(card, Card) or not isinstance(pos, Pos):
+            return []
+
+        player = game.player_of(card.faction)
+        game.undo.set(player, "energy", player.energy - card.cost)
+        card.deactivate()
+        if isinstance(card, FighterCard):
+            # Not tracked yet, so not watched either
+            game.undo.set(card.fighter.state, "IN_FIELD", True)
+            item_manager.land_fighter(card.fighter, pos)
+        elif isinstance(card, EnvCard):
+            lane = item_manager.get_lane(pos.lane)
+            if lane is not None:
+                item_manager.cover_env(card.env, lane)
+        item_manager.move(card.id, GRAVEYARD_RANGES[card.faction])
+
+        # Cards the player can no longer afford
+        for other in item_manager[HAND_RANGES[card.faction]]:
+            if other.cost > player.energy:
+                other.deactivate(card.faction)
+        return []
 
 
 class CombatPhaseStartingEvent(Event):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.priority = 6
@@ -57,6 +220,8 @@ class CombatPhaseStartingEvent(Event):
 
 
 class CombatPhaseEndingEvent(Event):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.priority = 6
@@ -66,17 +231,15 @@ class CombatPhaseEndingEvent(Event):
 
 
 class ZombiePhaseStartingEvent(Event):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.priority = 6
 
     def execute(self, game: Game) -> Events:
         energy = game.zombie_player.energy
-
-        def playable(card: Card):
-            return card.cost <= energy and card.subtype == "FighterCard"
-
-        playable_cards = game.item_manager.filter(playable, ["z_hand"])
+        playable_cards = game.item_manager.playable("z_hand", energy, ["FighterCard"])
 
         game.item_manager._activate_end_phase_button(Faction.ZOMBIE)
         game.item_manager.activate(playable_cards, Faction.ZOMBIE)
@@ -85,6 +248,8 @@ class ZombiePhaseStartingEvent(Event):
 
 
 class ZombiePhaseEndingEvent(Event):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.priority = 6
@@ -97,17 +262,15 @@ class ZombiePhaseEndingEvent(Event):
 
 
 class PlantPhaseStartingEvent(Event):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.priority = 6
 
     def execute(self, game: Game) -> Events:
         energy = game.plant_player.energy
-
-        def playable(card: Card):
-            return card.cost <= energy
-
-        playable_cards = game.item_manager.filter(playable, ["p_hand"])
+        playable_cards = game.item_manager.playable("p_hand", energy)
         game.item_manager._activate_end_phase_button(Faction.PLANT)
         game.item_manager.activate(playable_cards, Faction.PLANT)
 
@@ -115,6 +278,8 @@ class PlantPhaseStartingEvent(Event):
 
 
 class PlantPhaseEndingEvent(Event):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.priority = 6
@@ -127,17 +292,17 @@ class PlantPhaseEndingEvent(Event):
 
 
 class ZombieTrickPhaseStartingEvent(Event):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.priority = 6
 
     def execute(self, game: Game) -> Events:
         energy = game.zombie_player.energy
-
-        def playable(card: Card):
-            return card.cost <= energy and card.subtype in ["TrickCard", "EnvCard"]
-
-        playable_cards = game.item_manager.filter(playable, ["z_hand"])
+        playable_cards = game.item_manager.playable(
+            "z_hand", energy, ["TrickCard", "EnvCard"]
+        )
         game.item_manager._activate_end_phase_button(Faction.ZOMBIE)
         game.item_manager.activate(playable_cards, Faction.ZOMBIE)
 
@@ -145,6 +310,8 @@ class ZombieTrickPhaseStartingEvent(Event):
 
 
 class ZombieTrickPhaseEndingEvent(Event):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.priority = 6
@@ -0,0 +1,214 @@
+"""
+An event journal is a compact, append-only binary log of one game.
+EventManager.notify appends every event it executes, Game appends every phase
+transition, and that is enough for ReplayEngine to rebuild the game later.
+
+Layout: a 4-byte magic header followed by little-endian records, each starting
+with a one-byte kind.
+- TYPE  (kind 0): code u16, name length u8, utf-8 name. Declares an event type
+  (by its full `type_path`) the first time it is journaled, so the log stays
+  self-describing and independent of the in-process type codes.
+- EVENT (kind 1): code u16, priority u8, source u32, target u32, amount i32.
+  Absent source/target ids are stored as 0, which is never allocated.
+- PHASE (kind 2): phase u8, turn u32.
+- SETUP (kind 3): seed, then for each faction its deck, card count u16 and
+  card ids, all as length-prefixed (u8) utf-8 strings. Written before anything
+  else by headless.new_game, so a replay can rebuild the game it started from.
+"""
+
+from __future__ import annotations
+
+from struct import Struct
+from typing import NamedTuple, TYPE_CHECKING
+
+from app.core.base import Faction, GamePhase
+
+if TYPE_CHECKING:
+    from typing import BinaryIO, Dict, Iterator, List, Sequence
+    from app.core.event.event import Event
+
+
+MAGIC = b"CGJ\x01"
+
+KIND_TYPE = 0
+KIND_EVENT = 1
+KIND_PHASE = 2
+KIND_SETUP = 3
+
+_TYPE = Struct("<BHB")
+_EVENT = Struct("<BHBIIi")
+_PHASE = Struct("<BBI")
+_LENGTH = Struct("<B")
+_COUNT = Struct("<H")
+
+# Deck order of SETUP records
+SETUP_FACTIONS = (Faction.ZOMBIE, Faction.PLANT)
+
+_PHASES: List[GamePhase] = list(GamePhase)
+_PHASE_CODES: Dict[GamePhase, int] = {phase: i for i, phase in enumerate(_PHASES)}
+
+
+class EventRecord(NamedTuple):
+    name: str
+    source_id: int | None
+    target_id: int | None
+    amount: int
+    priority: int
+
+
+class PhaseRecord(NamedTuple):
+    phase: GamePhase
+    turn: int
+
+
+class SetupRecord(NamedTuple):
+    seed: int
+    # Card ids of each faction's deck, in deck list order
+    decks: Dict[Faction, List[str]]
+
+
+class JournalError(ValueError):
+    pass
+
+
+class EventJournal:
+    def __init__(self, stream: BinaryIO | None = None):
+        """
+        Set up a journal writer.
+
+        :param stream: Binary stream to append to. When omitted, records are
+            kept in memory and can be read back with `getvalue`.
+        """
+        self.stream = stream
+        self.buffer = bytearray(MAGIC)
+        self.type_codes: Dict[str, int] = {}
+        self.records: int = 0
+
+    def _type_code(self, name: str) -> int:
+        code = self.type_codes.get(name)
+        if code is None:
+            code = len(self.type_codes)
+            self.type_codes[name] = code
+            encoded = name.encode()
+            self.buffer += _TYPE.pack(KIND_TYPE, code, len(encoded))
+            self.buffer += encoded
+        return code
+
+    def append(self, event: Event):
+        source, target, amount, priority = event.to_record()
+        code = self._type_code(event.type_path)
+        self.buffer += _EVENT.pack(KIND_EVENT, code, priority, source, target, amount)
+        self.records += 1
+
+    def append_phase(self, phase: GamePhase, turn: int):
+        self.buffer += _PHASE.pack(KIND_PHASE, _PHASE_CODES[phase], turn)
+        self.records += 1
+
+    def append_setup(self, seed: int, decks: Dict[Faction, Sequence[str]]):
+        """
+        Record how the game was set up: its seed and the card ids of each deck.
+        """
+        self.buffer.append(KIND_SETUP)
+        self._append_text(str(seed))
+        for faction in SETUP_FACTIONS:
+            card_ids = decks.get(faction, ())
+            self.buffer += _COUNT.pack(len(card_ids))
+            for card_id in card_ids:
+                self._append_text(card_id)
+        self.records += 1
+
+    def _append_text(self, text: str):
+        encoded = text.encode()
+        if len(encoded) > 255:
+            raise JournalError(f"{text[:20]!r}... is too long to journal.")
+        self.buffer += _LENGTH.pack(len(encoded))
+        self.buffer += encoded
+
+    def flush(self):
+        """
+        Move buffered records to the stream, if there is one.
+        """
+        if self.stream is None:
+            return
+        self.stream.write(self.buffer)
+        self.stream.flush()
+        self.buffer = bytearray()
+
+    def getvalue(self) -> bytes:
+        if self.stream is not None:
+            raise JournalError("Journal is backed by a stream, read it from there.")
+        return bytes(self.buffer)
+
+
+class JournalReader:
+    def __init__(self, data: bytes):
+        """
+        Decode a journal produced by EventJournal.
+        """
+        if data[: len(MAGIC)] != MAGIC:
+            raise JournalError("Not an event journal.")
+        self.data = memoryview(data)
+
+    def __iter__(self) -> Iterator[EventRecord | PhaseRecord | SetupRecord]:
+        data = self.data
+        size = len(data)
+        offset = len(MAGIC)
+        names: Dict[int, str] = {}
+        unpack_event = _EVENT.unpack_from
+        event_size = _EVENT.size
+
+        while offset < size:
+            kind = data[offset]
+            if kind == KIND_EVENT:
+                _, code, priority, source, target, amount = unpack_event(data, offset)
+                offset += event_size
+                yield EventRecord(
+                    names[code], source or None, target or None, amount, priority
+                )
+            elif kind == KIND_PHASE:
+                _, phase, turn = _PHASE.unpack_from(data, offset)
+                offset += _PHASE.size
+                yield PhaseRecord(_PHASES[phase], turn)
+            elif kind == KIND_SETUP:
+                record, offset = self._read_setup(offset + 1)
+                yield record
+            elif kind == KIND_TYPE:
+                _, code, length = _TYPE.unpack_from(data, offset)
+                offset += _TYPE.size
+                names[code] = bytes(data[offset : offset + length]).decode()
+                offset += length
+            else:
+                raise JournalError(f"Unknown record kind {kind} at byte {offset}.")
+
+    def _read_text(self, offset: int) -> tuple[str, int]:
+        (length,) = _LENGTH.unpack_from(self.data, offset)
+        offset += _LENGTH.size
+        return bytes(self.data[offset : offset + length]).decode(), offset + length
+
+    def _read_setup(self, offset: int) -> tuple[SetupRecord, int]:
+        seed, offset = self._read_text(offset)
+        decks: Dict[Faction, List[str]] = {}
+        for faction in SETUP_FACTIONS:
+            (count,) = _COUNT.unpack_from(self.data, offset)
+            offset += _COUNT.size
+            card_ids = decks[faction] = []
+            for _ in range(count):
+                card_id, offset = self._read_text(offset)
+                card_ids.append(card_id)
+        return SetupRecord(int(seed), decks), offset
+
+    def setup(self) -> SetupRecord | None:
+        """
+        How the journaled game was set up, None if the journal does not say.
+        """
+        for record in self:
+            return record if isinstance(record, SetupRecord) else None
+        return None
+
+    def events(self) -> Iterator[EventRecord]:
+        """
+        Iterate over event records only, e.g. for analytics.
+        """
+        for record in self:
+            if isinstance(record, EventRecord):
+                yield record
@@ -1,28 +1,54 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from .event import Event
+from .event import EVENT_REGISTRY, Event
 from app.core.base import Lifetime
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import List
+    from typing import Dict, Tuple
     from .event import Events
     from app.core.engine.game import Game
+    from app.core.item.item import Item
 from app.core.item.target import Fighter, Env
 
 
 class Listener(ABC):
     def __init__(self, **kwargs):
         self.source: Fighter | Env | None = kwargs.get("source", None)
-        self.on_events: List[str] = kwargs.get("on_events", [])
+        # Event classes listened to, subclasses included. Bare class names are
+        # still accepted and resolved once, here.
+        self.on_events: Tuple[type[Event], ...] = tuple(
+            EVENT_REGISTRY.resolve(event_type)
+            for event_type in kwargs.get("on_events", [])
+        )
+        # Expanded type codes, set by ListenerPool.register
+        self.event_codes: Tuple[int, ...] = ()
         self.lifetime: Lifetime = kwargs.get("lifetime", Lifetime.ONCE)
         self.end: bool = False
 
+        # Liveness generation of the source, stamped by EventManager.register
+        self.source_gen: int = 0
+
+    def fork(self, sources: Dict[Item, Item]) -> Listener:
+        """
+        Clone the listener for a forked game, bound to the cloned source.
+        Subclasses that keep mutable state of their own copy it here.
+
+        :param sources: Clones of items by original, from ItemManager.fork.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        if self.source is not None:
+            clone.source = sources.get(self.source, self.source)  # type: ignore
+        return clone
+
     @abstractmethod
     def respond(self, event: Event, game: Game) -> Events:
         pass
 
     def handle(self, event: Event, game: Game) -> Events:
-        if event.name in self.on_events:
+        if isinstance(event, self.on_events):
             response = self.respond(event, game)
             if response:
                 if self.lifetime == Lifetime.ONCE:
@@ -51,8 +77,8 @@ class Listener(ABC):
         if self.source is None:
             return True
 
-        source_id = self.source.id
-        if source_id in game.item_manager._indices:
-            return True
-
-        return False
+        liveness = game.item_manager.liveness
+        if self.lifetime == Lifetime.PERMANENT:
+            return liveness.is_alive(self.source.id)
+        # Zone-bound listeners die with the zone their source was in
+        return liveness.check(self.source.id, self.source_gen)
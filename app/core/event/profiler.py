@@ -0,0 +1,142 @@
+"""
+An event profiler is a pluggable hook that observes EventManager.notify.
+It is attached by setting `EventManager.profiler`, and notify only calls into it
+when one is attached, so a game without a profiler pays nothing for it.
+
+What is measured:
+- per event type: how many were executed, time spent in `execute` and in listeners.
+- per card: listener time attributed to the card that owns the listener.
+- per notify call: steps, deepest event chain and the queue's high-water mark.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Deque, Dict, Iterable, List
+    from app.core.event.event import Event
+    from app.core.event.listener import Listener
+
+
+GLOBAL_OWNER = "<global>"
+
+
+@dataclass
+class EventTypeStats:
+    count: int = 0
+    cancelled: int = 0
+    execute_time: float = 0.0
+    handler_time: float = 0.0
+
+
+@dataclass
+class CardStats:
+    calls: int = 0
+    handler_time: float = 0.0
+
+
+@dataclass
+class NotifyStats:
+    steps: int = 0
+    max_chain_depth: int = 0
+    queue_high_water: int = 0
+    elapsed: float = 0.0
+
+
+class EventProfiler:
+    def __init__(self, history: int = 256):
+        """
+        Accumulate timings across notify calls until `reset` is called.
+
+        :param history: How many per-notify records to keep.
+        """
+        self.event_stats: Dict[str, EventTypeStats] = {}
+        self.card_stats: Dict[str, CardStats] = {}
+        self.notify_stats: Deque[NotifyStats] = deque(maxlen=history)
+
+        self._current: NotifyStats = NotifyStats()
+        self._started: float = 0.0
+        self._depth: Dict[int, int] = {}  # queued event id -> chain depth
+        self._event_depth: int = 0
+
+    # --- Hooks called by EventManager.notify ---
+
+    def begin_notify(self, pending: int):
+        self._current = NotifyStats(queue_high_water=pending)
+        self._started = perf_counter()
+
+    def on_dequeue(self, event: Event):
+        # Events queued from outside notify (actions, phases) start a chain.
+        depth = self._depth.pop(event.id, 1)
+        self._event_depth = depth
+        if depth > self._current.max_chain_depth:
+            self._current.max_chain_depth = depth
+
+    def on_listener(self, listener: Listener, elapsed: float):
+        owner = self.owner_of(listener)
+        stats = self.card_stats.get(owner)
+        if stats is None:
+            stats = self.card_stats[owner] = CardStats()
+        stats.calls += 1
+        stats.handler_time += elapsed
+
+    def on_event(self, event: Event, handler_time: float, execute_time: float):
+        name = event.name
+        stats = self.event_stats.get(name)
+        if stats is None:
+            stats = self.event_stats[name] = EventTypeStats()
+        stats.count += 1
+        stats.handler_time += handler_time
+        if event.cancelled:
+            stats.cancelled += 1
+        else:
+            stats.execute_time += execute_time
+        self._current.steps += 1
+
+    def on_spawn(self, events: Iterable[Event | None], pending: int):
+        depth = self._event_depth + 1
+        for event in events:
+            if event is not None:
+                self._depth[event.id] = depth
+        if pending > self._current.queue_high_water:
+            self._current.queue_high_water = pending
+
+    def end_notify(self, pending: int):
+        self._current.elapsed = perf_counter() - self._started
+        self.notify_stats.append(self._current)
+        if not pending:
+            self._depth.clear()
+
+    # --- Reporting ---
+
+    @staticmethod
+    def owner_of(listener: Listener) -> str:
+        source = listener.source
+        if source is None:
+            return GLOBAL_OWNER
+        return source.proto_card.config.name
+
+    def slowest_cards(self, limit: int = 10) -> List[tuple[str, CardStats]]:
+        ranked = sorted(
+            self.card_stats.items(), key=lambda kv: kv[1].handler_time, reverse=True
+        )
+        return ranked[:limit]
+
+    def slowest_events(self, limit: int = 10) -> List[tuple[str, EventTypeStats]]:
+        ranked = sorted(
+            self.event_stats.items(),
+            key=lambda kv: kv[1].execute_time + kv[1].handler_time,
+            reverse=True,
+        )
+        return ranked[:limit]
+
+    def reset(self):
+        self.event_stats.clear()
+        self.card_stats.clear()
+        self.notify_stats.clear()
+        self._depth.clear()
@@ -0,0 +1,67 @@
+"""
+Identity of items and events inside a game.
+
+Every game owns an IdAllocator that hands out small, monotonic integers.
+Ids are never reused within a game, so the same sequence of operations always
+yields the same ids, and integers are cheap to create, hash and compare.
+The frontend still speaks strings, so ids are only rendered when serialized.
+"""
+
+from __future__ import annotations
+
+
+class IdAllocator:
+    def __init__(self, start: int = 1):
+        """
+        Set up a monotonic id counter for one game.
+
+        :param start: First id to hand out. 0 is reserved for "not assigned yet".
+        """
+        self._next: int = start
+
+    def allocate(self) -> int:
+        uid = self._next
+        self._next += 1
+        return uid
+
+    def fork(self) -> IdAllocator:
+        """
+        Copy the counter for a forked game, both continue independently.
+        """
+        return IdAllocator(self._next)
+
+    @property
+    def next_id(self) -> int:
+        return self._next
+
+    def rewind(self, next_id: int):
+        """
+        Hand out ids from `next_id` again, once whatever took the later ones
+        has been undone. Ids stay unique among the items still in the game.
+        """
+        self._next = next_id
+
+    @property
+    def allocated(self) -> int:
+        """
+        Number of ids handed out so far.
+        """
+        return self._next - 1
+
+
+def render_id(uid: int) -> str:
+    """
+    Render an id for the frontend.
+    """
+    return str(uid)
+
+
+def parse_id(text: str | int) -> int:
+    """
+    Parse an id sent back by the frontend.
+    Raises ValueError for anything that is not a rendered id.
+    """
+    uid = int(text)
+    if uid <= 0:
+        raise ValueError(f"Invalid id: {text!r}")
+    return uid
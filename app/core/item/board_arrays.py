@@ -0,0 +1,202 @@
+"""
+A compact, array-backed mirror of the board, for simulation and AI.
+
+The object board (Pos, Lane, Board, Fighter) stays the source of truth. BoardArrays
+keeps fixed-shape NumPy arrays over lanes x slots x faction next to it and is
+updated through the ItemManager hooks, so whole-board questions ("which lanes
+can still take a zombie?", "where is every frontier?") are single array
+operations instead of walks over Python objects.
+
+NumPy is an optional dependency (the `sim` extra); only this module needs it.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.core.base import ABILITY_BITS, Faction
+from app.core.item.target import Fighter, Env
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple
+    from app.core.item.item_manager import ItemManager
+
+
+ZOMBIE = 0
+PLANT = 1
+
+FACTION_INDEX: Dict[Faction, int] = {Faction.ZOMBIE: ZOMBIE, Faction.PLANT: PLANT}
+
+# Mirrored state fields and the arrays holding them
+STATE_ARRAYS: Dict[str, str] = {
+    "CURRENT_STRENGTH": "strength",
+    "CURRENT_HEALTH": "health",
+}
+
+
+class BoardArrays:
+    def __init__(self, num_lanes: int = 5, slots: int = 2):
+        """
+        Set up empty board arrays.
+
+        :param num_lanes: Number of lanes on the board.
+        :param slots: Positions per lane and faction (plants have 2, zombies 1).
+        """
+        shape = (num_lanes, slots, 2)
+        self.num_lanes = num_lanes
+        self.slots = slots
+
+        # Item id of the occupying fighter, 0 when vacant
+        self.occupant = np.zeros(shape, dtype=np.int32)
+        self.strength = np.zeros(shape, dtype=np.int16)
+        self.health = np.zeros(shape, dtype=np.int16)
+        self.abilities = np.zeros(shape, dtype=np.uint32)
+        self.armour = np.zeros(shape, dtype=np.int16)
+        # Slots that exist at all, zombies only use the first one
+        self.valid = np.ones(shape, dtype=bool)
+        self.valid[:, 1:, ZOMBIE] = False
+        # Item id of the environment covering each lane, 0 when uncovered
+        self.env = np.zeros(num_lanes, dtype=np.int32)
+
+        self._slot_of: Dict[int, Tuple[int, int, int]] = {}
+        self._env_lane: Dict[int, int] = {}
+
+    @classmethod
+    def from_item_manager(cls, item_manager: ItemManager) -> BoardArrays:
+        """
+        Build arrays for a board and keep them in sync through its hooks.
+        """
+        arrays = cls(num_lanes=max(item_manager.num_lanes, 1))
+        arrays.resync(item_manager)
+
+        def on_moved(item_id: int):
+            item = item_manager.get_by_id(item_id)
+            if isinstance(item, Fighter):
+                arrays.sync_fighter(item)
+            elif isinstance(item, Env):
+                arrays.sync_env(item)
+
+        item_manager.move_hooks.append(on_moved)
+        item_manager.teardown_hooks.append(arrays.clear_item)
+        return arrays
+
+    # --- Synchronization ---
+
+    def resync(self, item_manager: ItemManager):
+        """
+        Mirror every fighter and environment again.
+        """
+        for item_id in list(self._slot_of) + list(self._env_lane):
+            self.clear_item(item_id)
+        for fighter in item_manager.fighters:
+            self.sync_fighter(fighter)
+        for env in item_manager.envs:
+            self.sync_env(env)
+
+    def sync_fighter(self, fighter: Fighter):
+        """
+        Mirror a fighter's position and current stats. ItemManager calls this
+        when a tracked fighter moves or is reindexed, see also `sync_state`.
+        """
+        self.clear_item(fighter.id)
+        pos = fighter.on_pos
+        if pos is None:
+            return
+        slot = (pos.lane, pos.index - 1, FACTION_INDEX[pos.faction])
+        state = fighter.state
+        self.occupant[slot] = fighter.id
+        self.strength[slot] = state.CURRENT_STRENGTH
+        self.health[slot] = state.CURRENT_HEALTH
+        self.abilities[slot] = state.ABILITIES.flags
+        self.armour[slot] = state.ABILITIES.ARMOURED
+        self._slot_of[fighter.id] = slot
+
+    def sync_state(self, fighter: Fighter, name: str, value):
+        """
+        Mirror a write to a fighter's state, which FighterState reports before
+        the attribute is set: `value` is the one being written.
+        """
+        slot = self._slot_of.get(fighter.id)
+        if slot is None:
+            return
+        if name == "ABILITIES":
+            self.abilities[slot] = value.flags
+            self.armour[slot] = value.ARMOURED
+        elif name in STATE_ARRAYS:
+            getattr(self, STATE_ARRAYS[name])[slot] = value
+
+    def sync_env(self, env: Env):
+        self.clear_item(env.id)
+        if env.on_lane is None:
+            return
+        self.env[env.on_lane.lane] = env.id
+        self._env_lane[env.id] = env.on_lane.lane
+
+    def clear_item(self, item_id: int):
+        slot = self._slot_of.pop(item_id, None)
+        if slot is not None and self.occupant[slot] == item_id:
+            self.occupant[slot] = 0
+            self.strength[slot] = 0
+            self.health[slot] = 0
+            self.abilities[slot] = 0
+            self.armour[slot] = 0
+        lane = self._env_lane.pop(item_id, None)
+        if lane is not None and self.env[lane] == item_id:
+            self.env[lane] = 0
+
+    # --- Lane queries ---
+
+    @property
+    def occupied(self) -> np.ndarray:
+        return self.occupant != 0
+
+    def is_empty(self, lane: int, faction: Faction) -> bool:
+        return not self.occupied[lane, :, FACTION_INDEX[faction]].any()
+
+    def is_full(self, lane: int, faction: Faction) -> bool:
+        f = FACTION_INDEX[faction]
+        return bool((self.occupied[lane, :, f] | ~self.valid[lane, :, f]).all())
+
+    def frontier_slots(self, faction: Faction) -> np.ndarray:
+        """
+        Frontier slot index of every lane for a faction, -1 for empty lanes.
+        """
+        occupied = self.occupied[:, :, FACTION_INDEX[faction]]
+        first = occupied.argmax(axis=1)
+        return np.where(occupied.any(axis=1), first, -1)
+
+    def get_frontier_pos(self, lane: int, faction: Faction) -> int | None:
+        """
+        Frontier slot of one lane as a Pos index (1-based), None when empty.
+        """
+        slot = int(self.frontier_slots(faction)[lane])
+        return None if slot < 0 else slot + 1
+
+    def vacant_lanes(self, faction: Faction) -> np.ndarray:
+        """
+        Indices of lanes that still have a free slot for the faction.
+        """
+        f = FACTION_INDEX[faction]
+        free = ~self.occupied[:, :, f] & self.valid[:, :, f]
+        return np.flatnonzero(free.any(axis=1))
+
+    def empty_lanes(self, faction: Faction) -> np.ndarray:
+        return np.flatnonzero(~self.occupied[:, :, FACTION_INDEX[faction]].any(axis=1))
+
+    def with_ability(self, name: str) -> np.ndarray:
+        """
+        Mask of slots holding a fighter with the given boolean ability.
+        """
+        return (self.abilities & ABILITY_BITS[name]) != 0
+
+    def lane_strength(self, faction: Faction) -> np.ndarray:
+        return self.strength[:, :, FACTION_INDEX[faction]].sum(axis=1)
+
+    def occupants(self, faction: Faction) -> List[int]:
+        return [
+            int(item_id)
+            for item_id in self.occupant[:, :, FACTION_INDEX[faction]].ravel()
+            if item_id
+        ]
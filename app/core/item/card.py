@@ -1,13 +1,26 @@
+from __future__ import annotations
+
 from app.core.item.item import Item
 from app.core.item.target import Fighter, Env
 from app.core.base import CardConfig
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Dict
     from app.core.event.listener import Listener
 
 
 class Card(Item):
+    __slots__ = (
+        "subtype",
+        "config",
+        "name",
+        "faction",
+        "cost",
+        "art_path",
+        "abilities",
+    )
+
     def __init__(self, card_config: CardConfig, **kwargs):
         super().__init__(**kwargs)
         self.type = "Card"
@@ -26,22 +39,44 @@ class Card(Item):
 
 
 class FighterCard(Card):
+    __slots__ = ("fighter",)
+
     def __init__(self, card_config: CardConfig, fighter: Fighter, **kwargs):
         super().__init__(card_config, **kwargs)
         self.subtype = "FighterCard"
 
         self.fighter = fighter
 
+    def relink(self, items: Dict[int, Item]):
+        fighter = items.get(self.fighter.id) if self.fighter.id else None
+        if fighter is None:
+            # Not in play, the fighter belongs to the card alone: clone it too
+            fighter = self.fighter.fork()
+            fighter.proto_card = self
+        self.fighter = fighter  # type: ignore
+
 
 class EnvCard(Card):
+    __slots__ = ("env",)
+
     def __init__(self, card_config: CardConfig, env: Env, **kwargs):
         super().__init__(card_config, **kwargs)
         self.subtype = "EnvCard"
 
         self.env = env
 
+    def relink(self, items: Dict[int, Item]):
+        env = items.get(self.env.id) if self.env.id else None
+        if env is None:
+            # Not in play, the env belongs to the card alone: clone it too
+            env = self.env.fork()
+            env.proto_card = self
+        self.env = env  # type: ignore
+
 
 class TrickCard(Card):
+    __slots__ = ()
+
     def __init__(self, card_config: CardConfig, **kwargs):
         super().__init__(card_config, **kwargs)
         self.subtype = "TrickCard"
@@ -0,0 +1,119 @@
+"""
+A deck is the draw order of one deck range.
+The range view says which cards are in the deck, the deck says in which order:
+card ids are kept in a list whose end is the top, so drawing and putting a card
+on top are constant time. Shuffles use the deck's own seeded generator and
+random insertions the game's effects stream, so a game started from the same
+seed draws the same cards.
+"""
+
+from __future__ import annotations
+
+from random import Random
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List, Tuple
+
+
+class Deck:
+    __slots__ = ("range", "rng", "effects", "_cards")
+
+    def __init__(
+        self, range: str, rng: Random | None = None, effects: Random | None = None
+    ):
+        """
+        :param range: The ItemManager range this deck orders.
+        :param rng: Generator for shuffles.
+        :param effects: Generator for random insertions, the game's EFFECTS
+            stream: they are card effects, not shuffles.
+        """
+        self.range = range
+        self.rng: Random = rng if rng is not None else Random()
+        self.effects: Random = effects if effects is not None else Random()
+        self._cards: List[int] = []
+
+    def fork(self, rng: Random, effects: Random) -> Deck:
+        """
+        Copy the deck for a forked game, drawing from the fork's generators.
+        """
+        clone = Deck(self.range, rng, effects)
+        clone._cards = self._cards.copy()
+        return clone
+
+    def put(self, card_id: int):
+        """
+        Put a card on top.
+        """
+        self._cards.append(card_id)
+
+    def insert(self, card_id: int, depth: int | None = None):
+        """
+        Insert a card `depth` cards below the top, at a random depth if None.
+        """
+        cards = self._cards
+        if depth is None:
+            depth = self.effects.randint(0, len(cards))
+        depth = min(max(depth, 0), len(cards))
+        cards.insert(len(cards) - depth, card_id)
+
+    def remove(self, card_id: int):
+        cards = self._cards
+        if cards and cards[-1] == card_id:
+            cards.pop()
+        elif card_id in cards:
+            cards.remove(card_id)
+
+    def position(self, card_id: int) -> int:
+        """
+        Index of a card from the bottom, see `restore`.
+        """
+        return self._cards.index(card_id)
+
+    def restore(self, card_id: int, position: int):
+        """
+        Put a card back at the index it had from the bottom.
+        """
+        self._cards.insert(position, card_id)
+
+    def getstate(self) -> Tuple[List[int], object, object]:
+        """
+        The draw order and the generators' states, for `setstate`.
+        """
+        return self._cards.copy(), self.rng.getstate(), self.effects.getstate()
+
+    def setstate(self, state: Tuple[List[int], object, object]):
+        cards, rng_state, effects_state = state
+        self._cards = cards.copy()
+        self.rng.setstate(rng_state)
+        self.effects.setstate(effects_state)
+
+    def draw(self) -> int | None:
+        """
+        Take the top card off the deck.
+        """
+        return self._cards.pop() if self._cards else None
+
+    def peek(self, count: int = 1) -> List[int]:
+        """
+        The top `count` cards, top first.
+        """
+        return self._cards[: -count - 1 : -1] if count > 0 else []
+
+    def shuffle(self):
+        # Fisher-Yates, drawing from the deck's generator only
+        cards = self._cards
+        randbelow = self.rng.randrange
+        for i in range(len(cards) - 1, 0, -1):
+            j = randbelow(i + 1)
+            cards[i], cards[j] = cards[j], cards[i]
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __iter__(self):
+        """
+        Card ids from the top down.
+        """
+        return reversed(self._cards)
@@ -3,6 +3,8 @@ from app.core.event.events import EndPhaseEvent
 
 
 class EndPhaseButton(Item):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.type = "EndPhaseButton"
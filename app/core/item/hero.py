@@ -1,8 +1,11 @@
 from app.core.item.item import Item
 from app.core.base import HeroConfig
+from dataclasses import fields
 
 
 class Hero(Item):
+    __slots__ = tuple(f.name for f in fields(HeroConfig))
+
     def __init__(self, hero_config: HeroConfig, **kwargs):
         super().__init__(**kwargs)
         self.type = "Hero"
@@ -0,0 +1,127 @@
+"""
+Secondary indexes answer attribute queries on a range without scanning it.
+A RangeView feeds its indexes as items enter and leave the range, and
+ItemManager.reindex refreshes an item whose indexed attributes changed in place
+(a cost reduction, an ability granted by a trick).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right, insort
+from sys import maxsize
+
+from app.core.base import ABILITY_NAMES
+from app.core.item.item import Item
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Tuple
+    from app.core.item.card import Card
+    from app.core.item.target import Fighter
+
+
+class SecondaryIndex:
+    name: str = "index"
+
+    def add(self, item: Item):
+        raise NotImplementedError
+
+    def discard(self, item_id: int):
+        raise NotImplementedError
+
+    def fork(self, items: Dict[int, Item]) -> SecondaryIndex:
+        """
+        The same index over the cloned items of a forked game.
+        """
+        raise NotImplementedError
+
+
+class CostIndex(SecondaryIndex):
+    """
+    Cards bucketed by subtype, each bucket sorted by cost.
+    """
+
+    name = "cost"
+
+    def __init__(self):
+        self._buckets: Dict[str, List[Tuple[int, int]]] = {}
+        self._keys: Dict[int, Tuple[str, int]] = {}
+        self._items: Dict[int, Card] = {}
+
+    def add(self, item: Item):
+        self.discard(item.id)
+        subtype, cost = item.subtype, item.cost  # type: ignore
+        insort(self._buckets.setdefault(subtype, []), (cost, item.id))
+        self._keys[item.id] = (subtype, cost)
+        self._items[item.id] = item  # type: ignore
+
+    def discard(self, item_id: int):
+        key = self._keys.pop(item_id, None)
+        if key is None:
+            return
+        subtype, cost = key
+        bucket = self._buckets[subtype]
+        del bucket[bisect_right(bucket, (cost, item_id)) - 1]
+        del self._items[item_id]
+
+    def fork(self, items: Dict[int, Item]) -> CostIndex:
+        clone = CostIndex()
+        clone._buckets = {key: bucket.copy() for key, bucket in self._buckets.items()}
+        clone._keys = self._keys.copy()
+        clone._items = {i: items[i] for i in self._items}  # type: ignore
+        return clone
+
+    def up_to(self, max_cost: int, subtypes: Iterable[str] | None = None) -> List[Card]:
+        """
+        Cards costing at most `max_cost`, cheapest first within each subtype.
+        """
+        if subtypes is None:
+            subtypes = self._buckets
+        items = self._items
+        result: List[Card] = []
+        for subtype in subtypes:
+            bucket = self._buckets.get(subtype)
+            if not bucket:
+                continue
+            end = bisect_right(bucket, (max_cost, maxsize))
+            result.extend(items[item_id] for _, item_id in bucket[:end])
+        return result
+
+
+class AbilityIndex(SecondaryIndex):
+    """
+    Fighters grouped by each ability they have.
+    """
+
+    name = "abilities"
+
+    def __init__(self):
+        self._by_ability: Dict[str, Dict[int, Fighter]] = {
+            name: {} for name in ABILITY_NAMES
+        }
+        self._abilities: Dict[int, Tuple[str, ...]] = {}
+
+    def add(self, item: Item):
+        self.discard(item.id)
+        ability = item.state.ABILITIES  # type: ignore
+        present = tuple(name for name in ABILITY_NAMES if getattr(ability, name))
+        for name in present:
+            self._by_ability[name][item.id] = item  # type: ignore
+        self._abilities[item.id] = present
+
+    def discard(self, item_id: int):
+        for name in self._abilities.pop(item_id, ()):
+            del self._by_ability[name][item_id]
+
+    def fork(self, items: Dict[int, Item]) -> AbilityIndex:
+        clone = AbilityIndex()
+        clone._by_ability = {
+            name: {item_id: items[item_id] for item_id in group}  # type: ignore
+            for name, group in self._by_ability.items()
+        }
+        clone._abilities = self._abilities.copy()
+        return clone
+
+    def having(self, name: str) -> List[Fighter]:
+        return list(self._by_ability[name].values())
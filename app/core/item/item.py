@@ -7,29 +7,109 @@ And also, items need to have an unique identity to distinguish them from others.
 Abstracting items help to manage game interactions in a unified way.
 """
 
-from uuid import uuid4
+from __future__ import annotations
+
 from abc import ABC
 from app.core.base import Faction
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Tuple
+    from app.core.item.item_manager import ItemManager
+
+
+# Activation is a two-bit mask, one bit per player
+ACTIVATION_BITS = {Faction.PLANT: 1, Faction.ZOMBIE: 2}
+
+_slot_names = {}
+_slot_members = {}
+
+
+def slot_names(cls: type) -> Tuple[str, ...]:
+    """
+    All slots declared along a class's MRO.
+    """
+    names = _slot_names.get(cls)
+    if names is None:
+        collected = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            collected.extend(s for s in slots if s not in ("__dict__", "__weakref__"))
+        names = _slot_names[cls] = tuple(collected)
+    return names
+
+
+def _members(cls: type) -> Tuple:
+    members = _slot_members.get(cls)
+    if members is None:
+        members = _slot_members[cls] = tuple(getattr(cls, n) for n in slot_names(cls))
+    return members
 
 
 class Item(ABC):
+    # Items are kept by the thousand per process, so they carry no __dict__
+    __slots__ = ("_activation", "id", "type", "manager")
+
     def __init__(self, **kwargs):
-        self.activated: dict[Faction, bool] = {
-            Faction.PLANT: False,
-            Faction.ZOMBIE: False,
-        }
-        self.id: str = str(uuid4())
+        self._activation: int = 0
+        self.id: int = 0  # Allocated by ItemManager when the item enters the game
         self.type: str = kwargs.get("type", "Item")
 
+        # Set by ItemManager.keep_track, lets items report state changes upward.
+        self.manager: ItemManager | None = None
+
+    @property
+    def activated(self) -> Dict[Faction, bool]:
+        """
+        Activation per player, for serialization; prefer `is_activated`.
+        """
+        return {
+            faction: bool(self._activation & bit)
+            for faction, bit in ACTIVATION_BITS.items()
+        }
+
     def activate(self, faction: Faction):
-        self.activated[faction] = True
+        self._set_activation(self._activation | ACTIVATION_BITS.get(faction, 0))
 
     def deactivate(self, faction: Faction | None = None):
         if faction is None:
-            for key in self.activated:
-                self.activated[key] = False
+            self._set_activation(0)
         else:
-            self.activated[faction] = False
+            self._set_activation(self._activation & ~ACTIVATION_BITS.get(faction, 0))
+
+    def _set_activation(self, activation: int):
+        if self.manager is not None:
+            self.manager.undo.set(self, "_activation", activation)
+        else:
+            self._activation = activation
 
     def is_activated(self, faction: Faction) -> bool:
-        return self.activated[faction]
+        return bool(self._activation & ACTIVATION_BITS.get(faction, 0))
+
+    def fork(self) -> Item:
+        """
+        Clone the item for a forked game. Plain attributes are shared, which is
+        fine for immutable data (configs, names); subclasses copy what they mutate.
+        """
+        cls = type(self)
+        clone = object.__new__(cls)
+        for member in _members(cls):
+            try:
+                member.__set__(clone, member.__get__(self, cls))
+            except AttributeError:  # Slot never assigned
+                pass
+        # Subclasses outside the core may still use a __dict__
+        state = getattr(self, "__dict__", None)
+        if state:
+            clone.__dict__.update(state)
+        clone.manager = None
+        return clone
+
+    def relink(self, items: Dict[int, Item]):
+        """
+        Point references to other items at their clones, once every item of
+        the forked game exists. Items outside the game are kept as they are.
+        """
+        pass
@@ -5,20 +5,37 @@ It connects the frontend to provide data for UI rendering and the backend to han
 It should be able to add, remove, update, and query items efficiently, the key is item's id.
 """
 
+from __future__ import annotations
+
 from .item import Item
 
-# from .card import Card
+from .card import Card
 from .end_phase import EndPhaseButton
 from .hero import Hero
-from .target import Fighter, Env
+from .target import Target, Fighter, Env
 from .position import Pos, Lane, Board
-
-from app.core.base import Faction
+from .liveness import LivenessTable
+from .views import RangeView
+from .indexes import CostIndex, AbilityIndex
+from .deck import Deck
+
+from dataclasses import fields
+from itertools import chain
+
+from app.core.base import Faction, FighterState, Lifetime
+from app.core.identity import IdAllocator
+from app.core.rng import EFFECTS, SHUFFLE, GameRandom
+from app.core.undo import UndoLog
+from app.core.zobrist import ZobristHash
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Callable, Literal, TypeVar, List, Tuple, Dict, Set, Optional
+    from typing import Callable, Iterable, Literal, TypeVar
+    from typing import List, Tuple, Dict, Optional
+    from .indexes import SecondaryIndex
+    from app.core.event.listener import Listener
     from app.core.event.event import Event
+    from app.core.item.board_arrays import BoardArrays
 
     Items = TypeVar("Items", bound=Item)
     PositionTuple = Tuple[int, int, Faction]
@@ -38,58 +55,486 @@ if TYPE_CHECKING:
         "p_hand",
         "p_graveyard",
         "targets",
+        "fighters",
+        "envs",
         "end_phase_button",
     ]
 
 
-def merge_dicts(dicts):
-    merged = {}
-    for d in dicts:
-        merged.update(d)
-    return merged
+# Item type admitted by each range
+RANGE_KINDS = {
+    "z_poses": Pos,
+    "p_poses": Pos,
+    "lanes": Lane,
+    "board": Board,
+    "z_hero": Hero,
+    "p_hero": Hero,
+    "z_deck": Card,
+    "z_hand": Card,
+    "z_graveyard": Item,  # Played cards and destroyed fighters
+    "p_deck": Card,
+    "p_hand": Card,
+    "p_graveyard": Item,
+    "targets": Target,
+    "end_phase_button": EndPhaseButton,
+}
+
+# Derived ranges: materialized alongside their parent ranges, for one item type
+DERIVED_RANGES = {
+    "poses": (("z_poses", "p_poses"), Pos),
+    "fighters": (("targets",), Fighter),
+    "envs": (("targets",), Env),
+}
+
+# Ranges an item can be tracked in, zone changes are journaled by position here
+ZONES = tuple(RANGE_KINDS)
+
+POS_RANGES = {Faction.ZOMBIE: "z_poses", Faction.PLANT: "p_poses"}
+
+# Draw order is kept for these ranges, see deck.py
+DECK_RANGES = {Faction.ZOMBIE: "z_deck", Faction.PLANT: "p_deck"}
+HAND_RANGES = {Faction.ZOMBIE: "z_hand", Faction.PLANT: "p_hand"}
+GRAVEYARD_RANGES = {Faction.ZOMBIE: "z_graveyard", Faction.PLANT: "p_graveyard"}
+
+# Zone each listener lifetime is bound to: such listeners die with the zone
+# their source leaves, and live on through moves between other zones
+ZONE_LIFETIMES = {
+    "z_deck": Lifetime.IN_DECK,
+    "p_deck": Lifetime.IN_DECK,
+    "z_hand": Lifetime.IN_HAND,
+    "p_hand": Lifetime.IN_HAND,
+    "targets": Lifetime.IN_FIELD,
+}
+
+# Secondary indexes kept on a range, see indexes.py
+RANGE_INDEXES = {
+    "z_hand": (CostIndex,),
+    "p_hand": (CostIndex,),
+    "fighters": (AbilityIndex,),
+}
+
+# Fighter state fields covered by the state hash, abilities are hashed as a whole
+STATE_FIELDS = frozenset(
+    f.name for f in fields(FighterState) if f.init and f.name != "ABILITIES"
+)
 
 
 class ItemManager:
-    def __init__(self):
+    def __init__(self, ids: IdAllocator | None = None, rng: GameRandom | None = None):
         """
         Initialize a manager of all operatable items in the game, by items' id.
+
+        :param ids: The game's id allocator, items get their id when tracked.
+        :param rng: The game's randomness, decks shuffle with its streams.
         """
 
-        self._all_items: Dict[str, Items] = {}  # type: ignore
-        self._indices: Dict[Range, Set[str]] = {
-            "z_poses": set(),
-            "p_poses": set(),
-            "lanes": set(),
-            "board": set(),
-            "z_hero": set(),
-            "p_hero": set(),
-            "z_deck": set(),
-            "z_hand": set(),
-            "z_graveyard": set(),
-            "p_deck": set(),
-            "p_hand": set(),
-            "p_graveyard": set(),
-            "targets": set(),
-            "end_phase_button": set(),
+        self.ids: IdAllocator = ids if ids is not None else IdAllocator()
+        self._all_items: Dict[int, Items] = {}  # type: ignore
+        # Materialized range views, maintained incrementally.
+        self._indices: Dict[Range, RangeView] = {
+            name: RangeView(name, kind, self._new_indexes(name))
+            for name, kind in RANGE_KINDS.items()
+        }
+        self._derived: Dict[Range, List[RangeView]] = {name: [] for name in RANGE_KINDS}
+        for name, (parents, kind) in DERIVED_RANGES.items():
+            view = RangeView(name, kind, self._new_indexes(name))
+            self._indices[name] = view
+            for parent in parents:
+                self._derived[parent].append(view)
+        self._reverse_index: Dict[int, Range] = {}
+        self.position_keeper: Dict[PositionTuple, int] = {}
+        # Occupier id of each lane's frontier pos, kept up to date by the poses
+        self._frontier: Dict[Tuple[int, Faction], int | None] = {}
+        self.liveness: LivenessTable = LivenessTable()
+        # Hash of every tracked item's zone, stats and board placement
+        self.zobrist: ZobristHash = ZobristHash()
+        # Hashed features that are not watched live (cost, abilities), by item id
+        self._hashed: Dict[int, Tuple] = {}
+
+        # Called with an item's id whenever it changes position on the board.
+        self.move_hooks: List[Callable[[int], None]] = []
+        # Called with an item's id whenever it is removed from the manager.
+        self.teardown_hooks: List[Callable[[int], None]] = []
+        # Called with an item's id, former and new range when it changes zone.
+        self.zone_hooks: List[Callable[[int, Range, Range], None]] = []
+        # Called with a pos whenever it is occupied or vacated.
+        self.occupancy_hooks: List[Callable[[Pos], None]] = []
+        # Optional NumPy mirror of the board, see enable_board_arrays
+        self.board_arrays: BoardArrays | None = None
+        # Draw order of each deck range
+        self.rng: GameRandom = rng if rng is not None else GameRandom()
+        self.decks: Dict[Range, Deck] = {
+            name: Deck(
+                name, self.rng.stream(f"{SHUFFLE}/{name}"), self.rng.stream(EFFECTS)
+            )
+            for name in DECK_RANGES.values()
+        }
+        # Inverses of the changes made while a move is open, shared with the game
+        self.undo: UndoLog = UndoLog()
+
+    @staticmethod
+    def _new_indexes(range: Range) -> List[SecondaryIndex]:
+        return [factory() for factory in RANGE_INDEXES.get(range, ())]
+
+    def fork(
+        self,
+        listeners: Dict[Listener, Listener] | None = None,
+        rng: GameRandom | None = None,
+        sources: Dict[Item, Item] | None = None,
+    ) -> ItemManager:
+        """
+        Clone the manager and every item it tracks, for a forked game.
+        Immutable data such as card configs is shared with the original.
+        Hooks are not carried over, the owner of the fork wires its own.
+
+        :param listeners: Clones of listeners made so far, by original. The
+            abilities of cloned items are added to it, so EventManager.fork
+            can register the very same clones.
+        :param rng: The forked game's randomness, a copy of this one's if None.
+        :param sources: Clones of items, by original. Filled here with the
+            tracked items and the targets of cards not in play, so listeners
+            bind to the clone of their source even if it is not tracked.
+        """
+        if listeners is None:
+            listeners = {}
+        if sources is None:
+            sources = {}
+        clone = ItemManager.__new__(ItemManager)
+        clone.ids = self.ids.fork()
+
+        items: Dict[int, Item] = {
+            item_id: item.fork() for item_id, item in self._all_items.items()
+        }
+        for item in items.values():
+            item.relink(items)
+            item.manager = clone
+        clone._all_items = items  # type: ignore
+        clone._indices = {
+            name: view.fork(items) for name, view in self._indices.items()
+        }
+        clone._derived = {
+            name: [clone._indices[view.name] for view in views]  # type: ignore
+            for name, views in self._derived.items()
+        }
+        clone._reverse_index = self._reverse_index.copy()
+        clone.position_keeper = self.position_keeper.copy()
+        clone._frontier = self._frontier.copy()
+        clone.liveness = self.liveness.fork()
+        clone.zobrist = self.zobrist.fork()
+        clone._hashed = self._hashed.copy()
+        clone.move_hooks = []
+        clone.teardown_hooks = []
+        clone.zone_hooks = []
+        clone.occupancy_hooks = []
+        clone.undo = UndoLog()
+        clone.board_arrays = None
+        clone.rng = rng if rng is not None else self.rng.fork()
+        clone.decks = {
+            name: deck.fork(
+                clone.rng.stream(f"{SHUFFLE}/{name}"), clone.rng.stream(EFFECTS)
+            )
+            for name, deck in self.decks.items()
         }
-        self._reverse_index: Dict[str, Range] = {}
-        self.position_keeper: Dict[PositionTuple, str] = {}
+
+        # Fighters and environments of cards not in play, cloned by their card
+        targets = []
+        for item_id, item in self._all_items.items():
+            forked = items[item_id]
+            sources[item] = forked
+            for name in ("fighter", "env"):
+                target = getattr(forked, name, None)
+                if target is not None and items.get(target.id) is not target:
+                    sources[getattr(item, name)] = target
+                    targets.append(target)
+        for target in targets:
+            if target.manager is not None:
+                target.manager = clone
+
+        for item in chain(items.values(), targets):
+            abilities = getattr(item, "abilities", None)
+            if not abilities:
+                continue
+            forked = {}
+            for name, listener in abilities.items():
+                if listener not in listeners:
+                    listeners[listener] = listener.fork(sources)
+                forked[name] = listeners[listener]
+            item.abilities = forked  # type: ignore
+        return clone
 
     def keep_track(self, indice: Range, *items: Item):
         """
         Keep track of an item's group for easier management.
         """
+        if indice in DERIVED_RANGES:
+            raise ValueError(f"{indice!r} is derived from other ranges, track there.")
+        kind = self._indices[indice].kind
+        undo = self.undo
         for item in items:
+            if not isinstance(item, kind):
+                raise TypeError(f"{type(item).__name__} cannot be kept in {indice!r}.")
+            if not item.id:
+                undo.record(self.ids.rewind, self.ids.next_id)
+                undo.record(setattr, item, "id", 0)
+                item.id = self.ids.allocate()
+            former = self._reverse_index.get(item.id)
+            if undo.recording and former != indice:
+                undo.record(self._roll_back, item, indice, former, self._snapshot(item))
+            if former != indice:
+                self._reorder_decks(item.id, former, indice)
+            if former is None:
+                self.liveness.spawn(item.id)
+                self._hash_in(item, indice)
+            elif former != indice:
+                # Zone change: leave the former range, stale references die
+                self._unindex(former, item.id)
+                self.liveness.bump(item.id)
+                self.zobrist.replace(
+                    ("zone", item.id, former), ("zone", item.id, indice)
+                )
             self._all_items[item.id] = item
-            self._indices[indice].add(item.id)
+            self._index(indice, item)
             self._reverse_index[item.id] = indice
+            item.manager = self
+            if former is not None and former != indice:
+                for hook in self.zone_hooks:
+                    hook(item.id, former, indice)
+
+    def move(self, item_id: int, to_range: Range) -> Range:
+        """
+        Move a tracked item to another zone, e.g. a card from deck to hand.
+        The item keeps its id and identity. Events and zone-bound listeners
+        referring to it in its former zone go stale, and the zone hooks are told.
+
+        :return: The range the item left.
+        """
+        item = self._all_items.get(item_id)
+        former = self._reverse_index.get(item_id)
+        if item is None or former is None:
+            raise KeyError(f"Item {item_id} is not tracked.")
+        if to_range != former:
+            self.keep_track(to_range, item)
+        return former
+
+    def zone_of(self, item_id: int) -> Range | None:
+        """
+        Get the range an item is tracked in.
+        """
+        return self._reverse_index.get(item_id)
+
+    # --- Undo ---
+
+    def _snapshot(self, item: Item) -> Tuple:
+        """
+        Everything keep_track and remove_item change about an item, taken
+        before they do, for `_roll_back`.
+        """
+        item_id = item.id
+        indice = self._reverse_index.get(item_id)
+        positions = []
+        if indice is not None:
+            for view in (self._indices[indice], *self._derived[indice]):
+                if item_id in view:
+                    positions.append((view, view.position(item_id)))
+        deck = self.decks.get(indice)  # type: ignore
+        return (
+            item.manager,
+            self.liveness.generation(item_id),
+            self.liveness.is_alive(item_id),
+            self.zobrist.value,
+            self._hashed.get(item_id),
+            positions,
+            deck.position(item_id) if deck is not None else None,
+        )
+
+    def _roll_back(
+        self, item: Item, current: Range | None, former: Range | None, snapshot: Tuple
+    ):
+        """
+        Take an item out of its current range and put it back in its former
+        one, where it was, as `snapshot` found it. Hooks are not called, what
+        they did was recorded on its own.
+        """
+        manager, generation, alive, zobrist, hashed, positions, deck_at = snapshot
+        item_id = item.id
+        if current is not None:
+            self._unindex(current, item_id)
+            if current in self.decks:
+                self.decks[current].remove(item_id)
+        if former is None:
+            self._all_items.pop(item_id, None)
+            self._reverse_index.pop(item_id, None)
+        else:
+            self._all_items[item_id] = item
+            self._reverse_index[item_id] = former
+            for view, position in positions:
+                view.insert(item, position)
+            if deck_at is not None:
+                self.decks[former].restore(item_id, deck_at)
+        self.liveness.restore(item_id, generation, alive)
+        self.zobrist.value = zobrist
+        if hashed is None:
+            self._hashed.pop(item_id, None)
+        else:
+            self._hashed[item_id] = hashed
+        item.manager = manager
+        if former is not None and isinstance(item, Target):
+            self.notify_moved(item)
+
+    def place(self, target: Target, where: Pos | Lane | None):
+        """
+        Set the pos a fighter stands on, or the lane an environment covers.
+        """
+        name = "on_pos" if isinstance(target, Fighter) else "on_lane"
+        self.undo.record(self._unplace, target, name, getattr(target, name))
+        setattr(target, name, where)
+
+    def _unplace(self, target: Target, name: str, where: Pos | Lane | None):
+        setattr(target, name, where)
+        self.notify_moved(target)
+
+    @staticmethod
+    def _reoccupy(pos: Pos, occupier_id: int | None):
+        if occupier_id is None:
+            pos.vacate()
+        else:
+            pos.occupy_by(occupier_id)
+
+    @staticmethod
+    def _recover(lane: Lane, coverer_id: int | None):
+        if coverer_id is None:
+            lane.uncover()
+        else:
+            lane.cover_by(coverer_id)
+
+    # --- Decks ---
+
+    def _reorder_decks(self, item_id: int, former: Range | None, indice: Range):
+        if former in self.decks:
+            self.decks[former].remove(item_id)
+        if indice in self.decks:
+            self.decks[indice].put(item_id)
+
+    def deck(self, faction: Faction) -> Deck:
+        """
+        Get the draw order of a player's deck.
+        """
+        return self.decks[DECK_RANGES[faction]]
+
+    def draw(self, faction: Faction) -> Card | None:
+        """
+        Move the top card of a player's deck to their hand.
+
+        :return: The card drawn, None if the deck is empty.
+        """
+        deck = self.deck(faction)
+        for card_id in deck:
+            self.move(card_id, HAND_RANGES[faction])
+            return self._all_items[card_id]  # type: ignore
+        return None
+
+    def insert_into_deck(
+        self, item_id: int, faction: Faction, depth: int | None = None
+    ):
+        """
+        Move a card into a player's deck, `depth` cards below the top or at a
+        random depth if None, e.g. for "shuffle into your deck" effects.
+        """
+        deck = self.deck(faction)
+        self.move(item_id, deck.range)  # type: ignore
+        if self.undo.recording:
+            self.undo.record(deck.setstate, deck.getstate())
+        deck.remove(item_id)
+        deck.insert(item_id, depth)
+
+    # --- State hash ---
+
+    @staticmethod
+    def _static_features(item: Item) -> Tuple:
+        if isinstance(item, Fighter):
+            return (("abilities", item.id, item.state.ABILITIES.packed()),)
+        if isinstance(item, Card):
+            return (("cost", item.id, item.cost),)
+        return ()
+
+    def _toggle_item(self, item: Item, indice: Range):
+        toggle = self.zobrist.toggle
+        toggle(("zone", item.id, indice))
+        if isinstance(item, Fighter):
+            state = item.state
+            for name in STATE_FIELDS:
+                toggle(("state", item.id, name, getattr(state, name)))
+
+    def _hash_in(self, item: Item, indice: Range):
+        self._toggle_item(item, indice)
+        features = self._static_features(item)
+        for feature in features:
+            self.zobrist.toggle(feature)
+        self._hashed[item.id] = features
+
+    def _hash_out(self, item: Item, indice: Range):
+        self._toggle_item(item, indice)
+        for feature in self._hashed.pop(item.id, ()):
+            self.zobrist.toggle(feature)
+
+    def _rehash(self, item: Item):
+        """
+        Hash an item's cost and abilities again after they changed in place.
+        """
+        toggle = self.zobrist.toggle
+        for feature in self._hashed.get(item.id, ()):
+            toggle(feature)
+        features = self._static_features(item)
+        for feature in features:
+            toggle(feature)
+        self._hashed[item.id] = features
+
+    def on_state_changed(self, fighter: Fighter, name: str, old, new):
+        """
+        Follow a write to a tracked fighter's state in the state hash.
+        """
+        self.undo.record(setattr, fighter.state, name, old)
+        if fighter.id not in self._reverse_index:
+            return
+        if name == "ABILITIES":
+            self._rehash(fighter)
+        elif name in STATE_FIELDS:
+            self.zobrist.replace(
+                ("state", fighter.id, name, old), ("state", fighter.id, name, new)
+            )
+        if self.board_arrays is not None:
+            self.board_arrays.sync_state(fighter, name, new)
+
+    def on_lane_covered(self, lane: Lane, previous: int | None):
+        self.undo.record(self._recover, lane, previous)
+        toggle = self.zobrist.toggle
+        if previous is not None:
+            toggle(("cover", lane.id, previous))
+        if lane.coverer_id is not None:
+            toggle(("cover", lane.id, lane.coverer_id))
+
+    def _index(self, indice: Range, item: Item):
+        self._indices[indice].add(item)
+        for derived in self._derived[indice]:
+            if isinstance(item, derived.kind):
+                derived.add(item)
+
+    def _unindex(self, indice: Range, item_id: int):
+        self._indices[indice].discard(item_id)
+        for derived in self._derived[indice]:
+            derived.discard(item_id)
+
+    def notify_moved(self, item: Item):
+        """
+        Broadcast that an item has changed position on the board.
+        """
+        for hook in self.move_hooks:
+            hook(item.id)
 
     def add_item(self, item: Item, range: Range):
         """
         Add an item to the manager under the specified range.
         """
-        items_dict: Dict[str, Item] = getattr(self, range)
-        items_dict[item.id] = item
         self.keep_track(range, item)
 
     def get_position(self, position_tuple: PositionTuple) -> Pos | Lane | None:
@@ -117,24 +562,39 @@ class ItemManager:
         return None
 
     @property
-    def poses(self) -> Dict[str, Pos]:
+    def poses(self) -> RangeView[Pos]:
         """
         Get all positions managed by the item manager.
         """
-        return merge_dicts([self._indices["z_poses"], self._indices["p_poses"]])
+        return self._indices["poses"]
 
     @property
-    def lanes(self) -> Dict[str, Lane]:
+    def lanes(self) -> RangeView[Lane]:
         """
         Get all lanes managed by the item manager.
         """
-        lane_ids = self._indices["lanes"]
-        lanes = {}
-        for lane_id in lane_ids:
-            lane = self.get_by_id(lane_id)
-            if isinstance(lane, Lane):
-                lanes[lane_id] = lane
-        return lanes
+        return self._indices["lanes"]
+
+    @property
+    def fighters(self) -> RangeView[Fighter]:
+        """
+        Get all fighters on the field.
+        """
+        return self._indices["fighters"]
+
+    @property
+    def envs(self) -> RangeView[Env]:
+        """
+        Get all environments on the field.
+        """
+        return self._indices["envs"]
+
+    def view(self, range: Range) -> RangeView:
+        """
+        Get the live view of a range. It reflects later changes, copy it
+        before mutating the range while iterating.
+        """
+        return self._indices[range]
 
     @property
     def num_lanes(self) -> int:
@@ -148,29 +608,30 @@ class ItemManager:
         """
         Get the end phase button item.
         """
-        button_ids = self._indices["end_phase_button"]
-        if len(button_ids) == 0:
+        button = self._indices["end_phase_button"].first()
+        if button is None:
             raise ValueError("End Phase Button not found in Item Manager.")
-        button_id = next(iter(button_ids))
-        button = self.get_by_id(button_id)
-        if isinstance(button, EndPhaseButton):
-            return button
-        else:
-            raise TypeError("Item with end_phase_button ID is not an EndPhaseButton.")
-        
-    def __getitem__(self, *range: Range) -> List[Item]:
-        """
-        Get all items in the specified range.
-        """
-        items: List[Item] = []
-        for r in range:
-            item_ids = self._indices[r]
-            for item_id in item_ids:
-                item = self.get_by_id(item_id)
-                if item is not None:
-                    items.append(item)
-        return items
-        
+        return button  # type: ignore
+
+    def __getitem__(self, range: Range | Tuple[Range, ...]) -> RangeView | List[Item]:
+        """
+        Get all items in the specified range, e.g. `im["z_hand"]`.
+        A single range gives its live view, several ranges give a new list.
+        """
+        if isinstance(range, tuple):
+            return [item for r in range for item in self._indices[r]]
+        return self._indices[range]
+
+    def enable_board_arrays(self) -> BoardArrays:
+        """
+        Mirror the board into NumPy arrays for simulation and AI code.
+        Needs the optional `sim` dependencies.
+        """
+        if self.board_arrays is None:
+            from app.core.item.board_arrays import BoardArrays
+
+            self.board_arrays = BoardArrays.from_item_manager(self)
+        return self.board_arrays
 
     def set_up_board(self):
         """
@@ -203,7 +664,7 @@ class ItemManager:
         board = Board(lanes)
         self.add_item(board, "board")
 
-    def get_by_id(self, item_id: str) -> Optional[Item]:
+    def get_by_id(self, item_id: int) -> Optional[Item]:
         """
         Query an item by its unique ID.
         """
@@ -218,18 +679,44 @@ class ItemManager:
         """
         Filter items based on a provided function.
         """
-        target_ids = set()
         if range is None:
-            target_ids = set(self._all_items.keys())
-        else:
-            for r in range:
-                target_ids.update(self._indices[r])
+            return [item for item in self._all_items.values() if func(item)]
+
+        return [item for r in range for item in self._indices[r] if func(item)]
+
+    def playable(
+        self, range: Range, max_cost: int, subtypes: Iterable[str] | None = None
+    ) -> List[Card]:
+        """
+        Cards of a hand costing at most `max_cost`, optionally of some subtypes.
+        """
+        index: CostIndex = self._indices[range].indexes["cost"]  # type: ignore
+        return index.up_to(max_cost, subtypes)
+
+    def with_ability(self, name: str) -> List[Fighter]:
+        """
+        Fighters that have an ability, e.g. "FRENZY" or "ARMOURED".
+        """
+        view = self._indices["fighters"]
+        index: AbilityIndex = view.indexes["abilities"]  # type: ignore
+        return index.having(name)
 
-        return [
-            self._all_items[item_id]
-            for item_id in target_ids
-            if func(self._all_items[item_id])  # type: ignore
-        ]  # type: ignore
+    def reindex(self, item: Item):
+        """
+        Refresh the secondary indexes of an item changed in place, e.g. after
+        its cost was reduced or it gained an ability.
+        """
+        indice = self._reverse_index.get(item.id)
+        if indice is None:
+            return
+        self._rehash(item)
+        views = [self._indices[indice], *self._derived[indice]]
+        for view in views:
+            if item.id in view:
+                for index in view.indexes.values():
+                    index.add(item)
+        if self.board_arrays is not None and isinstance(item, Fighter):
+            self.board_arrays.sync_fighter(item)
 
     def activate(self, items: List[Items], faction: Faction):
         """
@@ -244,13 +731,13 @@ class ItemManager:
         """
         for item in items:
             item.deactivate(faction)
-            
+
     def _activate_end_phase_button(self, faction: Faction):
         """Activate the end phase button for the specified faction."""
         self.end_phase_button.activate(faction)
         self.end_phase_button.deactivate(faction.opponent)
 
-    def remove_item(self, item_id: str):
+    def remove_item(self, item_id: int):
         """
         Remove an item from the manager by its ID.
         """
@@ -259,11 +746,28 @@ class ItemManager:
             return
 
         indice = self._reverse_index.get(item_id, None)
+        undo = self.undo
+        if undo.recording:
+            if indice is not None:
+                undo.record(self._roll_back, item, None, indice, self._snapshot(item))
+            else:
+                liveness = self.liveness
+                undo.record(
+                    liveness.restore,
+                    item_id,
+                    liveness.generation(item_id),
+                    liveness.is_alive(item_id),
+                )
         if indice is not None:
-            if item_id in self._indices[indice]:
-                self._indices[indice].remove(item_id)
+            self._hash_out(item, indice)
+            self._unindex(indice, item_id)
+            self._reorder_decks(item_id, indice, "all_items")
             del self._reverse_index[item_id]
             del self._all_items[item_id]
+        self.liveness.kill(item_id)
+
+        for hook in self.teardown_hooks:
+            hook(item_id)
 
     def opposite_poses(self, pos: Pos) -> List[Pos] | None:
         lane = self.get_lane(pos.lane)
@@ -272,6 +776,38 @@ class ItemManager:
 
         return lane.get_poses(pos.faction.opponent)
 
+    def on_pos_changed(self, pos: Pos, previous: int | None):
+        """
+        Refresh the frontier of a pos's lane after it was occupied or vacated.
+        """
+        self.undo.record(self._reoccupy, pos, previous)
+        toggle = self.zobrist.toggle
+        if previous is not None:
+            toggle(("occupy", pos.id, previous))
+        if pos.occupier_id is not None:
+            toggle(("occupy", pos.id, pos.occupier_id))
+
+        for hook in self.occupancy_hooks:
+            hook(pos)
+
+        lane = self.get_lane(pos.lane)
+        if lane is None:
+            return
+        frontier_pos = lane.get_frontier_pos(pos.faction)
+        self._frontier[(pos.lane, pos.faction)] = (
+            frontier_pos.occupier_id if frontier_pos is not None else None
+        )
+
+    def frontier_fighter(self, lane_idx: int, faction: Faction) -> Fighter | None:
+        """
+        Get the fighter standing in front for a faction in a lane.
+        """
+        occupier_id = self._frontier.get((lane_idx, faction))
+        if occupier_id is None:
+            return None
+        target = self._all_items.get(occupier_id)
+        return target if isinstance(target, Fighter) else None
+
     def first_attackable_item(self, fighter: Fighter) -> Fighter | Hero | None:
         """
         Get the first attackable item in front of the fighter.
@@ -280,31 +816,57 @@ class ItemManager:
         if pos is None:
             return None
 
-        lane = self.get_lane(pos.lane)
-        if lane is None:
-            return None
-        if lane.is_empty(pos.faction.opponent):
+        opponent = pos.faction.opponent
+        occupier_id = self._frontier.get((pos.lane, opponent))
+        if occupier_id is None:
             # No fighters in front, attack hero
-            hero_id = (
-                self._indices["p_hero"]
-                if pos.faction == Faction.ZOMBIE
-                else self._indices["z_hero"]
-            )
-            hero: Hero = self.get_by_id(list(hero_id)[0])  # type: ignore
-            return hero
+            hero_range = "p_hero" if pos.faction == Faction.ZOMBIE else "z_hero"
+            return self._indices[hero_range].first()  # type: ignore
 
-        frontier_pos = lane.get_frontier_pos(pos.faction.opponent)
-        if frontier_pos is None:
-            return None
-        else:
-            occupier_id = frontier_pos.occupier_id
-            if occupier_id is None:
-                return None
-            target = self.get_by_id(occupier_id)
+        target = self._all_items.get(occupier_id)
+        if isinstance(target, Fighter):
+            return target
+        return None
+
+    def attack_targets(self, fighter: Fighter) -> List[Fighter | Hero]:
+        """
+        Get everything a fighter hits when it attacks.
+        A STRIKETHROUGH fighter hits every opposing fighter in its lane and the
+        hero behind them, any other fighter only its first attackable item.
+        """
+        if not fighter.state.ABILITIES.STRIKETHROUGH:
+            target = self.first_attackable_item(fighter)
+            return [] if target is None else [target]
+
+        pos = fighter.on_pos
+        lane = self.get_lane(pos.lane) if pos is not None else None
+        if lane is None:
+            return []
+        opponent = pos.faction.opponent
+        targets: List[Fighter | Hero] = []
+        for item_id in lane.get_fighters(opponent):
+            target = self.get_by_id(item_id)
             if isinstance(target, Fighter):
-                return target
-            else:
-                return None
+                targets.append(target)
+        hero_range = "p_hero" if pos.faction == Faction.ZOMBIE else "z_hero"
+        hero = self._indices[hero_range].first()
+        if hero is not None:
+            targets.append(hero)  # type: ignore
+        return targets
+
+    def destroy_fighter(self, fighter: Fighter):
+        """
+        Take a destroyed fighter off the board, to its faction's graveyard.
+        """
+        fighter.state.IS_DESTROYED = True
+        fighter.state.IN_FIELD = False
+        pos = fighter.on_pos
+        if pos is not None:
+            pos.vacate()
+            self.place(fighter, None)
+        if fighter.id in self._reverse_index:
+            faction = pos.faction if pos is not None else fighter.proto_card.faction
+            self.move(fighter.id, GRAVEYARD_RANGES[faction])
 
     def same_lane_pos(self, pos: Pos) -> Pos | None:
         if pos.faction == Faction.ZOMBIE:
@@ -321,34 +883,51 @@ class ItemManager:
         Land a fighter on a specified position.
         """
         if pos.occupied and pos.faction == Faction.PLANT:
-            former_fighter_id: str = pos.occupier_id  # type: ignore
+            former_fighter_id: int = pos.occupier_id  # type: ignore
             samelane_pos = self.same_lane_pos(pos)
             if samelane_pos is not None and not samelane_pos.occupied:
                 former_fighter = self.get_by_id(former_fighter_id)
                 if isinstance(former_fighter, Fighter):
                     former_fighter.move_to(samelane_pos)
 
-        fighter.move_to(pos)
         self.add_item(fighter, "targets")
+        if fighter.on_pos is None:
+            # Fresh from hand, nothing to vacate
+            pos.occupy_by(fighter.id)
+            self.place(fighter, pos)
+            self.notify_moved(fighter)
+        else:
+            fighter.move_to(pos)
 
     def cover_env(self, env: Env, lane: Lane):
         """
-        Cover a lane with an environment card.
+        Cover a lane with an environment card, replacing the former one.
         """
-        lane.cover_by(env.id)
-        env.on_lane = lane
+        former_id = lane.coverer_id
+        if former_id is not None and former_id != env.id:
+            former_env = self.get_by_id(former_id)
+            if isinstance(former_env, Env):
+                self.place(former_env, None)
+            self.remove_item(former_id)
+
         self.add_item(env, "targets")
+        lane.cover_by(env.id)
+        self.place(env, lane)
+        self.notify_moved(env)
 
     def check_event_possible(self, event: Event) -> bool:
         """
         Check if an event is possible in the current game state.
         """
+        liveness = self.liveness
         source_id = event.source_id
         target_id = event.target_id
 
-        flag1 = (source_id is None) or (source_id in self._indices)
-        flag2 = (target_id is None) or (target_id in self._indices)
-        return flag1 and flag2
+        if source_id is not None and not liveness.check(source_id, event.source_gen):
+            return False
+        if target_id is not None and not liveness.check(target_id, event.target_gen):
+            return False
+        return True
 
     def get_lane_targets(self, lane_idx: int):
         lane = self.get_lane(lane_idx)
@@ -0,0 +1,82 @@
+"""
+A liveness table answers "is this item still the one I knew about?" in constant time.
+Item ids are small dense integers, so the table is a slot array indexed by id.
+Each slot keeps a live flag and a generation that is bumped whenever the item
+enters, leaves or changes zone. Queued events and registered listeners remember
+the generation they saw, so a reference to an item that has since died, been
+bounced or moved is rejected even though the id itself is still in use.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List
+
+
+class LivenessTable:
+    def __init__(self, capacity: int = 64):
+        self.generations: List[int] = [0] * capacity
+        self.alive: bytearray = bytearray(capacity)
+
+    def fork(self) -> LivenessTable:
+        clone = LivenessTable.__new__(LivenessTable)
+        clone.generations = self.generations.copy()
+        clone.alive = self.alive.copy()
+        return clone
+
+    def _ensure(self, item_id: int):
+        size = len(self.generations)
+        if item_id >= size:
+            grow = max(item_id + 1, size * 2) - size
+            self.generations.extend([0] * grow)
+            self.alive.extend(bytes(grow))
+
+    def spawn(self, item_id: int):
+        """
+        Mark an item as live, e.g. when it is added to the game.
+        """
+        self._ensure(item_id)
+        self.generations[item_id] += 1
+        self.alive[item_id] = 1
+
+    def kill(self, item_id: int):
+        """
+        Mark an item as gone, e.g. when it is removed from the game.
+        """
+        if item_id < len(self.alive):
+            self.generations[item_id] += 1
+            self.alive[item_id] = 0
+
+    def bump(self, item_id: int):
+        """
+        Invalidate outstanding references to an item that changed zone.
+        """
+        if item_id < len(self.generations):
+            self.generations[item_id] += 1
+
+    def restore(self, item_id: int, generation: int, alive: bool):
+        """
+        Put a slot back as it was, when the changes since are undone.
+        """
+        self._ensure(item_id)
+        self.generations[item_id] = generation
+        self.alive[item_id] = 1 if alive else 0
+
+    def is_alive(self, item_id: int) -> bool:
+        return item_id < len(self.alive) and self.alive[item_id] == 1
+
+    def generation(self, item_id: int) -> int:
+        if item_id < len(self.generations):
+            return self.generations[item_id]
+        return 0
+
+    def check(self, item_id: int, generation: int) -> bool:
+        """
+        Check that an item is live and unchanged since `generation` was read.
+        A generation of 0 means "not recorded", only liveness is checked then.
+        """
+        if item_id >= len(self.alive) or not self.alive[item_id]:
+            return False
+        return not generation or self.generations[item_id] == generation
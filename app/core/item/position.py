@@ -8,6 +8,8 @@ from app.core.base import Faction
 
 
 class Pos(Item):
+    __slots__ = ("lane", "index", "faction", "occupier_id")
+
     def __init__(self, lane: int, index: int, faction: Faction, **kwargs):
         super().__init__(**kwargs)
         self.type = "Pos"
@@ -16,20 +18,28 @@ class Pos(Item):
         self.index: int = index
         self.faction: Faction = faction
 
-        self.occupier_id: str | None = None
+        self.occupier_id: int | None = None
 
     @property
     def occupied(self) -> bool:
         return self.occupier_id is not None
 
-    def occupy_by(self, item_id: str):
+    def occupy_by(self, item_id: int):
+        previous = self.occupier_id
         self.occupier_id = item_id
+        if self.manager is not None:
+            self.manager.on_pos_changed(self, previous)
 
     def vacate(self):
+        previous = self.occupier_id
         self.occupier_id = None
+        if self.manager is not None:
+            self.manager.on_pos_changed(self, previous)
 
 
 class Lane(Item):
+    __slots__ = ("lane", "pos", "coverable", "covered", "coverer_id")
+
     def __init__(
         self,
         lane: int,
@@ -47,7 +57,7 @@ class Lane(Item):
 
         self.coverable: bool = coverable
         self.covered: bool = False
-        self.coverer_id: str | None = None
+        self.coverer_id: int | None = None
 
     def get_poses(self, faction: Faction | None = None) -> list[Pos]:
         match faction:
@@ -60,7 +70,7 @@ class Lane(Item):
             case _:
                 return self.pos
 
-    def get_fighters(self, faction: Faction) -> list[str]:
+    def get_fighters(self, faction: Faction) -> list[int]:
         poses = self.get_poses(faction)
         return [
             p.occupier_id for p in poses if p.occupied and p.occupier_id is not None
@@ -89,24 +99,38 @@ class Lane(Item):
         poses = self.get_poses(faction)
         return all(not p.occupied for p in poses)
 
-    def cover_by(self, item_id: str):
+    def relink(self, items: dict[int, Item]):
+        self.pos = [items.get(p.id, p) for p in self.pos]  # type: ignore
+
+    def cover_by(self, item_id: int):
         if self.coverable:
+            previous = self.coverer_id
             self.covered = True
             self.coverer_id = item_id
+            if self.manager is not None:
+                self.manager.on_lane_covered(self, previous)
 
     def uncover(self):
         if self.coverable:
+            previous = self.coverer_id
             self.covered = False
             self.coverer_id = None
+            if self.manager is not None:
+                self.manager.on_lane_covered(self, previous)
 
 
 class Board(Item):
+    __slots__ = ("lanes",)
+
     def __init__(self, lanes: list[Lane], **kwargs):
         super().__init__(**kwargs)
         self.type = "Board"
 
         self.lanes = lanes
 
+    def relink(self, items: dict[int, Item]):
+        self.lanes = [items.get(lane.id, lane) for lane in self.lanes]  # type: ignore
+
     def get_lanes(self) -> list[Lane]:
         return self.lanes
 
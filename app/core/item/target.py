@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from app.core.item.item import Item
 from app.core.item.position import Pos, Lane
 from app.core.base import FighterState
@@ -5,11 +7,14 @@ from abc import abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Dict
     from app.core.item.card import Card
     from app.core.event.listener import Listener
 
 
 class Target(Item):
+    __slots__ = ("subtype", "proto_card", "abilities")
+
     def __init__(self, proto_card: Card, **kwargs):
         super().__init__(**kwargs)
         self.type = "Target"
@@ -20,30 +25,63 @@ class Target(Item):
     def add_ability(self, name: str, ability: Listener):
         self.abilities[name] = ability
 
+    def relink(self, items: Dict[int, Item]):
+        card = self.proto_card
+        if card is not None:
+            self.proto_card = items.get(card.id, card)  # type: ignore
+
     @abstractmethod
     def bounce(self):
         pass
 
 
 class Fighter(Target):
+    __slots__ = ("state", "on_pos")
+
     def __init__(self, fighter_state: FighterState, proto_card: "Card", **kwargs):
         super().__init__(proto_card, **kwargs)
         self.subtype = "Fighter"
 
         self.state: FighterState = fighter_state
         self.on_pos: Pos | None = None
+        object.__setattr__(fighter_state, "_watcher", self._state_changed)
+
+    def _state_changed(self, name: str, old, new):
+        if self.manager is not None:
+            self.manager.on_state_changed(self, name, old, new)
+
+    def fork(self) -> Fighter:
+        clone: Fighter = super().fork()  # type: ignore
+        state = self.state.copy()
+        object.__setattr__(state, "_watcher", clone._state_changed)
+        clone.state = state
+        return clone
+
+    def relink(self, items: Dict[int, Item]):
+        super().relink(items)
+        if self.on_pos is not None:
+            self.on_pos = items.get(self.on_pos.id, self.on_pos)  # type: ignore
 
     def move_to(self, position: Pos):
         if self.on_pos is None:
             return
         self.on_pos.vacate()
         position.occupy_by(self.id)
-        self.on_pos = position
+        if self.manager is not None:
+            self.manager.place(self, position)
+            self.manager.notify_moved(self)
+        else:
+            self.on_pos = position
 
     def bounce(self):
         if self.on_pos is None:
             return
         self.on_pos.vacate()
+        if self.manager is not None:
+            self.manager.place(self, None)
+            self.manager.notify_moved(self)
+        else:
+            self.on_pos = None
         return self.proto_card
 
     @property
@@ -60,12 +98,19 @@ class Fighter(Target):
 
 
 class Env(Target):
+    __slots__ = ("on_lane",)
+
     def __init__(self, proto_card: "Card", **kwargs):
         super().__init__(proto_card, **kwargs)
         self.subtype = "Env"
 
         self.on_lane: Lane | None = None
 
+    def relink(self, items: Dict[int, Item]):
+        super().relink(items)
+        if self.on_lane is not None:
+            self.on_lane = items.get(self.on_lane.id, self.on_lane)  # type: ignore
+
     def bounce(self):
         if self.on_lane is None:
             return
@@ -0,0 +1,104 @@
+"""
+A range view is the materialized content of one ItemManager range.
+It is kept up to date by ItemManager as items are added, removed and moved, so
+reading a range never rebuilds anything: iterating a view walks its items in
+insertion order without allocating, and membership is checked by item id.
+A view can also carry secondary indexes (see indexes.py) that it keeps in step.
+"""
+
+from __future__ import annotations
+
+from typing import Generic, TypeVar, TYPE_CHECKING
+
+from app.core.item.item import Item
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterator, KeysView, Sequence
+    from app.core.item.indexes import SecondaryIndex
+
+T = TypeVar("T", bound=Item)
+
+
+class RangeView(Generic[T]):
+    __slots__ = ("name", "kind", "_items", "indexes")
+
+    def __init__(
+        self,
+        name: str,
+        kind: type[T] = Item,
+        indexes: Sequence[SecondaryIndex] = (),
+    ):
+        """
+        :param name: Name of the range this view materializes.
+        :param kind: Type of the items in the range, only they are admitted.
+        :param indexes: Secondary indexes to maintain over the range.
+        """
+        self.name = name
+        self.kind = kind
+        self._items: Dict[int, T] = {}
+        self.indexes: Dict[str, SecondaryIndex] = {i.name: i for i in indexes}
+
+    def add(self, item: T):
+        self._items[item.id] = item
+        for index in self.indexes.values():
+            index.add(item)
+
+    def insert(self, item: T, position: int):
+        """
+        Add an item at a position of the iteration order, e.g. to put it back
+        where it was. Items after it are moved, so this is linear in them.
+        """
+        items = self._items
+        tail = [(i, items.pop(i)) for i in list(items)[position:]]
+        self.add(item)
+        items.update(tail)
+
+    def position(self, item_id: int) -> int:
+        return list(self._items).index(item_id)
+
+    def discard(self, item_id: int):
+        if self._items.pop(item_id, None) is None:
+            return
+        for index in self.indexes.values():
+            index.discard(item_id)
+
+    def fork(self, items: Dict[int, Item]) -> RangeView[T]:
+        """
+        The same view over the cloned items of a forked game.
+        """
+        clone = RangeView.__new__(RangeView)
+        clone.name = self.name
+        clone.kind = self.kind
+        clone._items = {i: items[i] for i in self._items}  # type: ignore
+        clone.indexes = (
+            {name: index.fork(items) for name, index in self.indexes.items()}
+            if self.indexes
+            else {}
+        )
+        return clone
+
+    def get(self, item_id: int) -> T | None:
+        return self._items.get(item_id)
+
+    def first(self) -> T | None:
+        for item in self._items.values():
+            return item
+        return None
+
+    def ids(self) -> KeysView[int]:
+        return self._items.keys()
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items.values())
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __repr__(self) -> str:
+        return f"RangeView({self.name!r}, {len(self._items)} items)"
@@ -0,0 +1,124 @@
+"""
+Randomness of a game.
+
+A game owns one GameRandom built from its seed, split into named streams: deck
+shuffles, SuperBlock energy, card effects. Each stream is seeded from the game
+seed and its own name only, so drawing more from one stream never shifts the
+others, and a game played again from the same seed makes the very same draws.
+
+Streams are `random.Random` instances for the engine's occasional draws. Bulk
+simulation can take blocks pre-sampled with NumPy (optional `sim` dependency)
+instead, from a generator of the stream's own, which leaves the scalar sequence
+untouched.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from hashlib import blake2b
+from os import urandom
+from random import Random
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple
+    import numpy as np
+
+
+# Stream names used by the engine
+SHUFFLE = "shuffle"
+BLOCK = "block"
+EFFECTS = "effects"
+
+# Draws pre-sampled at once by RandomStream.fast_randint
+BLOCK_SIZE = 4096
+
+
+def derive_seed(seed: int, name: str) -> int:
+    """
+    Seed of the stream `name` of a game seeded with `seed`.
+    """
+    digest = blake2b(f"{seed}/{name}".encode(), digest_size=16).digest()
+    return int.from_bytes(digest, "little")
+
+
+class RandomStream(Random):
+    def __init__(self, stream_seed: int = 0):
+        """
+        One independent stream of a game's randomness.
+
+        :param stream_seed: Seed of the stream, see `derive_seed`.
+        """
+        super().__init__(stream_seed)
+        self.stream_seed = stream_seed
+        self._generator: np.random.Generator | None = None
+        # Pre-sampled draws by (low, high), consumed from the end
+        self._buffers: Dict[Tuple[int, int], List[int]] = {}
+
+    def generator(self) -> np.random.Generator:
+        """
+        The stream's NumPy generator, independent from its scalar draws.
+        """
+        if self._generator is None:
+            import numpy as np
+
+            self._generator = np.random.Generator(np.random.PCG64(self.stream_seed))
+        return self._generator
+
+    def integers(self, low: int, high: int, size: int | Tuple[int, ...]) -> np.ndarray:
+        """
+        A block of integers in [low, high], both ends included like `randint`.
+        """
+        return self.generator().integers(low, high, size=size, endpoint=True)
+
+    def fast_randint(self, low: int, high: int) -> int:
+        """
+        `randint` served from pre-sampled blocks, for hot simulation loops.
+        It draws from the NumPy generator, so it gives other values than
+        `randint` would for the same seed.
+        """
+        buffer = self._buffers.get((low, high))
+        if not buffer:
+            buffer = self.integers(low, high, BLOCK_SIZE).tolist()
+            self._buffers[(low, high)] = buffer
+        return buffer.pop()
+
+    def fork(self) -> RandomStream:
+        """
+        Copy the stream for a forked game, both continue with the same draws.
+        """
+        clone = RandomStream.__new__(RandomStream)
+        clone.setstate(self.getstate())
+        clone.stream_seed = self.stream_seed
+        clone._generator = deepcopy(self._generator)
+        clone._buffers = {key: buffer.copy() for key, buffer in self._buffers.items()}
+        return clone
+
+
+class GameRandom:
+    def __init__(self, seed: int | None = None):
+        """
+        All randomness of one game.
+
+        :param seed: Seed of the game. When omitted one is drawn from the OS and
+            kept in `seed`, so an unseeded game can still be played again.
+        """
+        if seed is None:
+            seed = int.from_bytes(urandom(8), "little")
+        self.seed: int = seed
+        self._streams: Dict[str, RandomStream] = {}
+
+    def stream(self, name: str) -> RandomStream:
+        """
+        Get the stream `name`, e.g. `SHUFFLE`, creating it on first use.
+        """
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = RandomStream(derive_seed(self.seed, name))
+        return stream
+
+    def fork(self) -> GameRandom:
+        clone = GameRandom(self.seed)
+        clone._streams = {name: s.fork() for name, s in self._streams.items()}
+        return clone
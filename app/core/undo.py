@@ -0,0 +1,74 @@
+"""
+Undo log of a game, for searching move sequences in place.
+
+While a mark is open, every mutation of the game records the call that
+reverts it: ItemManager records how to put an item back where it was, the
+event queue how to take an event out again, events how to restore the scalars
+they set. Undoing a mark replays those inverses last first, so it costs as
+much as the change did, and the log shrinks back as it is undone.
+
+Nothing is recorded while no mark is open, a game played normally only pays
+for reading the `recording` flag.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, List, Tuple
+
+
+class UndoLog:
+    __slots__ = ("recording", "_entries", "_marks")
+
+    def __init__(self):
+        self.recording: bool = False
+        self._entries: List[Tuple[Callable[..., Any], Tuple]] = []
+        self._marks: List[int] = []
+
+    def record(self, inverse: Callable[..., Any], *args):
+        """
+        Record the call undoing a change, made just before the change.
+        """
+        if self.recording:
+            self._entries.append((inverse, args))
+
+    def set(self, obj: object, name: str, value):
+        """
+        Set an attribute, recording its former value.
+        """
+        if self.recording:
+            self._entries.append((setattr, (obj, name, getattr(obj, name))))
+        setattr(obj, name, value)
+
+    def mark(self):
+        """
+        Open a mark, `undo` reverts every change made from here on.
+        """
+        self._marks.append(len(self._entries))
+        self.recording = True
+
+    def undo(self):
+        """
+        Revert the changes made since the last open mark, and close it.
+        """
+        if not self._marks:
+            raise IndexError("Nothing to undo.")
+        start = self._marks.pop()
+        entries = self._entries
+        # Inverses go through the same code as the changes, which must not
+        # record them in turn
+        self.recording = False
+        try:
+            while len(entries) > start:
+                inverse, args = entries.pop()
+                inverse(*args)
+        finally:
+            self.recording = bool(self._marks)
+
+    def __len__(self) -> int:
+        """
+        Number of open marks.
+        """
+        return len(self._marks)
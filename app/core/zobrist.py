@@ -0,0 +1,68 @@
+"""
+Zobrist hashing of game state.
+
+Every fact about a game ("pos 12 is held by item 40", "item 40 has 3 health",
+"card 7 is in the zombie hand") is a feature with its own random 64-bit key, and
+the state hash is the XOR of the keys of all facts currently true. Changing a
+fact XORs its old key out and its new key in, so the hash is kept up to date in
+constant time by the code that makes the change, and never needs the board to
+be serialized.
+
+Keys are derived from the feature itself rather than drawn in order, so equal
+states hash equally across games, forks, replays and processes.
+"""
+
+from __future__ import annotations
+
+from hashlib import blake2b
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Hashable
+
+
+class ZobristKeys:
+    def __init__(self):
+        """
+        Lazily filled table of feature keys.
+        """
+        self._keys: Dict[Hashable, int] = {}
+
+    def key(self, feature: Hashable) -> int:
+        key = self._keys.get(feature)
+        if key is None:
+            digest = blake2b(repr(feature).encode(), digest_size=8).digest()
+            key = int.from_bytes(digest, "little")
+            self._keys[feature] = key
+        return key
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+ZOBRIST_KEYS = ZobristKeys()
+
+
+class ZobristHash:
+    __slots__ = ("value", "keys")
+
+    def __init__(self, keys: ZobristKeys = ZOBRIST_KEYS):
+        self.value: int = 0
+        self.keys = keys
+
+    def toggle(self, feature: Hashable):
+        """
+        Add a feature that became true, or remove one that no longer is.
+        """
+        self.value ^= self.keys.key(feature)
+
+    def replace(self, old: Hashable, new: Hashable):
+        if old != new:
+            key = self.keys.key
+            self.value ^= key(old) ^ key(new)
+
+    def fork(self) -> ZobristHash:
+        clone = ZobristHash(self.keys)
+        clone.value = self.value
+        return clone
@@ -0,0 +1,83 @@
+"""
+Loads card definitions from the JSON files under app/asset/cards.
+Definitions are parsed once into CardData and shared; `make_card` builds the
+game items of one copy of a card for a deck.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.core.base import CardClass, CardConfig, Faction, FighterState, Label
+from app.core.base import Pack, Rarity
+from app.core.item.card import Card, EnvCard, FighterCard, TrickCard
+from app.core.item.target import Env, Fighter
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict
+
+CARD_DIR = Path(__file__).resolve().parents[1] / "asset" / "cards"
+
+
+@dataclass(frozen=True)
+class CardData:
+    card_id: str
+    # "Fighter", "Trick" or "Environment"
+    card_type: str
+    config: CardConfig
+
+
+def parse_card(raw: Dict[str, Any]) -> CardData:
+    fighter = raw.get("fighter_config", {})
+    config = CardConfig(
+        name=raw["name"],
+        description=raw.get("description", ""),
+        faction=Faction[raw["faction"]],
+        art_path=raw.get("art_path", ""),
+        cost=raw["cost"],
+        card_class=CardClass[raw["type"]],
+        rarity=Rarity[raw["rarity"]],
+        pack=Pack[raw["pack"]],
+        tag=[Label[label] for label in raw.get("labels", [])],
+        strength=fighter.get("strength"),
+        health=fighter.get("health"),
+    )
+    return CardData(raw["card_id"], raw["card_type"], config)
+
+
+def load_cards(directory: Path | str = CARD_DIR) -> Dict[str, CardData]:
+    """
+    Read every card definition of a directory, by card id.
+    """
+    cards: Dict[str, CardData] = {}
+    for path in sorted(Path(directory).glob("*.json")):
+        with open(path, encoding="utf-8") as file:
+            data = parse_card(json.load(file))
+        cards[data.card_id] = data
+    return cards
+
+
+def make_card(data: CardData) -> Card:
+    """
+    Build one copy of a card, with the fighter or environment it puts in play.
+    """
+    config = data.config
+    if data.card_type == "Fighter":
+        cost, strength, health = config.cost, config.strength or 0, config.health or 0
+        state = FighterState(
+            cost, strength, health, cost, strength, health, cost, strength, health
+        )
+        fighter = Fighter(state, None)  # type: ignore
+        card = FighterCard(config, fighter)
+        fighter.proto_card = card
+        return card
+    if data.card_type == "Environment":
+        env = Env(None)  # type: ignore
+        card = EnvCard(config, env)
+        env.proto_card = card
+        return card
+    return TrickCard(config)
@@ -0,0 +1,210 @@
+"""
+Self-play tournaments over a pool of worker processes.
+
+Every ordered pair of bots (one as zombie, one as plant) plays `games` seeded
+games. Seeds are cut into chunks, each worker plays a whole chunk and sends back
+a compact summary, so the parent only merges summaries as they stream in.
+Workers load the card data and build the decks once, when they start.
+
+Results are merged in chunk order, which keeps the Elo ratings (updated game by
+game) identical for a given seed whatever the number of workers.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from importlib import import_module
+from itertools import permutations
+from multiprocessing import get_context
+from time import perf_counter
+
+from app.core.base import Faction
+from app.core.engine.headless import BOTS, HeadlessRunner, build_deck, new_game
+from app.service.card_loader import CARD_DIR, load_cards
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Dict, Iterator, List, Sequence, Tuple
+    from app.core.engine.headless import Bot
+    from app.service.card_loader import CardData
+
+ELO_START = 1500.0
+ELO_K = 16.0
+
+
+def load_bot(spec: str) -> Bot:
+    """
+    Instantiate a bot from its registered name ("random") or from the path of
+    its class ("package.module:ClassName").
+    """
+    if spec in BOTS:
+        return BOTS[spec]()
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        known = ", ".join(BOTS)
+        raise ValueError(f"Unknown bot {spec!r}, use one of {known} or module:Class.")
+    return getattr(import_module(module_name), class_name)()
+
+
+@dataclass
+class ChunkSummary:
+    zombie: str
+    plant: str
+    games: int = 0
+    turns: int = 0
+    # Winner of every game in seed order, None for draws
+    winners: List[Faction | None] = field(default_factory=list)
+    # By card name: times played, games it was played in, and won
+    card_plays: Counter = field(default_factory=Counter)
+    card_games: Counter = field(default_factory=Counter)
+    card_wins: Counter = field(default_factory=Counter)
+
+
+# Per worker process, set by _init_worker
+_decks: Dict[Faction, Sequence[CardData]] = {}
+_max_turns = 30
+
+
+def _init_worker(card_dir: str, deck_size: int, max_turns: int):
+    global _decks, _max_turns
+    cards = load_cards(card_dir).values()
+    _decks = {
+        faction: build_deck(cards, faction, deck_size)
+        for faction in (Faction.ZOMBIE, Faction.PLANT)
+    }
+    _max_turns = max_turns
+
+
+def _play_chunk(chunk: Tuple[str, str, int, int]) -> ChunkSummary:
+    """
+    Play games of one matchup, chunk is (zombie bot, plant bot, first seed, games).
+    """
+    zombie, plant, first_seed, games = chunk
+    runner = HeadlessRunner(load_bot(zombie), load_bot(plant), max_turns=_max_turns)
+    summary = ChunkSummary(zombie, plant)
+    for seed in range(first_seed, first_seed + games):
+        result = runner.play(new_game(seed, _decks))
+        summary.games += 1
+        summary.turns += result.turns
+        summary.winners.append(result.winner)
+        for faction, names in result.plays.items():
+            summary.card_plays.update(names)
+            played = set(names)
+            summary.card_games.update(played)
+            if result.winner == faction:
+                summary.card_wins.update(played)
+    return summary
+
+
+@dataclass
+class TournamentReport:
+    games: int = 0
+    turns: int = 0
+    seconds: float = 0.0
+    # By (zombie bot, plant bot): zombie wins, plant wins, draws
+    matchups: Dict[Tuple[str, str], List[int]] = field(default_factory=dict)
+    card_plays: Counter = field(default_factory=Counter)
+    card_games: Counter = field(default_factory=Counter)
+    card_wins: Counter = field(default_factory=Counter)
+    elo: Dict[str, float] = field(default_factory=dict)
+
+    def merge(self, summary: ChunkSummary):
+        self.games += summary.games
+        self.turns += summary.turns
+        self.card_plays.update(summary.card_plays)
+        self.card_games.update(summary.card_games)
+        self.card_wins.update(summary.card_wins)
+        tally = self.matchups.setdefault((summary.zombie, summary.plant), [0, 0, 0])
+        for winner in summary.winners:
+            tally[0 if winner == Faction.ZOMBIE else 1 if winner else 2] += 1
+            score = 1.0 if winner == Faction.ZOMBIE else 0.0 if winner else 0.5
+            self._update_elo(summary.zombie, summary.plant, score)
+
+    def _update_elo(self, a: str, b: str, score: float):
+        """
+        :param score: Result for `a`, 1 for a win, 0.5 for a draw.
+        """
+        elo = self.elo
+        rating_a = elo.setdefault(a, ELO_START)
+        rating_b = elo.setdefault(b, ELO_START)
+        if a == b:
+            return
+        expected = 1.0 / (1.0 + 10.0 ** ((rating_b - rating_a) / 400.0))
+        elo[a] = rating_a + ELO_K * (score - expected)
+        elo[b] = rating_b - ELO_K * (score - expected)
+
+    def format(self) -> str:
+        lines = [
+            f"{self.games} games in {self.seconds:.1f}s "
+            f"({self.games / max(self.seconds, 1e-9):.0f} games/s), "
+            f"{self.turns / max(self.games, 1):.1f} turns on average",
+            "",
+            "zombie vs plant: zombie wins / plant wins / draws",
+        ]
+        for (zombie, plant), (z_wins, p_wins, draws) in self.matchups.items():
+            total = max(z_wins + p_wins + draws, 1)
+            lines.append(
+                f"  {zombie} vs {plant}: {z_wins / total:.1%} / "
+                f"{p_wins / total:.1%} / {draws / total:.1%}"
+            )
+        lines += ["", "card: plays, games played in, win rate when played"]
+        for name, plays in self.card_plays.most_common():
+            games = self.card_games[name]
+            lines.append(
+                f"  {name}: {plays}, {games}, {self.card_wins[name] / games:.1%}"
+            )
+        lines += ["", "elo:"]
+        for bot, rating in sorted(self.elo.items(), key=lambda item: -item[1]):
+            lines.append(f"  {bot}: {rating:.0f}")
+        return "\n".join(lines)
+
+
+def make_chunks(
+    bots: Sequence[str], games: int, chunk_size: int, first_seed: int = 0
+) -> Iterator[Tuple[str, str, int, int]]:
+    """
+    Cut the games of every matchup into chunks. A bot also meets itself
+    when it is the only one.
+    """
+    matchups = list(permutations(bots, 2)) or [(bots[0], bots[0])]
+    for zombie, plant in matchups:
+        for start in range(0, games, chunk_size):
+            count = min(chunk_size, games - start)
+            yield (zombie, plant, first_seed + start, count)
+
+
+def run_tournament(
+    bots: Sequence[str],
+    games: int,
+    workers: int | None = None,
+    chunk_size: int = 50,
+    first_seed: int = 0,
+    deck_size: int = 40,
+    max_turns: int = 30,
+    card_dir: Path | str = CARD_DIR,
+) -> TournamentReport:
+    """
+    Play `games` games per ordered pair of bots across a process pool.
+
+    :param bots: Bot names or module:Class paths, see `load_bot`.
+    :param workers: Worker processes, one per core if None.
+    :param chunk_size: Games per task sent to a worker.
+    """
+    for spec in bots:
+        load_bot(spec)  # Fail early on unknown bots
+    report = TournamentReport()
+    start = perf_counter()
+    context = get_context("fork")
+    with context.Pool(
+        workers,
+        initializer=_init_worker,
+        initargs=(str(card_dir), deck_size, max_turns),
+    ) as pool:
+        chunks = make_chunks(bots, games, chunk_size, first_seed)
+        for summary in pool.imap(_play_chunk, chunks):
+            report.merge(summary)
+    report.seconds = perf_counter() - start
+    return report
@@ -1,5 +1,42 @@
-def main():
-    print("Hello from cardgame!")
+import argparse
+import os
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Card game engine tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    tournament = commands.add_parser(
+        "tournament", help="Play seeded self-play games between bots."
+    )
+    tournament.add_argument(
+        "bots", nargs="+", help="Bot names (pass, random) or module:Class paths."
+    )
+    tournament.add_argument(
+        "-n", "--games", type=int, default=1000, help="Games per matchup."
+    )
+    tournament.add_argument(
+        "-j", "--workers", type=int, default=os.cpu_count(), help="Worker processes."
+    )
+    tournament.add_argument("--chunk", type=int, default=50, help="Games per task.")
+    tournament.add_argument("--seed", type=int, default=0, help="First game seed.")
+    tournament.add_argument("--deck-size", type=int, default=40)
+    tournament.add_argument("--max-turns", type=int, default=30)
+
+    args = parser.parse_args(argv)
+    if args.command == "tournament":
+        from app.service.tournament import run_tournament
+
+        report = run_tournament(
+            args.bots,
+            args.games,
+            workers=args.workers,
+            chunk_size=args.chunk,
+            first_seed=args.seed,
+            deck_size=args.deck_size,
+            max_turns=args.max_turns,
+        )
+        print(report.format())
 
 
 if __name__ == "__main__":
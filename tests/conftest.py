@@ -0,0 +1,141 @@
+import pytest
+
+from app.core.base import Faction, GamePhase
+from app.core.engine.headless import HeadlessRunner, RandomBot, build_deck, new_game
+from app.core.item.card import Card, FighterCard
+from app.core.item.item_manager import DECK_RANGES, POS_RANGES, STATE_FIELDS, ZONES
+from app.core.item.position import Lane, Pos
+from app.core.item.target import Fighter
+from app.core.zobrist import ZobristHash
+from app.service.card_loader import load_cards
+
+# Abilities CombatBatch resolves, besides ARMOURED
+COMBAT_ABILITIES = ("STRIKETHROUGH", "DEADLY", "DOUBLE_STRIKE")
+
+
+@pytest.fixture(scope="session")
+def decks():
+    cards = load_cards().values()
+    return {
+        faction: build_deck(cards, faction)
+        for faction in (Faction.ZOMBIE, Faction.PLANT)
+    }
+
+
+@pytest.fixture
+def game(decks):
+    return new_game(7, decks)
+
+
+@pytest.fixture
+def advance():
+    def advance(game, phase: GamePhase):
+        """
+        Move a headless game on to the next `phase`, with its events resolved.
+        """
+        game.event_manager.notify(game)
+        while game.phase != phase:
+            game.next_phase()
+            game.event_manager.notify(game)
+        return game
+
+    return advance
+
+
+@pytest.fixture
+def first_play():
+    def first_play(game, faction: Faction):
+        """
+        The first legal play of a fighter card for a faction.
+        """
+        for card, pos in game.legal_moves.moves(faction):
+            if isinstance(card, FighterCard):
+                return card, pos
+        raise AssertionError(f"No fighter for {faction.name} to play")
+
+    return first_play
+
+
+@pytest.fixture
+def zombie_in_play(game, advance, first_play):
+    """
+    The fighter of the zombie card played first in the game.
+    """
+    advance(game, GamePhase.ZOMBIE_PHASE)
+    card, pos = first_play(game, Faction.ZOMBIE)
+    assert game.apply_move((card.id, pos.id))
+    return game.item_manager.get_by_id(card.id).fighter
+
+
+@pytest.fixture
+def played_game(decks):
+    def played_game(seed: int, max_turns: int = 30, journal=None):
+        """
+        A headless game between two RandomBots, played to its end or to
+        `max_turns`.
+        """
+        game = new_game(seed, decks, journal=journal)
+        HeadlessRunner(RandomBot(), RandomBot(), max_turns=max_turns).play(game)
+        return game
+
+    return played_game
+
+
+@pytest.fixture
+def board(played_game):
+    def board(seed: int):
+        """
+        A board from a few turns of a random game, filled up with fighters of
+        the decks, and with stats and combat abilities handed out at random.
+        """
+        game = played_game(seed, max_turns=2 + seed % 4)
+        rng = game.rng.stream("test/board")
+        item_manager = game.item_manager
+        for faction, pos_range in POS_RANGES.items():
+            cards = [
+                card
+                for card in item_manager[DECK_RANGES[faction]]
+                if isinstance(card, FighterCard)
+            ]
+            for pos in list(item_manager[pos_range]):
+                if not pos.occupied and rng.random() < 0.6:
+                    item_manager.land_fighter(rng.choice(cards).fighter.fork(), pos)
+        for fighter in list(item_manager.fighters):
+            fighter.state.CURRENT_STRENGTH = rng.randint(0, 5)
+            fighter.state.CURRENT_HEALTH = rng.randint(1, 6)
+            abilities = fighter.state.ABILITIES
+            for name in COMBAT_ABILITIES:
+                setattr(abilities, name, rng.random() < 0.25)
+            abilities.ARMOURED = rng.choice((0, 0, 1, 2))
+            item_manager.reindex(fighter)
+        return game
+
+    return board
+
+
+@pytest.fixture
+def scratch_hash():
+    def scratch_hash(item_manager) -> int:
+        """
+        Hash every fact of the tracked items anew, independently of the hooks
+        that keep the incremental hash up to date.
+        """
+        zobrist = ZobristHash()
+        toggle = zobrist.toggle
+        for zone in ZONES:
+            for item in item_manager[zone]:
+                item_id = item.id
+                toggle(("zone", item_id, zone))
+                if isinstance(item, Fighter):
+                    for name in STATE_FIELDS:
+                        toggle(("state", item_id, name, getattr(item.state, name)))
+                    toggle(("abilities", item_id, item.state.ABILITIES.packed()))
+                elif isinstance(item, Card):
+                    toggle(("cost", item_id, item.cost))
+                elif isinstance(item, Pos) and item.occupier_id is not None:
+                    toggle(("occupy", item_id, item.occupier_id))
+                elif isinstance(item, Lane) and item.coverer_id is not None:
+                    toggle(("cover", item_id, item.coverer_id))
+        return zobrist.value
+
+    return scratch_hash
@@ -0,0 +1,24 @@
+import pytest
+
+from app.core.base import ABILITY_BITS
+
+pytest.importorskip("numpy")
+
+from app.core.engine.batch_combat import cross_check  # noqa: E402
+
+
+def test_boards_have_fighters_to_fight(board):
+    games = [board(seed) for seed in range(20)]
+    assert sum(len(game.item_manager.fighters) for game in games) > 100
+    assert any(
+        fighter.state.ABILITIES.flags & ABILITY_BITS["DOUBLE_STRIKE"]
+        for game in games
+        for fighter in game.item_manager.fighters
+    )
+
+
+def test_batch_matches_event_driven_combat(board):
+    games = [board(seed) for seed in range(100)]
+    assert cross_check(games) == []
+    # Games won during combat are not compared, most must still be
+    assert sum(game.is_running for game in games) > 60
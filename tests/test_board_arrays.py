@@ -0,0 +1,44 @@
+import pytest
+
+from app.core.base import Faction
+
+pytest.importorskip("numpy")
+
+
+def slot_of(fighter):
+    pos = fighter.on_pos
+    return pos.lane, pos.index - 1, 0 if pos.faction == Faction.ZOMBIE else 1
+
+
+@pytest.fixture
+def played(game, zombie_in_play):
+    return game.item_manager.enable_board_arrays(), zombie_in_play
+
+
+def test_arrays_follow_state_writes(played):
+    arrays, fighter = played
+    slot = slot_of(fighter)
+    assert arrays.occupant[slot] == fighter.id
+
+    fighter.state.CURRENT_HEALTH += 3
+    fighter.state.CURRENT_STRENGTH = 0
+    assert arrays.health[slot] == fighter.state.CURRENT_HEALTH
+    assert arrays.strength[slot] == 0
+
+
+def test_arrays_follow_reindexed_abilities(played):
+    arrays, fighter = played
+    slot = slot_of(fighter)
+
+    fighter.state.ABILITIES.ARMOURED = 2
+    fighter.manager.reindex(fighter)
+    assert arrays.armour[slot] == 2
+    assert arrays.abilities[slot] == fighter.state.ABILITIES.flags
+
+
+def test_arrays_follow_undone_moves(played, game):
+    arrays, fighter = played
+    slot = slot_of(fighter)
+
+    game.undo_move()
+    assert arrays.occupant[slot] == 0
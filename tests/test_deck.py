@@ -0,0 +1,73 @@
+from app.core.base import Faction
+from app.core.item.deck import Deck
+from app.core.item.item_manager import HAND_RANGES
+from app.core.rng import EFFECTS, SHUFFLE, GameRandom
+
+
+def seeded_deck(seed: int, cards: int = 20) -> Deck:
+    rng = GameRandom(seed)
+    deck = Deck("z_deck", rng.stream(SHUFFLE), rng.stream(EFFECTS))
+    for card_id in range(1, cards + 1):
+        deck.put(card_id)
+    return deck
+
+
+def test_draw_order_is_last_put_first():
+    deck = seeded_deck(0, cards=3)
+    assert deck.peek(2) == [3, 2]
+    assert list(deck) == [3, 2, 1]
+    assert [deck.draw() for _ in range(4)] == [3, 2, 1, None]
+
+
+def test_same_seed_shuffles_the_same():
+    decks = [seeded_deck(seed) for seed in (4, 4, 5)]
+    for deck in decks:
+        deck.shuffle()
+    orders = [list(deck) for deck in decks]
+    assert orders[0] == orders[1] != orders[2]
+    assert sorted(orders[0]) == list(range(1, 21))
+
+
+def test_insert_depth_counts_from_the_top():
+    deck = seeded_deck(0, cards=3)
+    deck.insert(10, 0)
+    deck.insert(11, 2)
+    deck.insert(12, 99)
+    assert list(deck) == [10, 3, 11, 2, 1, 12]
+
+
+def test_random_insertions_leave_the_shuffles_alone():
+    deck, untouched = seeded_deck(8), seeded_deck(8)
+    effects = deck.effects.getstate()
+    deck.insert(99)
+    assert deck.effects.getstate() != effects
+    assert deck.rng.getstate() == untouched.rng.getstate()
+
+    deck.remove(99)
+    deck.shuffle()
+    untouched.shuffle()
+    assert list(deck) == list(untouched)
+
+
+def test_random_insertions_follow_the_seed():
+    decks = [seeded_deck(3) for _ in range(2)]
+    for deck in decks:
+        for card_id in range(100, 110):
+            deck.insert(card_id)
+    assert list(decks[0]) == list(decks[1])
+
+
+def test_undo_restores_order_and_generators(game):
+    game.event_manager.notify(game)
+    item_manager = game.item_manager
+    deck = item_manager.deck(Faction.ZOMBIE)
+    card = item_manager[HAND_RANGES[Faction.ZOMBIE]].first()
+    before = deck.getstate()
+
+    game.undo.mark()
+    item_manager.insert_into_deck(card.id, Faction.ZOMBIE)
+    assert card.id in list(deck)
+    game.undo_move()
+
+    assert deck.getstate() == before
+    assert item_manager.zone_of(card.id) == HAND_RANGES[Faction.ZOMBIE]
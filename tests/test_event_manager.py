@@ -0,0 +1,159 @@
+import pytest
+
+from app.core.base import Faction, Lifetime
+from app.core.engine.game import Game
+from app.core.event.cycle import CycleDetector
+from app.core.event.event import Event
+from app.core.event.listener import Listener
+
+
+class Logged(Event):
+    """
+    Does nothing but log its execution into `data["log"]`.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, log: list, **kwargs):
+        super().__init__(data={"log": log}, **kwargs)
+
+    def execute(self, game):
+        self.data["log"].append((self.name, self.amount))
+        return []
+
+
+class Ping(Logged):
+    __slots__ = ()
+
+
+class Marker(Logged):
+    __slots__ = ()
+
+
+class Finish(Logged):
+    __slots__ = ()
+
+    def execute(self, game):
+        super().execute(game)
+        game.finish(Faction.PLANT)
+        return [Marker(self.data["log"])]
+
+
+class Echo(Listener):
+    """
+    Answers every Ping with another one, `step` higher.
+    """
+
+    def __init__(self, step: int = 0):
+        super().__init__(on_events=[Ping], lifetime=Lifetime.PERMANENT)
+        self.step = step
+
+    def respond(self, event, game):
+        return [Ping(event.data["log"], amount=event.amount + self.step)]
+
+
+@pytest.fixture
+def game(game):
+    # Start from an empty queue
+    game.event_manager.notify(game)
+    return game
+
+
+def run(game, *events):
+    game.run_events(events)
+    game.event_manager.notify(game)
+    return game.event_manager
+
+
+def test_listener_requeuing_its_trigger_is_an_exact_cycle(game):
+    log = []
+    game.event_manager.register(Echo())
+    event_manager = run(game, Ping(log), Marker(log, priority=6))
+
+    assert [report.kind for report in event_manager.cycle_reports] == ["cycle"]
+    assert log.count(("Ping", 0)) < 5
+    assert ("Marker", 0) in log
+    assert not event_manager.event_queue
+
+
+def test_growing_chain_is_a_runaway(game):
+    log = []
+    event_manager = game.event_manager
+    event_manager.cycle_detector = CycleDetector(runaway_steps=40)
+    event_manager.register(Echo(step=1))
+    run(game, Ping(log), Marker(log, priority=6))
+
+    [report] = event_manager.cycle_reports
+    assert report.kind == "runaway"
+    assert report.events == [("Ping", None, None)]
+    assert 40 < len(log) < 100
+    assert ("Marker", 0) in log
+    assert not event_manager.event_queue
+
+
+def test_identical_events_queued_independently_are_no_cycle(game):
+    log = []
+    event_manager = run(game, Ping(log), Ping(log), Ping(log), Marker(log))
+
+    assert event_manager.cycle_reports == []
+    assert log == [("Ping", 0)] * 3 + [("Marker", 0)]
+
+
+def test_aborting_a_chain_keeps_the_other_chains(game):
+    log = []
+    event_manager = game.event_manager
+    event_manager.register(Echo())
+    game.run_events([Marker(log, priority=6), Ping(log), Marker(log, priority=7)])
+    event_manager.notify(game)
+
+    [report] = event_manager.cycle_reports
+    assert report.root != 0
+    assert log.count(("Marker", 0)) == 2
+
+
+def test_spawned_events_belong_to_their_root(game):
+    log = []
+    event_manager = game.event_manager
+    event_manager.register(Echo(step=1))
+    root = Ping(log)
+    game.run_events([root])
+    event_manager.MAX_STEPS = 3
+    event_manager.notify(game)
+
+    [report] = event_manager.cycle_reports
+    assert report.kind == "limit"
+    assert report.root == root.id == root.root_id
+    assert root.parent_id == 0
+
+
+def test_finished_game_leaves_pending_events_unprocessed(game):
+    log = []
+    event_manager = run(game, Finish(log), Marker(log, priority=6))
+
+    assert not game.is_running
+    assert log == [("Finish", 0)]
+    assert len(event_manager.event_queue) == 2
+
+
+def chain_cut_short(game):
+    event_manager = game.event_manager
+    event_manager.MAX_STEPS = 1
+    game.next_phase()
+    event_manager.notify(game)
+    return event_manager
+
+
+def test_aborted_chain_is_reported_quietly_when_headless(game, capsys):
+    event_manager = chain_cut_short(game)
+
+    assert [report.kind for report in event_manager.cycle_reports] == ["limit"]
+    assert capsys.readouterr().out == ""
+
+
+def test_aborted_chain_is_printed_otherwise(capsys):
+    game = Game(1)
+    game.start_game()
+    capsys.readouterr()
+    chain_cut_short(game)
+
+    assert "Event chain aborted" in capsys.readouterr().out
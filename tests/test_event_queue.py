@@ -0,0 +1,77 @@
+from app.core.event.event import Event
+from app.core.event.event_manager import EventQueue
+from app.core.undo import UndoLog
+
+
+class Queued(Event):
+    __slots__ = ()
+
+    def execute(self, game):
+        return []
+
+
+def drain(queue: EventQueue):
+    events = []
+    while queue:
+        events.append(queue.get())
+    return events
+
+
+def test_higher_priorities_come_out_first():
+    queue = EventQueue()
+    events = [Queued(priority=priority) for priority in (3, 7, 0, 5, 1)]
+    for event in events:
+        queue.put(event)
+
+    assert queue.peek_level() == 0
+    assert [event.priority for event in drain(queue)] == [0, 1, 3, 5, 7]
+    assert queue.get() is None and queue.peek_level() is None
+
+
+def test_events_of_a_level_come_out_in_queueing_order():
+    queue = EventQueue()
+    events = [Queued(amount=i, priority=i % 2 * 4) for i in range(10)]
+    for event in events:
+        queue.put(event)
+
+    amounts = [event.amount for event in drain(queue)]
+    assert amounts == [0, 2, 4, 6, 8, 1, 3, 5, 7, 9]
+    assert [event.seq for event in events[::2]] == list(range(5))
+
+
+def test_out_of_range_priorities_are_clamped():
+    queue = EventQueue(levels=4)
+    low, high, normal = Queued(priority=-3), Queued(priority=9), Queued(priority=2)
+    for event in (high, normal, low):
+        queue.put(event)
+    assert drain(queue) == [low, normal, high]
+
+
+def test_events_get_ids_once_and_length_follows():
+    queue = EventQueue()
+    first, second = Queued(), Queued()
+    queue.put(first)
+    queue.put(second)
+    assert len(queue) == 2
+    assert 0 < first.id < second.id
+
+    event = queue.get()
+    queue.put(event)
+    assert event.id == first.id
+    assert len(queue) == 2
+
+
+def test_undo_takes_puts_and_gets_back():
+    queue = EventQueue()
+    queue.undo = undo = UndoLog()
+    kept = Queued(priority=5)
+    queue.put(kept)
+
+    undo.mark()
+    queue.put(Queued(priority=1))
+    assert queue.get().priority == 1
+    assert queue.get() is kept
+    queue.put(Queued(priority=6))
+    undo.undo()
+
+    assert drain(queue) == [kept]
@@ -0,0 +1,102 @@
+import pytest
+
+from app.core.base import Lifetime
+from app.core.event.event import EVENT_REGISTRY, Event
+from app.core.event.listener import Listener
+
+
+class Attack(Event):
+    __slots__ = ()
+
+    def execute(self, game):
+        return []
+
+
+class Bite(Attack):
+    __slots__ = ()
+
+
+class Claw(Attack):
+    __slots__ = ()
+
+
+class Venom(Bite):
+    __slots__ = ()
+
+
+class Idle(Event):
+    __slots__ = ()
+
+    def execute(self, game):
+        return []
+
+
+class Recorder(Listener):
+    def __init__(self, on_events):
+        super().__init__(on_events=on_events, lifetime=Lifetime.PERMANENT)
+        self.heard = []
+
+    def respond(self, event, game):
+        self.heard.append(type(event))
+        return []
+
+
+def make_twin():
+    class RegistryTwin(Event):
+        __slots__ = ()
+
+        def execute(self, game):
+            return []
+
+    return RegistryTwin
+
+
+@pytest.fixture
+def game(game):
+    game.event_manager.notify(game)
+    return game
+
+
+def test_a_base_class_subscription_hears_every_subclass(game):
+    recorder = Recorder([Attack])
+    game.event_manager.register(recorder)
+    game.run_events([Bite(), Idle(), Venom(), Claw(), Attack()])
+    game.event_manager.notify(game)
+
+    assert recorder.heard == [Bite, Venom, Claw, Attack]
+    assert set(recorder.event_codes) == {
+        cls.type_code for cls in (Attack, Bite, Claw, Venom)
+    }
+
+
+def test_a_subclass_subscription_does_not_hear_its_base(game):
+    recorder = Recorder([Bite])
+    game.event_manager.register(recorder)
+    game.run_events([Attack(), Claw(), Bite(), Venom()])
+    game.event_manager.notify(game)
+
+    assert recorder.heard == [Bite, Venom]
+
+
+def test_overlapping_subscriptions_deliver_once():
+    codes = EVENT_REGISTRY.codes_for([Attack, Bite, Venom])
+    assert sorted(codes) == sorted(
+        {cls.type_code for cls in (Attack, Bite, Claw, Venom)}
+    )
+
+
+def test_bare_names_resolve_to_their_class():
+    recorder = Recorder(["Bite"])
+    assert recorder.on_events == (Bite,)
+    assert EVENT_REGISTRY.by_path[Bite.type_path] is Bite
+
+
+def test_unknown_and_ambiguous_names_are_refused():
+    with pytest.raises(ValueError, match="none"):
+        Recorder(["NoSuchEvent"])
+
+    first, second = make_twin(), make_twin()
+    assert first.type_code != second.type_code
+    with pytest.raises(ValueError, match="RegistryTwin"):
+        Recorder(["RegistryTwin"])
+    assert Recorder([first]).on_events == (first,)
@@ -0,0 +1,75 @@
+from app.core.base import Faction, GamePhase, Lifetime
+from app.core.event.listener import Listener
+from app.core.item.card import FighterCard
+from app.core.item.item_manager import HAND_RANGES
+
+
+def test_playing_a_hand_card_in_a_fork_leaves_the_original(game, advance, first_play):
+    advance(game, GamePhase.ZOMBIE_PHASE)
+    card, pos = first_play(game, Faction.ZOMBIE)
+    fighter, state = card.fighter, card.fighter.state
+    before = (fighter.id, fighter.manager, state.copy(), game.ids.next_id)
+    state_hash = game.state_hash
+
+    fork = game.fork()
+    assert fork.apply_move((card.id, pos.id))
+    played = fork.item_manager.get_by_id(card.id).fighter
+    assert played is not fighter
+    played.state.CURRENT_HEALTH = 99
+
+    assert (fighter.id, fighter.manager, state, game.ids.next_id) == before
+    assert game.state_hash == state_hash
+    assert not pos.occupied
+
+
+def test_original_plays_on_after_its_fork_did(game, advance, first_play):
+    advance(game, GamePhase.ZOMBIE_PHASE)
+    card, pos = first_play(game, Faction.ZOMBIE)
+    game.fork().apply_move((card.id, pos.id))
+
+    assert game.apply_move((card.id, pos.id))
+    zombie = card.fighter
+    assert game.item_manager.get_by_id(zombie.id) is zombie
+
+    advance(game, GamePhase.PLANT_PHASE)
+    plant_card, plant_pos = first_play(game, Faction.PLANT)
+    assert game.apply_move((plant_card.id, plant_pos.id))
+    assert plant_card.fighter.id != zombie.id
+    assert game.item_manager.get_by_id(zombie.id) is zombie
+
+
+class Noop(Listener):
+    def respond(self, event, game):
+        return []
+
+
+def hand_fighter(game):
+    for card in game.item_manager[HAND_RANGES[Faction.ZOMBIE]]:
+        if isinstance(card, FighterCard):
+            return card, card.fighter
+    raise AssertionError("No fighter card in hand")
+
+
+def test_abilities_of_cards_not_in_play_bind_to_the_forked_fighter(game):
+    card, fighter = hand_fighter(game)
+    fighter.add_ability("noop", Noop(source=fighter))
+
+    fork = game.fork()
+    forked = fork.item_manager.get_by_id(card.id).fighter
+    assert forked is not fighter
+    assert forked.abilities["noop"].source is forked
+    assert fighter.abilities["noop"].source is fighter
+
+
+def test_registered_listeners_of_untracked_sources_bind_to_the_clone(game):
+    card, fighter = hand_fighter(game)
+    game.event_manager.register(Noop(source=fighter, lifetime=Lifetime.PERMANENT))
+    fighter.add_ability("noop", Noop(source=fighter))
+    game.event_manager.register(fighter.abilities["noop"])
+
+    fork = game.fork()
+    forked = fork.item_manager.get_by_id(card.id).fighter
+    listeners = list(fork.event_manager.listener_pool.listeners)
+    assert len(listeners) == len(game.event_manager.listener_pool.listeners)
+    assert forked.abilities["noop"] in listeners
+    assert {listener.source for listener in listeners if listener.source} == {forked}
@@ -0,0 +1,99 @@
+import pytest
+
+from app.core.base import Faction
+from app.core.item.item_manager import POS_RANGES
+
+
+HERO_RANGES = {Faction.ZOMBIE: "z_hero", Faction.PLANT: "p_hero"}
+
+
+def frontier(item_manager, lane: int, faction: Faction):
+    """
+    The fighter in front for a faction in a lane, found by walking its poses.
+    """
+    poses = [pos for pos in item_manager[POS_RANGES[faction]] if pos.lane == lane]
+    for pos in sorted(poses, key=lambda pos: pos.index):
+        if pos.occupied:
+            return item_manager.get_by_id(pos.occupier_id)
+    return None
+
+
+def assert_frontiers_match(item_manager):
+    for lane in range(item_manager.num_lanes):
+        for faction in (Faction.ZOMBIE, Faction.PLANT):
+            assert item_manager.frontier_fighter(lane, faction) is frontier(
+                item_manager, lane, faction
+            ), (lane, faction)
+
+    for fighter in item_manager.fighters:
+        pos = fighter.on_pos
+        opponent = pos.faction.opponent
+        hero = item_manager[HERO_RANGES[opponent]].first()
+        if fighter.state.ABILITIES.STRIKETHROUGH:
+            poses = [
+                p for p in item_manager[POS_RANGES[opponent]] if p.lane == pos.lane
+            ]
+            expected = [
+                item_manager.get_by_id(p.occupier_id)
+                for p in sorted(poses, key=lambda p: p.index)
+                if p.occupied
+            ] + [hero]
+        else:
+            expected = [frontier(item_manager, pos.lane, opponent) or hero]
+        assert item_manager.attack_targets(fighter) == expected, fighter
+
+
+def shuffle_board(game, rng, steps: int):
+    """
+    Walk, bounce and destroy fighters at random.
+    """
+    item_manager = game.item_manager
+    for _ in range(steps):
+        fighters = list(item_manager.fighters)
+        if not fighters:
+            return
+        fighter = rng.choice(fighters)
+        roll = rng.random()
+        if roll < 0.5:
+            vacant = [
+                pos
+                for pos in item_manager[POS_RANGES[fighter.on_pos.faction]]
+                if not pos.occupied
+            ]
+            if vacant:
+                fighter.move_to(rng.choice(vacant))
+        elif roll < 0.75:
+            fighter.bounce()
+            item_manager.remove_item(fighter.id)
+        else:
+            item_manager.destroy_fighter(fighter)
+        assert_frontiers_match(item_manager)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_frontiers_and_targets_follow_the_board(board, seed):
+    game = board(seed)
+    assert_frontiers_match(game.item_manager)
+    shuffle_board(game, game.rng.stream("test/frontier"), 20)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_frontiers_are_restored_by_undo_and_kept_apart_in_forks(board, seed):
+    game = board(seed)
+    item_manager = game.item_manager
+    before = {
+        (lane, faction): item_manager.frontier_fighter(lane, faction)
+        for lane in range(item_manager.num_lanes)
+        for faction in (Faction.ZOMBIE, Faction.PLANT)
+    }
+
+    fork = game.fork()
+    shuffle_board(fork, fork.rng.stream("test/frontier"), 10)
+    assert_frontiers_match(fork.item_manager)
+    assert_frontiers_match(item_manager)
+
+    game.undo.mark()
+    shuffle_board(game, game.rng.stream("test/frontier"), 10)
+    game.undo_move()
+    assert_frontiers_match(item_manager)
+    assert {key: item_manager.frontier_fighter(*key) for key in before} == before
@@ -0,0 +1,43 @@
+from app.core.base import Faction
+from app.core.engine.headless import (
+    HeadlessRunner,
+    PassBot,
+    RandomBot,
+    ScriptedBot,
+    new_game,
+    throughput,
+)
+
+
+def test_headless_games_print_nothing(decks, capsys):
+    HeadlessRunner(RandomBot(), RandomBot()).play(new_game(3, decks))
+    assert capsys.readouterr().out == ""
+
+
+def test_seeded_games_play_out_identically(decks):
+    runner = HeadlessRunner(RandomBot(), RandomBot())
+    first = list(runner.run(decks, range(5)))
+    assert list(runner.run(decks, range(5))) == first
+    assert len({(result.winner, result.turns) for result in first}) > 1
+
+
+def test_games_nobody_plays_are_draws_at_the_turn_limit(decks):
+    result = HeadlessRunner(PassBot(), PassBot(), max_turns=4).play(new_game(1, decks))
+    assert (result.winner, result.turns) == (None, 4)
+    assert result.plays == {Faction.ZOMBIE: [], Faction.PLANT: []}
+
+
+def test_random_bot_beats_a_bot_that_passes(decks):
+    results = HeadlessRunner(RandomBot(), PassBot()).run(decks, range(10))
+    assert all(result.winner == Faction.ZOMBIE for result in results)
+
+
+def test_invalid_operations_are_skipped(decks):
+    bogus = [{"operation_name": "play_card"}, {"nonsense": 1}]
+    runner = HeadlessRunner(ScriptedBot(bogus), PassBot(), max_turns=2)
+    result = runner.play(new_game(1, decks))
+    assert result.plays == {Faction.ZOMBIE: [], Faction.PLANT: []}
+
+
+def test_throughput_counts_whole_games(decks):
+    assert throughput(HeadlessRunner(RandomBot(), PassBot()), decks, 3) > 0
@@ -0,0 +1,46 @@
+import pytest
+
+from app.core.event.event import EVENT_REGISTRY
+from app.core.event.events import EndPhaseEvent
+from app.core.identity import IdAllocator, parse_id, render_id
+from app.core.item.item_manager import ZONES
+
+
+def test_ids_are_monotonic_and_forks_continue_apart():
+    ids = IdAllocator()
+    assert [ids.allocate() for _ in range(3)] == [1, 2, 3]
+
+    fork = ids.fork()
+    assert fork.allocate() == ids.allocate() == 4
+    assert fork.allocate() == 5
+    assert ids.allocated == 4
+
+
+def test_ids_are_rendered_and_parsed_back():
+    assert parse_id(render_id(42)) == 42
+    for text in ("0", "-3", "card"):
+        with pytest.raises(ValueError):
+            parse_id(text)
+
+
+def test_engine_events_carry_no_instance_dict():
+    engine_events = [
+        cls for cls in EVENT_REGISTRY.classes if cls.__module__.startswith("app.")
+    ]
+    assert EndPhaseEvent in engine_events
+    for cls in engine_events:
+        # A class without __slots__ anywhere in the MRO gives instances a dict
+        assert not any("__dict__" in vars(klass) for klass in cls.__mro__), cls
+
+
+def test_events_do_not_use_up_item_ids(game):
+    game.event_manager.notify(game)
+    item_manager = game.item_manager
+    item_ids = [item.id for zone in ZONES for item in item_manager[zone]]
+    next_item_id = game.ids.next_id
+    events = [EndPhaseEvent() for _ in range(3)]
+    game.run_events(events)
+
+    assert len(set(item_ids)) == len(item_ids) and max(item_ids) < next_item_id
+    assert game.ids.next_id == next_item_id
+    assert [event.id for event in events] == sorted({event.id for event in events})
@@ -0,0 +1,92 @@
+import pytest
+
+from app.core.base import ABILITY_NAMES, Faction
+from app.core.item.item_manager import GRAVEYARD_RANGES, HAND_RANGES
+
+SUBTYPES = (None, ["FighterCard"], ["TrickCard", "EnvCard"])
+
+
+def assert_indexes_match(item_manager):
+    """
+    The index queries give what a scan of the range gives.
+    """
+    for hand in HAND_RANGES.values():
+        cards = list(item_manager[hand])
+        for max_cost in range(-1, 12):
+            for subtypes in SUBTYPES:
+                expected = {
+                    card
+                    for card in cards
+                    if card.cost <= max_cost
+                    and (subtypes is None or card.subtype in subtypes)
+                }
+                playable = item_manager.playable(hand, max_cost, subtypes)
+                assert len(playable) == len(expected)
+                assert set(playable) == expected, (hand, max_cost, subtypes)
+
+    fighters = list(item_manager.fighters)
+    for name in ABILITY_NAMES:
+        expected = {f for f in fighters if getattr(f.state.ABILITIES, name)}
+        assert set(item_manager.with_ability(name)) == expected, name
+
+
+def test_playable_cards_are_cheapest_first_per_subtype(game):
+    game.event_manager.notify(game)
+    hand = HAND_RANGES[Faction.PLANT]
+    playable = game.item_manager.playable(hand, 99)
+    for subtype in {card.subtype for card in playable}:
+        costs = [card.cost for card in playable if card.subtype == subtype]
+        assert costs == sorted(costs)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_indexes_follow_moves_and_reindexing(board, seed):
+    game = board(seed)
+    item_manager = game.item_manager
+    rng = game.rng.stream("test/indexes")
+    assert_indexes_match(item_manager)
+
+    for faction, hand in HAND_RANGES.items():
+        for _ in range(4):
+            item_manager.draw(faction)
+        cards = list(item_manager[hand])
+        for card in rng.sample(cards, len(cards) // 2):
+            card.cost = max(0, card.cost + rng.randint(-2, 2))
+            item_manager.reindex(card)
+        item_manager.move(rng.choice(cards).id, GRAVEYARD_RANGES[faction])
+    assert_indexes_match(item_manager)
+
+    fighters = list(item_manager.fighters)
+    for fighter in rng.sample(fighters, len(fighters) // 2):
+        abilities = fighter.state.ABILITIES
+        name = rng.choice(("FRENZY", "STRIKETHROUGH", "DEADLY"))
+        setattr(abilities, name, not getattr(abilities, name))
+        item_manager.reindex(fighter)
+    for fighter in rng.sample(fighters, len(fighters) // 3):
+        item_manager.destroy_fighter(fighter)
+    assert_indexes_match(item_manager)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_indexes_are_restored_by_undo_and_kept_apart_in_forks(board, seed):
+    game = board(seed)
+    item_manager = game.item_manager
+    hand = HAND_RANGES[Faction.ZOMBIE]
+    before = set(item_manager.playable(hand, 3))
+
+    fork = game.fork()
+    for card in fork.item_manager[hand]:
+        card.cost = 0
+        fork.item_manager.reindex(card)
+    for fighter in list(fork.item_manager.fighters):
+        fork.item_manager.destroy_fighter(fighter)
+    assert_indexes_match(fork.item_manager)
+    assert_indexes_match(item_manager)
+    assert set(item_manager.playable(hand, 3)) == before
+
+    game.undo.mark()
+    item_manager.draw(Faction.ZOMBIE)
+    item_manager.move(item_manager[hand].first().id, GRAVEYARD_RANGES[Faction.ZOMBIE])
+    game.undo_move()
+    assert_indexes_match(item_manager)
+    assert set(item_manager.playable(hand, 3)) == before
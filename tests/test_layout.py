@@ -0,0 +1,81 @@
+import pytest
+
+from app.core.base import ABILITY_NAMES, Ability, Faction
+from app.core.event.events import EndPhaseEvent
+from app.core.item.item_manager import ZONES
+from app.core.item.target import Fighter
+
+
+def test_items_and_their_states_carry_no_instance_dict(board):
+    game = board(1)
+    items = [item for zone in ZONES for item in game.item_manager[zone]]
+    assert any(isinstance(item, Fighter) for item in items)
+    for item in items:
+        assert not hasattr(item, "__dict__"), type(item)
+        if isinstance(item, Fighter):
+            assert not hasattr(item.state, "__dict__")
+            assert not hasattr(item.state.ABILITIES, "__dict__")
+
+
+def test_ability_flags_are_independent_and_round_trip():
+    names = [
+        name for name in ABILITY_NAMES if isinstance(getattr(Ability(), name), bool)
+    ]
+    for name in names:
+        ability = Ability(**{name: True})
+        assert [other for other in names if getattr(ability, other)] == [name]
+        setattr(ability, name, False)
+        assert ability == Ability()
+
+    ability = Ability(DEADLY=True, FRENZY=True, ARMOURED=2)
+    copy = ability.copy()
+    assert copy == ability and copy.packed() == ability.packed()
+    copy.FRENZY = False
+    assert ability.FRENZY and not copy.FRENZY
+
+
+def test_unknown_abilities_are_refused():
+    with pytest.raises(TypeError):
+        Ability(FLYING=True)
+
+
+def test_fighters_of_one_card_own_their_abilities(zombie_in_play):
+    fighter = zombie_in_play
+    clone = fighter.fork()
+    clone.state.ABILITIES.DEADLY = not fighter.state.ABILITIES.DEADLY
+    assert clone.state.ABILITIES != fighter.state.ABILITIES
+
+
+def test_activation_bits_per_faction_and_undo(game):
+    game.event_manager.notify(game)
+    item = game.item_manager.end_phase_button
+    item.deactivate()
+
+    game.undo.mark()
+    item.activate(Faction.PLANT)
+    item.activate(Faction.ZOMBIE)
+    item.deactivate(Faction.PLANT)
+    assert item.activated == {Faction.PLANT: False, Faction.ZOMBIE: True}
+    assert item.is_activated(Faction.ZOMBIE) and not item.is_activated(Faction.PLANT)
+
+    game.undo_move()
+    assert item.activated == {Faction.PLANT: False, Faction.ZOMBIE: False}
+
+
+def test_footprint_is_broken_down_and_follows_the_game(game):
+    game.event_manager.notify(game)
+    footprint = game.memory_footprint()
+    assert set(footprint.components) == {
+        "items",
+        "indexes",
+        "listeners",
+        "events",
+        "other",
+    }
+    assert footprint.total == sum(footprint.components.values()) > 0
+    assert game.memory_footprint().components == footprint.components
+
+    game.run_events([EndPhaseEvent() for _ in range(20)])
+    queued = game.memory_footprint()
+    assert queued.components["events"] > footprint.components["events"]
+    assert queued.components["items"] == footprint.components["items"]
@@ -0,0 +1,91 @@
+from random import Random
+
+import pytest
+
+from app.core.base import Faction, GamePhase
+from app.core.engine.headless import ACTIVE_FACTION, new_game
+from app.core.event.listener import Listener
+from app.core.item.card import Card
+from app.core.item.item_manager import HAND_RANGES, POS_RANGES, ZONES
+
+
+class TeamUp(Listener):
+    def respond(self, event, game):
+        return []
+
+
+def brute_force(game, faction: Faction):
+    """
+    Every play of a faction, straight from the rules of PlayCardAction.
+    """
+    item_manager = game.item_manager
+    plays = set()
+    for card in item_manager[HAND_RANGES[faction]]:
+        if not card.is_activated(faction):
+            continue
+        for pos in item_manager[POS_RANGES[faction]]:
+            if pos.occupier_id is None:
+                plays.add((card.id, pos.id))
+            elif faction == Faction.PLANT:
+                partner = item_manager.same_lane_pos(pos)
+                occupier = item_manager.get_by_id(pos.occupier_id)
+                teams_up = (
+                    "team_up" in card.abilities or "team_up" in occupier.abilities
+                )
+                if partner is not None and not partner.occupied and teams_up:
+                    plays.add((card.id, pos.id))
+    return plays
+
+
+def check(game):
+    item_manager = game.item_manager
+    cards = [
+        item for zone in ZONES for item in item_manager[zone] if isinstance(item, Card)
+    ]
+    poses = list(item_manager[tuple(POS_RANGES.values())])
+    for faction in (Faction.ZOMBIE, Faction.PLANT):
+        moves = [(card.id, pos.id) for card, pos in game.legal_moves.moves(faction)]
+        expected = brute_force(game, faction)
+        assert len(moves) == len(set(moves))
+        assert set(moves) == expected
+        assert {
+            (card.id, pos.id)
+            for card in cards
+            for pos in poses
+            if game.legal_moves.is_legal(faction, card.id, pos.id)
+        } == expected
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_legal_moves_match_a_brute_force_enumeration(decks, seed):
+    rng = Random(seed)
+    game = new_game(seed, decks)
+    game.event_manager.notify(game)
+    # Let some plants stack, which no bundled card does
+    for card in list(game.item_manager[HAND_RANGES[Faction.PLANT]])[::2]:
+        card.add_ability("team_up", TeamUp())
+        game.item_manager.reindex(card)
+
+    for _ in range(120):
+        if not game.is_running:
+            break
+        check(game)
+        faction = ACTIVE_FACTION.get(game.phase)
+        moves = game.legal_moves.moves(faction) if faction is not None else []
+        if moves and rng.random() < 0.7:
+            card, pos = rng.choice(moves)
+            assert game.apply_move((card.id, pos.id))
+        else:
+            assert game.apply_move(None)
+    check(game)
+
+
+def test_undone_play_is_legal_again(game, advance, first_play):
+    advance(game, GamePhase.PLANT_PHASE)
+    card, pos = first_play(game, Faction.PLANT)
+    assert game.apply_move((card.id, pos.id))
+    assert (card, pos) not in game.legal_moves.moves(Faction.PLANT)
+
+    game.undo_move()
+    assert (card, pos) in game.legal_moves.moves(Faction.PLANT)
+    check(game)
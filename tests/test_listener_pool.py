@@ -0,0 +1,142 @@
+import pytest
+
+from app.core.base import Faction, Lifetime
+from app.core.event.event import Event
+from app.core.event.listener import Listener
+from app.core.item.card import FighterCard
+from app.core.item.item_manager import DECK_RANGES, POS_RANGES
+
+
+class Ping(Event):
+    __slots__ = ()
+
+    def execute(self, game):
+        return []
+
+
+class Heard(Listener):
+    def __init__(self, source=None, on_events=(Ping,)):
+        super().__init__(
+            source=source, on_events=list(on_events), lifetime=Lifetime.PERMANENT
+        )
+
+    def respond(self, event, game):
+        return []
+
+
+@pytest.fixture
+def game(game):
+    game.event_manager.notify(game)
+    return game
+
+
+def land(game, poses):
+    """
+    Land a fresh zombie fighter on each pos, in the order given.
+    """
+    item_manager = game.item_manager
+    card = next(
+        card
+        for card in item_manager[DECK_RANGES[Faction.ZOMBIE]]
+        if isinstance(card, FighterCard)
+    )
+    fighters = []
+    for pos in poses:
+        fighter = card.fighter.fork()
+        item_manager.land_fighter(fighter, pos)
+        fighters.append(fighter)
+    return fighters
+
+
+def heard(game):
+    return list(game.event_manager.listener_pool.query_by_event(Ping))
+
+
+def test_listeners_are_dispatched_in_board_order(game):
+    poses = list(game.item_manager[POS_RANGES[Faction.ZOMBIE]])
+    fighters = land(game, reversed(poses[:3]))
+    first, second = Heard(), Heard()
+    on_board = [Heard(fighter) for fighter in fighters]
+    for listener in (on_board[1], first, on_board[0], on_board[2], second):
+        game.event_manager.register(listener)
+
+    # Listeners without a source first, as registered, then by position
+    assert heard(game) == [first, second] + on_board[::-1]
+
+
+def test_registering_and_unregistering_refresh_the_dispatch_table(game):
+    early = Heard()
+    game.event_manager.register(early)
+    assert heard(game) == [early]
+
+    late = Heard()
+    game.event_manager.register(late)
+    assert heard(game) == [early, late]
+
+    game.event_manager.unregister(early)
+    assert heard(game) == [late]
+
+
+def test_moving_a_source_refreshes_the_dispatch_table(game):
+    poses = list(game.item_manager[POS_RANGES[Faction.ZOMBIE]])
+    left, right = land(game, [poses[0], poses[1]])
+    listeners = [Heard(left), Heard(right)]
+    for listener in listeners:
+        game.event_manager.register(listener)
+    assert heard(game) == listeners
+
+    left.move_to(poses[2])
+    assert heard(game) == listeners[::-1]
+
+
+def test_unregistering_a_source_removes_all_its_listeners(game):
+    poses = list(game.item_manager[POS_RANGES[Faction.ZOMBIE]])
+    gone, kept = land(game, poses[:2])
+    pool = game.event_manager.listener_pool
+    theirs = [Heard(gone), Heard(gone, on_events=(Event,))]
+    others = [Heard(), Heard(kept)]
+    for listener in theirs + others:
+        game.event_manager.register(listener)
+    heard(game)
+
+    assert pool.unregister_source(gone.id) == theirs
+    assert pool.query_by_source(gone.id) == []
+    assert heard(game) == others
+    assert pool.unregister_source(gone.id) == []
+
+
+def test_unregistering_a_source_is_undone_in_dispatch_order(game):
+    poses = list(game.item_manager[POS_RANGES[Faction.ZOMBIE]])
+    fighter, other = land(game, poses[:2])
+    listeners = [Heard(fighter), Heard(other), Heard(fighter)]
+    for listener in listeners:
+        game.event_manager.register(listener)
+    before = heard(game)
+
+    game.undo.mark()
+    game.event_manager.unregister_source(fighter.id)
+    game.undo_move()
+
+    assert heard(game) == before
+    pool = game.event_manager.listener_pool
+    assert pool.query_by_source(fighter.id) == listeners[::2]
+
+
+def test_listeners_without_a_source_can_be_cleared(game):
+    pool = game.event_manager.listener_pool
+    cleared = Heard()
+    game.event_manager.register(cleared)
+    assert cleared in pool.unregister_source(None)
+    assert heard(game) == []
+
+    again = Heard()
+    game.event_manager.register(again)
+    assert heard(game) == [again]
+
+
+def test_removed_items_take_their_listeners_along(game):
+    fighter = land(game, list(game.item_manager[POS_RANGES[Faction.ZOMBIE]])[:1])[0]
+    game.event_manager.register(Heard(fighter))
+
+    game.item_manager.remove_item(fighter.id)
+    assert heard(game) == []
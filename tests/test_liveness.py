@@ -0,0 +1,71 @@
+from app.core.base import Faction
+from app.core.event.event import Event
+from app.core.item.item_manager import GRAVEYARD_RANGES, HAND_RANGES
+from app.core.item.liveness import LivenessTable
+
+
+class Touch(Event):
+    __slots__ = ()
+
+    def execute(self, game):
+        self.data["touched"].append(self.target_id)
+        return []
+
+
+def test_stale_generations_are_rejected():
+    table = LivenessTable(capacity=4)
+    table.spawn(2)
+    seen = table.generation(2)
+    assert table.check(2, seen)
+
+    table.bump(2)
+    assert not table.check(2, seen)
+    assert table.check(2, table.generation(2))
+    # Generation 0 stands for "not recorded", only liveness counts
+    assert table.check(2, 0)
+
+
+def test_dead_and_unknown_ids_are_rejected():
+    table = LivenessTable(capacity=4)
+    table.spawn(1)
+    seen = table.generation(1)
+    table.kill(1)
+
+    assert not table.is_alive(1)
+    assert not table.check(1, seen) and not table.check(1, 0)
+    assert not table.is_alive(3) and not table.check(1000, 0)
+    assert table.generation(1000) == 0
+
+
+def test_ids_beyond_the_capacity_grow_the_table():
+    table = LivenessTable(capacity=2)
+    table.spawn(40)
+    assert table.is_alive(40) and table.check(40, table.generation(40))
+
+
+def test_forks_age_apart():
+    table = LivenessTable()
+    table.spawn(5)
+    seen = table.generation(5)
+    fork = table.fork()
+    fork.bump(5)
+
+    assert table.check(5, seen)
+    assert not fork.check(5, seen)
+
+
+def test_events_about_a_moved_item_are_dropped(game):
+    game.event_manager.notify(game)
+    item_manager = game.item_manager
+    card = item_manager[HAND_RANGES[Faction.ZOMBIE]].first()
+    touched = []
+    stale, fresh = (Touch(target=card.id, data={"touched": touched}) for _ in range(2))
+    game.run_events([stale])
+
+    # Queued before the move the event remembers the card's old generation
+    item_manager.move(card.id, GRAVEYARD_RANGES[Faction.ZOMBIE])
+    game.run_events([fresh])
+    game.event_manager.notify(game)
+
+    assert touched == [card.id]
+    assert stale.target_gen < fresh.target_gen
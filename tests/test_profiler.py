@@ -0,0 +1,98 @@
+import pytest
+
+from app.core.base import Lifetime
+from app.core.event.event import Event
+from app.core.event.listener import Listener
+from app.core.event.profiler import GLOBAL_OWNER, EventProfiler
+
+
+class Step(Event):
+    """
+    Queues the next step of its chain until `amount` reaches zero.
+    """
+
+    __slots__ = ()
+
+    def execute(self, game):
+        return [Step(amount=self.amount - 1)] if self.amount > 0 else []
+
+
+class Blocked(Event):
+    __slots__ = ()
+
+    def execute(self, game):
+        return []
+
+
+class Blocker(Listener):
+    def __init__(self, source=None):
+        super().__init__(
+            source=source, on_events=[Blocked, Step], lifetime=Lifetime.PERMANENT
+        )
+
+    def respond(self, event, game):
+        if isinstance(event, Blocked):
+            event.cancel()
+        return []
+
+
+@pytest.fixture
+def profiled(game):
+    game.event_manager.notify(game)
+    profiler = game.event_manager.profiler = EventProfiler()
+    return game, profiler
+
+
+def run(game, *events):
+    game.run_events(events)
+    game.event_manager.notify(game)
+
+
+def test_events_are_counted_by_type(profiled):
+    game, profiler = profiled
+    run(game, Step(amount=3), Blocked(), Blocked())
+
+    stats = profiler.event_stats
+    assert (stats["Step"].count, stats["Step"].cancelled) == (4, 0)
+    assert (stats["Blocked"].count, stats["Blocked"].cancelled) == (2, 0)
+    assert profiler.notify_stats[-1].steps == 6
+
+
+def test_cancelled_events_are_not_executed(profiled):
+    game, profiler = profiled
+    game.event_manager.register(Blocker())
+    run(game, Blocked())
+
+    stats = profiler.event_stats["Blocked"]
+    assert (stats.count, stats.cancelled, stats.execute_time) == (1, 1, 0.0)
+
+
+def test_chain_depth_and_queue_high_water(profiled):
+    game, profiler = profiled
+    run(game, Step(amount=4), Blocked(), Blocked())
+
+    notify = profiler.notify_stats[-1]
+    assert notify.max_chain_depth == 5
+    assert notify.queue_high_water == 3
+
+
+def test_listener_time_goes_to_the_owning_card(zombie_in_play, profiled):
+    game, profiler = profiled
+    fighter = zombie_in_play
+    game.event_manager.register(Blocker())
+    game.event_manager.register(Blocker(fighter))
+    run(game, Step(amount=1))
+
+    name = fighter.proto_card.config.name
+    assert profiler.card_stats[GLOBAL_OWNER].calls == 2
+    assert profiler.card_stats[name].calls == 2
+    assert {owner for owner, _ in profiler.slowest_cards()} == {GLOBAL_OWNER, name}
+
+
+def test_notify_without_a_profiler_records_nothing(profiled):
+    game, profiler = profiled
+    game.event_manager.profiler = None
+    run(game, Step(amount=2))
+
+    assert profiler.event_stats == {}
+    assert len(profiler.notify_stats) == 0
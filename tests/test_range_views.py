@@ -0,0 +1,92 @@
+import pytest
+
+from app.core.base import Faction
+from app.core.item.item_manager import (
+    DECK_RANGES,
+    GRAVEYARD_RANGES,
+    HAND_RANGES,
+    ZONES,
+)
+from app.core.item.position import Pos
+from app.core.item.target import Env, Fighter
+
+
+def assert_views_match(item_manager):
+    """
+    Every view holds exactly the items tracked in its range, and the derived
+    views hold their parents' items of their type.
+    """
+    everything = item_manager.filter(lambda item: True)
+    for zone in ZONES:
+        view = item_manager[zone]
+        tracked = {
+            item.id for item in everything if item_manager.zone_of(item.id) == zone
+        }
+        assert set(view.ids()) == tracked, zone
+        assert all(isinstance(item, view.kind) for item in view), zone
+        assert all(view.get(item.id) is item for item in view), zone
+
+    assert set(item_manager.poses) == set(item_manager["z_poses", "p_poses"])
+    targets = list(item_manager["targets"])
+    assert list(item_manager.fighters) == [t for t in targets if isinstance(t, Fighter)]
+    assert list(item_manager.envs) == [t for t in targets if isinstance(t, Env)]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_views_follow_moves_and_removals(board, seed):
+    game = board(seed)
+    item_manager = game.item_manager
+    rng = game.rng.stream("test/views")
+    assert_views_match(item_manager)
+
+    for faction in (Faction.ZOMBIE, Faction.PLANT):
+        for _ in range(3):
+            item_manager.draw(faction)
+        hand = list(item_manager[HAND_RANGES[faction]])
+        item_manager.move(rng.choice(hand).id, GRAVEYARD_RANGES[faction])
+    assert_views_match(item_manager)
+
+    fighters = list(item_manager.fighters)
+    for fighter in rng.sample(fighters, len(fighters) // 2):
+        if rng.random() < 0.5:
+            item_manager.destroy_fighter(fighter)
+        else:
+            item_manager.remove_item(fighter.id)
+    assert_views_match(item_manager)
+    assert all(not fighter.state.IS_DESTROYED for fighter in item_manager.fighters)
+
+
+def test_a_moved_item_leaves_its_former_view(game):
+    item_manager = game.item_manager
+    deck, hand = DECK_RANGES[Faction.PLANT], HAND_RANGES[Faction.PLANT]
+    card = item_manager[deck].first()
+    drawn = len(item_manager[hand])
+
+    assert item_manager.move(card.id, hand) == deck
+    assert card.id not in item_manager[deck]
+    assert item_manager[hand].get(card.id) is card
+    assert len(item_manager[hand]) == drawn + 1
+
+
+def test_undo_puts_items_back_in_view_order(game):
+    item_manager = game.item_manager
+    hand = HAND_RANGES[Faction.ZOMBIE]
+    before = {zone: list(item_manager[zone].ids()) for zone in ZONES}
+    middle = list(item_manager[hand])[1]
+
+    game.undo.mark()
+    item_manager.move(middle.id, GRAVEYARD_RANGES[Faction.ZOMBIE])
+    item_manager.remove_item(item_manager[hand].first().id)
+    game.undo_move()
+
+    assert {zone: list(item_manager[zone].ids()) for zone in ZONES} == before
+    assert_views_match(item_manager)
+
+
+def test_ranges_admit_only_their_item_type(game):
+    item_manager = game.item_manager
+    pos = item_manager.poses.first()
+    with pytest.raises(TypeError):
+        item_manager.keep_track("lanes", pos)
+    with pytest.raises(ValueError):
+        item_manager.keep_track("poses", Pos(0, 1, Faction.ZOMBIE))
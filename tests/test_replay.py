@@ -0,0 +1,67 @@
+import pytest
+
+from app.core.engine.headless import new_game
+from app.core.engine.replay import ReplayEngine
+from app.core.event.journal import EventJournal, JournalReader
+from app.core.item.item_manager import GRAVEYARD_RANGES, HAND_RANGES, POS_RANGES
+
+
+@pytest.fixture
+def played(played_game):
+    def played(seed: int):
+        journal = EventJournal()
+        return played_game(seed, journal=journal), journal.getvalue()
+
+    return played
+
+
+def zones(game):
+    item_manager = game.item_manager
+    cards = [
+        [item.id for item in item_manager[ranges[faction]]]
+        for ranges in (HAND_RANGES, GRAVEYARD_RANGES)
+        for faction in ranges
+    ]
+    occupiers = [
+        [pos.occupier_id for pos in item_manager[POS_RANGES[faction]]]
+        for faction in POS_RANGES
+    ]
+    return cards, occupiers
+
+
+def test_journal_starts_with_the_setup(played, decks):
+    _, data = played(3)
+    setup = JournalReader(data).setup()
+    assert setup is not None
+    assert setup.seed == 3
+    assert setup.decks == {
+        faction: [data.card_id for data in deck] for faction, deck in decks.items()
+    }
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_replay_rebuilds_a_played_game(played, seed):
+    game, data = played(seed)
+    replayed = ReplayEngine(data).run()
+
+    assert replayed.headless
+    assert replayed.state_hash == game.state_hash
+    assert (replayed.phase, replayed.turn_count) == (game.phase, game.turn_count)
+    assert zones(replayed) == zones(game)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_reproduces_a_seeded_game(played, seed):
+    game, data = played(seed)
+    assert ReplayEngine(data).reproduces(game)
+
+
+def test_reproduces_tells_games_apart(played):
+    game, _ = played(1)
+    _, data = played(2)
+    assert not ReplayEngine(data).reproduces(game)
+
+
+def test_replay_into_a_game_set_up_by_the_caller(played, decks):
+    game, data = played(4)
+    assert ReplayEngine(data).reproduces(game, replay_into=new_game(4, decks))
@@ -0,0 +1,90 @@
+import pytest
+
+from app.core.base import Faction
+from app.core.engine.headless import new_game
+from app.core.rng import BLOCK, EFFECTS, SHUFFLE, GameRandom
+
+
+def draws(stream, count: int = 8):
+    return [stream.randint(0, 10**6) for _ in range(count)]
+
+
+def test_a_seed_replays_every_stream():
+    first, second = GameRandom(11), GameRandom(11)
+    for name in (SHUFFLE, BLOCK, EFFECTS):
+        assert draws(first.stream(name)) == draws(second.stream(name))
+    assert draws(GameRandom(12).stream(SHUFFLE)) != draws(
+        GameRandom(11).stream(SHUFFLE)
+    )
+
+
+def test_streams_do_not_shift_each_other():
+    busy, quiet = GameRandom(5), GameRandom(5)
+    draws(busy.stream(EFFECTS), 1000)
+    assert draws(busy.stream(BLOCK)) == draws(quiet.stream(BLOCK))
+    assert draws(busy.stream(SHUFFLE)) != draws(busy.stream(BLOCK))
+
+
+def test_an_unseeded_game_keeps_its_seed():
+    rng = GameRandom()
+    assert draws(rng.stream(SHUFFLE)) == draws(GameRandom(rng.seed).stream(SHUFFLE))
+
+
+def test_forks_continue_with_the_same_draws_apart():
+    rng = GameRandom(3)
+    stream = rng.stream(EFFECTS)
+    draws(stream)
+    fork = rng.fork()
+    assert draws(fork.stream(EFFECTS)) == draws(stream)
+
+    draws(fork.stream(EFFECTS), 50)
+    assert draws(fork.stream(BLOCK)) == draws(rng.stream(BLOCK))
+    assert draws(stream) != draws(fork.stream(EFFECTS))
+
+
+def test_block_draws_are_seeded_and_in_range():
+    pytest.importorskip("numpy")
+    first, second = GameRandom(9).stream(BLOCK), GameRandom(9).stream(BLOCK)
+    block = first.integers(1, 6, 500)
+    assert block.tolist() == second.integers(1, 6, 500).tolist()
+    assert block.min() == 1 and block.max() == 6
+
+    fast = [first.fast_randint(0, 3) for _ in range(5000)]
+    assert fast == [second.fast_randint(0, 3) for _ in range(5000)]
+    assert set(fast) == {0, 1, 2, 3}
+
+
+def test_block_draws_leave_the_scalar_draws_alone():
+    pytest.importorskip("numpy")
+    busy, quiet = GameRandom(4).stream(BLOCK), GameRandom(4).stream(BLOCK)
+    busy.integers(0, 9, 100)
+    busy.fast_randint(0, 9)
+    assert draws(busy) == draws(quiet)
+
+
+def test_forks_continue_the_block_draws():
+    pytest.importorskip("numpy")
+    rng = GameRandom(8)
+    stream = rng.stream(BLOCK)
+    stream.fast_randint(0, 99)
+    stream.integers(0, 99, 10)
+    fork = rng.fork().stream(BLOCK)
+
+    assert [fork.fast_randint(0, 99) for _ in range(100)] == [
+        stream.fast_randint(0, 99) for _ in range(100)
+    ]
+    assert fork.integers(0, 99, 10).tolist() == stream.integers(0, 99, 10).tolist()
+
+
+def test_a_game_seed_replays_the_shuffles(decks):
+    def deck_order(seed):
+        game = new_game(seed, decks)
+        item_manager = game.item_manager
+        return [
+            item_manager.get_by_id(card_id).name
+            for faction in (Faction.ZOMBIE, Faction.PLANT)
+            for card_id in item_manager.deck(faction)
+        ]
+
+    assert deck_order(21) == deck_order(21)
+    assert deck_order(21) != deck_order(22)
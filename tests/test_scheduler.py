@@ -0,0 +1,74 @@
+import inspect
+
+import pytest
+
+from app.core.base import GamePhase
+from app.core.engine.scheduler import PhaseScheduler
+
+
+def test_transitions_requested_while_draining_run_in_the_same_loop():
+    scheduler = PhaseScheduler()
+    phases = list(GamePhase)
+    depth, deepest, seen = 0, 0, []
+
+    def advance(target):
+        nonlocal depth, deepest
+        depth += 1
+        deepest = max(deepest, depth)
+        seen.append(target)
+        if len(seen) < 5:
+            scheduler.request(phases[len(seen)])
+            # A nested drain only leaves the request queued
+            scheduler.drain(advance)
+        depth -= 1
+
+    scheduler.request()
+    scheduler.drain(advance)
+    assert seen == [None] + phases[1:5]
+    assert deepest == 1
+    assert not scheduler.pending and not scheduler.draining
+
+
+def test_a_failed_transition_does_not_wedge_the_scheduler():
+    scheduler = PhaseScheduler()
+
+    def fail(target):
+        raise RuntimeError("transition failed")
+
+    scheduler.request()
+    with pytest.raises(RuntimeError):
+        scheduler.drain(fail)
+
+    seen = []
+    scheduler.request(GamePhase.TURN_END)
+    scheduler.drain(seen.append)
+    assert seen == [GamePhase.TURN_END]
+
+
+def test_combat_moves_on_without_nesting(game, advance):
+    advance(game, GamePhase.ZOMBIE_TRICK_PHASE)
+    depths = []
+    on_transition = game.scheduler.on_transition
+
+    def record(left, entered):
+        depths.append((entered, len(inspect.stack(0))))
+        on_transition(left, entered)
+
+    game.scheduler.on_transition = record
+    game.next_phase()
+
+    assert [phase for phase, _ in depths] == [
+        GamePhase.COMBAT_PHASE,
+        GamePhase.TURN_END,
+    ]
+    assert game.phase == GamePhase.TURN_END
+    assert len({depth for _, depth in depths}) == 1
+
+
+def test_timings_count_every_phase_entered(played_game):
+    game = played_game(3, max_turns=6)
+    timings = game.phase_timings()
+
+    assert timings[GamePhase.TURN_START][0] == game.turn_count
+    assert all(seconds >= 0.0 for _, seconds in timings.values())
+    assert timings[GamePhase.COMBAT_PHASE][0] <= timings[GamePhase.ZOMBIE_PHASE][0]
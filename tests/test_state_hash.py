@@ -0,0 +1,38 @@
+import pytest
+
+from app.core.base import Faction
+from app.core.engine.headless import HeadlessRunner, RandomBot, new_game
+from app.core.item.item_manager import HAND_RANGES
+
+
+def test_new_game_hash_matches_a_scratch_hash(game, scratch_hash):
+    assert game.item_manager.zobrist.value == scratch_hash(game.item_manager)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_played_game_hash_matches_a_scratch_hash(played_game, scratch_hash, seed):
+    game = played_game(seed)
+    assert game.item_manager.zobrist.value == scratch_hash(game.item_manager)
+
+
+def test_forks_keep_their_own_hash(decks, scratch_hash):
+    game = new_game(11, decks)
+    fork = game.fork()
+    HeadlessRunner(RandomBot(), RandomBot()).play(fork)
+
+    assert fork.state_hash != game.state_hash
+    for each in (game, fork):
+        assert each.item_manager.zobrist.value == scratch_hash(each.item_manager)
+
+
+def test_reindex_follows_changes_made_in_place(game, scratch_hash):
+    item_manager = game.item_manager
+    card = item_manager[HAND_RANGES[Faction.ZOMBIE]].first()
+    card.cost += 1
+    item_manager.reindex(card)
+    assert item_manager.zobrist.value == scratch_hash(item_manager)
+
+
+def test_equal_states_hash_equally(decks):
+    assert new_game(5, decks).state_hash == new_game(5, decks).state_hash
+    assert new_game(5, decks).state_hash != new_game(6, decks).state_hash
@@ -0,0 +1,89 @@
+import pytest
+
+from app.core.base import Faction
+from app.core.engine.headless import PassBot
+from app.service.tournament import (
+    ELO_K,
+    ELO_START,
+    ChunkSummary,
+    TournamentReport,
+    load_bot,
+    make_chunks,
+    run_tournament,
+)
+
+
+def report_of(*summaries):
+    report = TournamentReport()
+    for summary in summaries:
+        report.merge(summary)
+    return report
+
+
+def test_elo_moves_by_half_k_between_equals():
+    report = report_of(ChunkSummary("a", "b", 1, winners=[Faction.ZOMBIE]))
+    assert report.elo == {"a": ELO_START + ELO_K / 2, "b": ELO_START - ELO_K / 2}
+
+
+def test_elo_is_zero_sum_and_favours_the_winner():
+    winners = [Faction.ZOMBIE] * 7 + [Faction.PLANT] * 2 + [None]
+    report = report_of(ChunkSummary("a", "b", len(winners), winners=winners))
+    assert report.elo["a"] > ELO_START > report.elo["b"]
+    assert report.elo["a"] + report.elo["b"] == pytest.approx(2 * ELO_START)
+
+
+def test_draws_between_equals_and_mirror_matches_keep_ratings():
+    report = report_of(
+        ChunkSummary("a", "b", 2, winners=[None, None]),
+        ChunkSummary("c", "c", 1, winners=[Faction.PLANT]),
+    )
+    assert report.elo == {"a": ELO_START, "b": ELO_START, "c": ELO_START}
+
+
+def test_report_tallies_matchups_and_cards():
+    summary = ChunkSummary(
+        "a", "b", 3, turns=12, winners=[Faction.ZOMBIE, Faction.PLANT, None]
+    )
+    summary.card_plays.update({"Peashooter": 3})
+    summary.card_games.update({"Peashooter": 2})
+    summary.card_wins.update({"Peashooter": 1})
+    report = report_of(summary)
+
+    assert report.matchups == {("a", "b"): [1, 1, 1]}
+    lines = report.format().splitlines()
+    assert lines[0].startswith("3 games in")
+    assert lines[0].endswith("4.0 turns on average")
+    assert "  a vs b: 33.3% / 33.3% / 33.3%" in lines
+    assert "  Peashooter: 3, 2, 50.0%" in lines
+    assert sorted(lines[-2:]) == ["  a: 1500", "  b: 1500"]
+
+
+def test_chunks_cover_every_seed_of_every_matchup():
+    chunks = list(make_chunks(["a", "b"], 5, 2, first_seed=10))
+    assert chunks == [
+        ("a", "b", 10, 2),
+        ("a", "b", 12, 2),
+        ("a", "b", 14, 1),
+        ("b", "a", 10, 2),
+        ("b", "a", 12, 2),
+        ("b", "a", 14, 1),
+    ]
+    assert list(make_chunks(["a"], 1, 5)) == [("a", "a", 0, 1)]
+
+
+def test_bots_load_by_name_or_path():
+    assert isinstance(load_bot("pass"), PassBot)
+    assert isinstance(load_bot("app.core.engine.headless:PassBot"), PassBot)
+    with pytest.raises(ValueError):
+        load_bot("nobody")
+
+
+def test_report_does_not_depend_on_the_worker_count():
+    reports = [
+        run_tournament(["random", "pass"], 6, workers=workers, chunk_size=2)
+        for workers in (1, 3)
+    ]
+    first, second = (report.format().splitlines()[1:] for report in reports)
+    assert first == second
+    assert reports[0].games == 12
+    assert reports[0].matchups[("random", "pass")][0] > 0
@@ -0,0 +1,71 @@
+from random import Random
+
+import pytest
+
+from app.core.engine.headless import ACTIVE_FACTION, new_game
+from app.core.item.item_manager import DECK_RANGES, POS_RANGES, ZONES
+
+
+def snapshot(game):
+    item_manager = game.item_manager
+    return dict(
+        state_hash=game.state_hash,
+        zones={zone: [item.id for item in item_manager[zone]] for zone in ZONES},
+        decks={faction: list(item_manager.deck(faction)) for faction in DECK_RANGES},
+        occupiers=[pos.occupier_id for pos in item_manager[tuple(POS_RANGES.values())]],
+        game=(game.phase, game.turn_count, game.is_running, game.winner),
+        energy=(game.zombie_player.energy, game.plant_player.energy),
+        next_id=game.ids.next_id,
+        queued=len(game.event_manager.event_queue),
+    )
+
+
+def random_move(game, rng: Random):
+    faction = ACTIVE_FACTION.get(game.phase)
+    moves = game.legal_moves.moves(faction) if faction is not None else []
+    if moves and rng.random() < 0.6:
+        card, pos = rng.choice(moves)
+        return card.id, pos.id
+    return None
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_undoing_random_moves_restores_the_game(decks, scratch_hash, seed):
+    rng = Random(seed)
+    game = new_game(seed, decks)
+    game.event_manager.notify(game)
+
+    for _ in range(25):
+        if not game.is_running:
+            break
+        before = snapshot(game)
+        made = 0
+        for _ in range(rng.randint(1, 12)):
+            assert game.apply_move(random_move(game, rng))
+            made += 1
+            assert game.item_manager.zobrist.value == scratch_hash(game.item_manager)
+            if not game.is_running:
+                break
+        for _ in range(made):
+            game.undo_move()
+
+        assert snapshot(game) == before
+        assert game.item_manager.zobrist.value == scratch_hash(game.item_manager)
+        assert len(game.undo) == 0
+
+        # Move on for real before the next sequence
+        game.next_phase()
+        game.event_manager.notify(game)
+
+
+def test_illegal_move_records_nothing(game):
+    game.event_manager.notify(game)
+    before = snapshot(game)
+    assert not game.apply_move((10**6, 1))
+    assert len(game.undo) == 0
+    assert snapshot(game) == before
+
+
+def test_undo_without_a_move_raises(game):
+    with pytest.raises(IndexError):
+        game.undo_move()
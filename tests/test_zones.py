@@ -0,0 +1,96 @@
+import pytest
+
+from app.core.base import Faction, Lifetime
+from app.core.event.events import ZoneChangedEvent
+from app.core.event.listener import Listener
+from app.core.item.item_manager import GRAVEYARD_RANGES, HAND_RANGES
+
+
+class Watcher(Listener):
+    def __init__(self, seen: list, source=None, lifetime=Lifetime.PERMANENT):
+        super().__init__(source=source, on_events=[ZoneChangedEvent], lifetime=lifetime)
+        self.seen = seen
+
+    def respond(self, event, game):
+        self.seen.append((event.source_id, event.from_range, event.to_range))
+        return []
+
+
+@pytest.fixture
+def game(game):
+    game.event_manager.notify(game)
+    return game
+
+
+@pytest.fixture
+def seen(game):
+    seen = []
+    game.event_manager.register(Watcher(seen))
+    return seen
+
+
+def top_card(game):
+    return game.item_manager.get_by_id(
+        next(iter(game.item_manager.deck(Faction.ZOMBIE)))
+    )
+
+
+def listeners_of(game, item):
+    return game.event_manager.listener_pool.query_by_source(item.id)
+
+
+def test_listeners_die_with_the_zone_they_are_bound_to(game):
+    card = top_card(game)
+    bound = {
+        lifetime: Watcher([], card, lifetime)
+        for lifetime in (Lifetime.IN_DECK, Lifetime.IN_HAND, Lifetime.PERMANENT)
+    }
+    for listener in bound.values():
+        game.event_manager.register(listener)
+
+    game.item_manager.move(card.id, HAND_RANGES[Faction.ZOMBIE])
+    assert set(listeners_of(game, card)) == {
+        bound[Lifetime.IN_HAND],
+        bound[Lifetime.PERMANENT],
+    }
+    assert bound[Lifetime.IN_HAND].validate(game)
+
+    game.item_manager.move(card.id, GRAVEYARD_RANGES[Faction.ZOMBIE])
+    assert listeners_of(game, card) == [bound[Lifetime.PERMANENT]]
+
+
+def test_zone_change_reports_the_latest_move_only(game, seen):
+    card = top_card(game)
+    game.item_manager.move(card.id, HAND_RANGES[Faction.ZOMBIE])
+    game.item_manager.move(card.id, GRAVEYARD_RANGES[Faction.ZOMBIE])
+    game.event_manager.notify(game)
+
+    assert seen == [(card.id, "z_hand", "z_graveyard")]
+
+
+def test_zone_change_of_a_removed_item_is_dropped(game, seen):
+    card = top_card(game)
+    game.item_manager.move(card.id, HAND_RANGES[Faction.ZOMBIE])
+    game.item_manager.remove_item(card.id)
+    game.event_manager.notify(game)
+
+    assert seen == []
+
+
+def test_destroyed_fighter_goes_to_the_graveyard(game, zombie_in_play):
+    fighter = zombie_in_play
+    pos = fighter.on_pos
+    game.event_manager.notify(game)
+    seen = []
+    game.event_manager.register(Watcher(seen))
+    game.event_manager.register(Watcher([], fighter, Lifetime.IN_FIELD))
+
+    game.item_manager.destroy_fighter(fighter)
+    game.event_manager.notify(game)
+
+    assert seen == [(fighter.id, "targets", "z_graveyard")]
+    assert game.item_manager.zone_of(fighter.id) == "z_graveyard"
+    assert game.item_manager.get_by_id(fighter.id) is fighter
+    assert fighter not in game.item_manager.fighters
+    assert not pos.occupied
+    assert listeners_of(game, fighter) == []